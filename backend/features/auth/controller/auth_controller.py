@@ -11,6 +11,7 @@ import jwt
 import time
 from datetime import datetime, timedelta
 from passlib.context import CryptContext
+from backend.shared.integration.lark_transport import lark_transport
 
 router = APIRouter(prefix="/api", tags=["Auth"])
 logger = logging.getLogger(__name__)
@@ -71,22 +72,9 @@ def get_password_hash(password):
     return pwd_context.hash(password)
 
 def get_tenant_access_token():
-    url = f"{LARK_DOMAIN}/open-apis/auth/v3/tenant_access_token/internal"
-    headers = {"Content-Type": "application/json; charset=utf-8"}
-    req_body = {
-        "app_id": LARK_APP_ID,
-        "app_secret": LARK_APP_SECRET
-    }
+    # Cached by the shared Lark transport, refreshed shortly before it expires
     try:
-        resp = requests.post(url, json=req_body, headers=headers)
-        if resp.status_code != 200:
-             logger.error(f"Failed to get Tenant Token: {resp.text}")
-             return None
-        return resp.json().get("tenant_access_token")
-    except Exception as e:
-        logger.error(f"Exception getting Tenant Token: {e}")
-        return None
-
+        return lark_transport.get_tenant_access_token()
     except Exception as e:
         logger.error(f"Exception getting Tenant Token: {e}")
         return None
@@ -47,7 +47,8 @@ PERMISSIONS_CONFIG = {
     "TICKET_SEARCH": {
         "name": "Ticket Search",
         "apis": [
-            ("GET", "/api/project/ticket/{ticket_number}")
+            ("GET", "/api/project/ticket/{ticket_number}"),
+            ("GET", "/api/project/search")
         ]
     }
 }
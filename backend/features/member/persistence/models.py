@@ -6,10 +6,11 @@ class LarkModelMember(Base):
     
     record_id = Column(String, primary_key=True)
     updated_at = Column(BigInteger)
+    fields_hash = Column(String) # Hash of raw Lark fields (change detection)
     
     member_no = Column(String)
-    name = Column(String)
-    department = Column(String)
+    name = Column(String, index=True)
+    department = Column(String, index=True)
     position = Column(String)
     team = Column(String)
     remark = Column(String)
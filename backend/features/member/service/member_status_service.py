@@ -0,0 +1,147 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import or_, and_
+from backend.features.member.persistence.models import LarkModelMember
+from backend.features.project.persistence.models import LarkModelTCG, LarkModelTP, TicketPerson
+from datetime import datetime, timedelta
+import logging
+
+logger = logging.getLogger(__name__)
+
+class MemberStatusService:
+    """
+    Member Status dashboard for one department, computed with a fixed set of queries
+    (members, tickets, TPs) regardless of the number of members.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _time_windows(self, now: datetime = None):
+        """(yesterday 00:00, now - 7 days) as ms timestamps."""
+        now = now or datetime.now()
+        # 00:00 Yesterday: replace hour/min/sec/microsec to 0 -> minus 1 day
+        today_midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        yesterday_ts = int((today_midnight - timedelta(days=1)).timestamp() * 1000)
+        seven_days_ago_ts = int((now - timedelta(days=7)).timestamp() * 1000)
+        return yesterday_ts, seven_days_ago_ts
+
+    def _fetch_tickets(self, member_names, yesterday_ts: int, seven_days_ago_ts: int):
+        """
+        One query for every ticket the department needs, through the ticket_people index:
+        - Assignee == member AND Status == 'In Progress'
+        - Resolved By == member AND Updated At > Yesterday 00:00
+        - Resolved By == member AND Resolved > now - 7 days (Completed column)
+        """
+        return self.db.query(
+            TicketPerson.person, TicketPerson.role,
+            LarkModelTCG.record_id, LarkModelTCG.tcg_tickets, LarkModelTCG.title,
+            LarkModelTCG.jira_status, LarkModelTCG.tp_number,
+            LarkModelTCG.updated_at, LarkModelTCG.resolved
+        ).join(
+            LarkModelTCG, LarkModelTCG.record_id == TicketPerson.ticket_record_id
+        ).filter(
+            TicketPerson.person.in_(member_names),
+            or_(
+                and_(
+                    TicketPerson.role == 'assignee',
+                    LarkModelTCG.jira_status == 'In Progress'
+                ),
+                and_(
+                    TicketPerson.role == 'resolved_by',
+                    or_(
+                        LarkModelTCG.updated_at > yesterday_ts,
+                        LarkModelTCG.resolved > seven_days_ago_ts
+                    )
+                )
+            )
+        ).all()
+
+    def get_department_status(self, department: str, now: datetime = None):
+        """
+        Status rows for all members of a department (see docs/features/member_status.md).
+        Tickets and TPs are loaded once for the whole department and fanned out in memory;
+        names match exactly (case-insensitive, like the NOCASE person column).
+        """
+        # 1. Members
+        members = self.db.query(LarkModelMember).filter(LarkModelMember.department == department).all()
+        member_names = sorted({m.name for m in members if m.name})
+        if not member_names:
+            return []
+
+        yesterday_ts, seven_days_ago_ts = self._time_windows(now)
+
+        # 2. Tickets (one query), split per member and per column
+        working_by_member = {}    # name -> {record_id: ticket} (In-Progress TP / In Progress Tickets)
+        completed_by_member = {}  # name -> {record_id: ticket} (Completed Last 7 Days)
+        for t in self._fetch_tickets(member_names, yesterday_ts, seven_days_ago_ts):
+            key = t.person.lower()
+            is_working = (
+                (t.role == 'assignee' and t.jira_status == 'In Progress')
+                or (t.role == 'resolved_by' and t.updated_at is not None and t.updated_at > yesterday_ts)
+            )
+            if is_working:
+                # A ticket can match both roles
+                working_by_member.setdefault(key, {}).setdefault(t.record_id, t)
+            if t.role == 'resolved_by' and t.resolved is not None and t.resolved > seven_days_ago_ts:
+                completed_by_member.setdefault(key, {}).setdefault(t.record_id, t)
+
+        # 3. TPs referenced by any member (one query)
+        tp_nums = sorted({
+            t.tp_number for tickets in working_by_member.values() for t in tickets.values() if t.tp_number
+        })
+        tp_by_number = {}
+        if tp_nums:
+            tps = self.db.query(
+                LarkModelTP.ticket_number, LarkModelTP.title, LarkModelTP.department
+            ).filter(LarkModelTP.ticket_number.in_(tp_nums)).all()
+            for tp in tps:
+                tp_by_number.setdefault(tp.ticket_number, []).append(tp)
+
+        # 4. Fan out
+        results = []
+        for m in members:
+            if not m.name:
+                continue
+            key = m.name.lower()
+            working = working_by_member.get(key, {}).values()
+
+            in_progress_tickets = [
+                # "In Progress Tickets" column: Only show In Progress status
+                {"number": t.tcg_tickets, "full": f"{t.tcg_tickets} {t.title}"}
+                for t in working if t.jira_status == 'In Progress'
+            ]
+
+            current_tps_map = {}  # tp_number -> {tp_info}
+            for t in working:
+                if t.tp_number and t.tp_number not in current_tps_map:
+                    current_tps_map[t.tp_number] = {"tp_number": t.tp_number}
+
+            member_tps = [tp for tp_num in current_tps_map for tp in tp_by_number.get(tp_num, [])]
+            for tp in member_tps:
+                current_tps_map[tp.ticket_number]["department"] = tp.department
+                current_tps_map[tp.ticket_number]["title"] = tp.title
+
+            current_tps = [
+                {
+                    "number": tp_data['tp_number'],
+                    "full": f"{tp_data['tp_number']} {tp_data.get('title', '')}",
+                    "department": tp_data.get('department', '')
+                }
+                for tp_data in current_tps_map.values()
+            ]
+
+            completed = sorted(completed_by_member.get(key, {}).values(), key=lambda t: t.resolved, reverse=True)
+
+            results.append({
+                "department": m.department,
+                "team": m.team,
+                "member_name": m.name,
+                "member_no": m.member_no,
+                "position": m.position,
+                "current_tps": current_tps,
+                "in_progress_tickets": in_progress_tickets,
+                "completed_last_7d": [{"number": t.tcg_tickets} for t in completed],
+                "project_dept": ", ".join(set(tp.department for tp in member_tps if tp.department))
+            })
+
+        return results
@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from backend.shared.database import SessionLocal, get_db
-from backend.features.project.persistence.models import LarkModelTP, LarkModelTCG, LarkModelProgram, TicketAnomaly
+from backend.shared.database import SessionLocal, ReadSessionLocal, get_read_db, db_write_lock
+from backend.features.project.persistence.models import LarkModelTP, LarkModelTCG, LarkModelProgram, TicketAnomaly, TCGTicketLink, ticket_key
 from backend.features.system.persistence.models import LarkModelDept
 from backend.features.member.persistence.models import LarkModelMember
 from backend.features.auth.persistence.models import AdminUser
-from backend.shared.dependencies import get_current_user
+from backend.shared.dependencies import get_current_user, check_permission
+from backend.shared.response_cache import cached_endpoint, depends_on_tables, bump_generation
+from backend.shared.controller.etag_route import ETagRoute
 from typing import List, Optional
 from pydantic import BaseModel
 
@@ -15,15 +17,18 @@ class ReorderRequest(BaseModel):
 
 router = APIRouter(
     prefix="/api/project",
-    tags=["Project"]
+    tags=["Project"],
+    route_class=ETagRoute
 )
 
 from backend.features.project.service.project_service import ProjectService
+from backend.features.project.service.ticket_search_service import TicketSearchService
 
 @router.get("/dashboard-stats")
+@cached_endpoint(tables=[LarkModelTP.__tablename__], ttl=3600)
 def get_dashboard_stats(
     department: Optional[str] = None,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Get statistics for Dashboard.
@@ -33,10 +38,11 @@ def get_dashboard_stats(
     return service.get_dashboard_stats(department)
 
 @router.get("/closed-tps")
+@cached_endpoint(tables=[LarkModelTP.__tablename__])
 def get_closed_tps(
     quarter: str,
     department: Optional[str] = None,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Get list of Closed TPs for a specific quarter.
@@ -46,9 +52,10 @@ def get_closed_tps(
     return service.get_closed_tps(quarter, department)
 
 @router.get("/active")
+@cached_endpoint(tables=[LarkModelTP.__tablename__])
 def get_active_tps():
     """Fetch all active TP projects (Status != Closed/Resolved)."""
-    db = SessionLocal()
+    db = ReadSessionLocal()
     try:
         # User requirement: "jira status != Closed 或 Resolved"
         # We also filter out empty statuses just in case
@@ -81,9 +88,10 @@ def get_active_tps():
         db.close()
 
 @router.get("/programs")
+@cached_endpoint(tables=[LarkModelProgram.__tablename__])
 def get_programs():
     """Fetch all unique program titles."""
-    db = SessionLocal()
+    db = ReadSessionLocal()
     try:
         # Fetch distinct program titles
         programs = db.query(LarkModelProgram.program_title).distinct().filter(LarkModelProgram.program_title != None).all()
@@ -93,6 +101,7 @@ def get_programs():
         db.close()
 
 @router.get("/planning")
+@cached_endpoint(tables=[LarkModelTP.__tablename__, LarkModelProgram.__tablename__], ttl=3600)
 def get_planning_projects(
     program: Optional[str] = None,
     department: Optional[str] = None,
@@ -108,7 +117,7 @@ def get_planning_projects(
       - Closed projects: Hide if older than 4 months.
       - Blocked projects: Exclude projects with jira_status == 'Blocked'.
     """
-    db = SessionLocal()
+    db = ReadSessionLocal()
     try:
         query = db.query(LarkModelTP).filter(LarkModelTP.jira_status != "Blocked")
 
@@ -195,12 +204,14 @@ def reorder_projects(request: ReorderRequest):
     """Reorder projects within a status column."""
     db = SessionLocal()
     try:
-        # Iterate through the list of IDs and update their sort_order
-        for index, project_id in enumerate(request.project_ids):
-            tp = db.query(LarkModelTP).filter(LarkModelTP.record_id == project_id).first()
-            if tp:
-                tp.sort_order = index
-        db.commit()
+        with db_write_lock:
+            # Iterate through the list of IDs and update their sort_order
+            for index, project_id in enumerate(request.project_ids):
+                tp = db.query(LarkModelTP).filter(LarkModelTP.record_id == project_id).first()
+                if tp:
+                    tp.sort_order = index
+            bump_generation(db, LarkModelTP.__tablename__)
+            db.commit()
         return {"status": "success"}
     except Exception as e:
         db.rollback()
@@ -217,12 +228,14 @@ def reorder_tcg_tickets(request: ReorderTCGRequest):
     """Reorder TCG tickets within a status column."""
     db = SessionLocal()
     try:
-        # Iterate through the list of IDs and update their sort_order
-        for index, ticket_id in enumerate(request.ticket_ids):
-            ticket = db.query(LarkModelTCG).filter(LarkModelTCG.record_id == ticket_id).first()
-            if ticket:
-                ticket.sort_order = index
-        db.commit()
+        with db_write_lock:
+            # Iterate through the list of IDs and update their sort_order
+            for index, ticket_id in enumerate(request.ticket_ids):
+                ticket = db.query(LarkModelTCG).filter(LarkModelTCG.record_id == ticket_id).first()
+                if ticket:
+                    ticket.sort_order = index
+            bump_generation(db, LarkModelTCG.__tablename__)
+            db.commit()
         return {"status": "success"}
     except Exception as e:
         db.rollback()
@@ -231,15 +244,15 @@ def reorder_tcg_tickets(request: ReorderTCGRequest):
         db.close()
 
 @router.get("/{tp_number}/tcg_tickets")
+@depends_on_tables([LarkModelTCG.__tablename__])
 def get_tcg_tickets_by_tp(tp_number: str):
     """Fetch TCG tickets associated with a specific TP number."""
-    db = SessionLocal()
+    db = ReadSessionLocal()
     try:
         # Note: tp_number should be exact string match e.g. "TP-3492"
-        # Since input might vary case (tp-3492 vs TP-3492), we might want case-insensitive search
-        # SQLite is case-insensitive by default for ASCII usually, but let's be safe.
+        # Input might vary case (tp-3492 vs TP-3492): equality on the upper-case NOCASE key (indexed)
         tickets = db.query(LarkModelTCG).filter(
-            LarkModelTCG.tp_number.ilike(f"{tp_number}")
+            LarkModelTCG.tp_number_key == ticket_key(tp_number)
         ).order_by(LarkModelTCG.sort_order.asc()).all()
         
         results = []
@@ -262,18 +275,35 @@ def get_tcg_tickets_by_tp(tp_number: str):
     finally:
         db.close()
 
+@router.get("/search", dependencies=[Depends(check_permission)])
+@depends_on_tables([LarkModelTCG.__tablename__, LarkModelTP.__tablename__])
+def search_tickets(
+    q: str = "",
+    page: int = 1,
+    page_size: int = 20,
+    db: Session = Depends(get_read_db)
+):
+    """
+    Full-text ticket search (TCG + TP) over the ticket_search FTS5 index.
+    Ranked by relevance, paginated; title / snippet carry <mark> highlights (HTML-escaped).
+    """
+    service = TicketSearchService(db)
+    return service.search(q, page, page_size)
+
 @router.get("/ticket/{ticket_number}")
 def get_ticket_details(ticket_number: str):
     """Fetch detailed information for a specific ticket (TCG or TP)."""
-    db = SessionLocal()
+    db = ReadSessionLocal()
     try:
-        # Search in TCG first (has description)
-        tcg = db.query(LarkModelTCG).filter(LarkModelTCG.tcg_tickets == ticket_number).first()
+        # Search in TCG first (has description); case-insensitive via the indexed key column
+        tcg = db.query(LarkModelTCG).filter(LarkModelTCG.tcg_ticket_key == ticket_key(ticket_number)).first()
         if tcg:
-            # Compute sub-tasks: Find tickets where parent_tickets contains this ticket number
-            # Using ilike for robust partial match (e.g. "TCG-123", "TCG-123, TCG-456")
-            sub_tasks_query = db.query(LarkModelTCG).filter(
-                LarkModelTCG.parent_tickets.ilike(f"%{ticket_number}%")
+            # Compute sub-tasks: tickets linked to this ticket via tcg_ticket_links
+            # (normalized from parent_tickets, e.g. "TCG-123, tcg-456", upper-cased like tcg_ticket_key; exact key match)
+            sub_tasks_query = db.query(LarkModelTCG).join(
+                TCGTicketLink, TCGTicketLink.child_record_id == LarkModelTCG.record_id
+            ).filter(
+                TCGTicketLink.parent_ticket == tcg.tcg_ticket_key
             ).all()
             
             sub_tasks_details = []
@@ -292,7 +322,7 @@ def get_ticket_details(ticket_number: str):
             # 2024-01-06 Enhancement: Fetch TP Info
             tp_info = None
             if tcg.tp_number:
-                 tp_model = db.query(LarkModelTP).filter(LarkModelTP.ticket_number == tcg.tp_number).first()
+                 tp_model = db.query(LarkModelTP).filter(LarkModelTP.ticket_number_key == ticket_key(tcg.tp_number)).first()
                  if tp_model:
                      tp_info = {
                          "ticket_number": tp_model.ticket_number,
@@ -316,7 +346,7 @@ def get_ticket_details(ticket_number: str):
             }
 
         # Search in TP
-        tp = db.query(LarkModelTP).filter(LarkModelTP.ticket_number == ticket_number).first()
+        tp = db.query(LarkModelTP).filter(LarkModelTP.ticket_number_key == ticket_key(ticket_number)).first()
         if tp:
             return {
                 "ticket_number": tp.ticket_number,
@@ -337,9 +367,10 @@ def get_ticket_details(ticket_number: str):
         db.close()
 
 @router.get("/departments")
+@cached_endpoint(tables=[LarkModelDept.__tablename__])
 def get_departments():
     """Fetch all unique departments."""
-    db = SessionLocal()
+    db = ReadSessionLocal()
     try:
         # Fetch distinct departments from LarkModelDept
         depts = db.query(LarkModelDept.department).distinct().filter(LarkModelDept.department != None).all()
@@ -352,7 +383,7 @@ def get_departments():
 @router.get("/anomalies/my-pending")
 def get_my_pending_anomalies(
     current_user: AdminUser = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Check if the current user (Manager/PM) has pending anomalies in their department.
@@ -409,13 +440,14 @@ def get_my_pending_anomalies(
     return {"show_modal": True, "anomalies": anomalies}
 
 @router.get("/anomalies")
+@cached_endpoint(tables=[TicketAnomaly.__tablename__])
 def get_ticket_anomalies(department: Optional[str] = None):
     """
     Get all detected ticket anomalies.
     Optional Filter: department
     Default: Excludes 'WRD' department if no filter provided.
     """
-    db = SessionLocal()
+    db = ReadSessionLocal()
     try:
         query = db.query(TicketAnomaly)
         
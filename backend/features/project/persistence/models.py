@@ -1,11 +1,25 @@
-from sqlalchemy import Column, Integer, String, BigInteger, Text, JSON, Boolean, Enum
+from sqlalchemy import Column, Integer, String, BigInteger, Text, JSON, Boolean, Enum, Index, event
+from sqlalchemy.exc import OperationalError
 from backend.shared.database import Base
 
+def ticket_key(value):
+    """
+    Canonical form of a ticket / Jira issue key (" tp-12 " -> "TP-12", "" -> None), the only
+    key normalizer: stored in the *_key columns, used for lookups, links and Jira verification.
+    """
+    if value is None:
+        return None
+    return str(value).strip().upper() or None
+
 class LarkModelTP(Base):
     __tablename__ = "tp_projects"
+    __table_args__ = (
+        Index("ix_tp_projects_jira_status_sort_order", "jira_status", "sort_order"),
+    )
     
     record_id = Column(String, primary_key=True, index=True)
     updated_at = Column(BigInteger) # Internal sync tracking
+    fields_hash = Column(String) # Hash of raw Lark fields (change detection)
     
     # Specific Fields
     components = Column(Text) # List -> Comma separated string
@@ -28,22 +42,42 @@ class LarkModelTP(Base):
     released_month = Column(String) # JSON -> text
     # New Fields
     released_date = Column(String) # Lark Date (ms) or formatted
+    released_at = Column(BigInteger, index=True) # released_date parsed at sync time (epoch ms)
+    released_quarter = Column(String, index=True) # Quarter of released_date e.g. "2024 Q3"
     description = Column(Text)
     due_day = Column(String)
     start_date = Column(String)
     sit_date = Column(String)
     
     source_id = Column(Text)
-    ticket_number = Column(Text)
+    ticket_number = Column(Text, index=True)
     title = Column(Text) # List of text -> String
 
+    # Case-insensitive lookup key (filled by sync from ticket_number)
+    ticket_number_key = Column(String(collation="NOCASE"), index=True)
+
+    # Source column -> lookup key column (see ticket_key)
+    key_columns = {"ticket_number": "ticket_number_key"}
+    # Filled by sync from released_date (see release_columns)
+    derived_columns = ("released_at", "released_quarter")
+    # Maintained locally, never written from Lark fields
+    local_columns = (
+        "completed_percentage", "fe_completed_percentage", "be_completed_percentage",
+        "fe_status_all_open", "sort_order"
+    )
+
 
 class LarkModelTCG(Base):
     __tablename__ = "tcg_tickets"
+    __table_args__ = (
+        Index("ix_tcg_tickets_tp_number_jira_status", "tp_number", "jira_status"),
+        Index("ix_tcg_tickets_jira_status_sort_order", "jira_status", "sort_order"),
+    )
 
     record_id = Column(String, primary_key=True, index=True)
     sort_order = Column(Integer, default=0) # Kanban sort order
     updated_at = Column(BigInteger)
+    fields_hash = Column(String) # Hash of raw Lark fields (change detection)
 
     # Fields matched from Lark Inspection
     assignee = Column(Text)
@@ -66,11 +100,20 @@ class LarkModelTCG(Base):
     resolved_week_num = Column(Integer)
     source_id = Column(Text)
     start_date = Column(String)
-    tcg_tickets = Column(Text)
+    tcg_tickets = Column(Text, index=True)
     tp_number = Column(Text)
     title = Column(Text)
     parent_tickets = Column(Text)  # Parent tickets reference from Lark "Parent Tickets" field
 
+    # Case-insensitive lookup keys (filled by sync from tp_number / tcg_tickets)
+    tp_number_key = Column(String(collation="NOCASE"), index=True)
+    tcg_ticket_key = Column(String(collation="NOCASE"), index=True)
+
+    # Source column -> lookup key column (see ticket_key)
+    key_columns = {"tp_number": "tp_number_key", "tcg_tickets": "tcg_ticket_key"}
+    # Maintained locally, never written from Lark fields
+    local_columns = ("sort_order",)
+
 class TicketAnomaly(Base):
     __tablename__ = "ticket_anomalies"
 
@@ -86,7 +129,7 @@ class TicketAnomaly(Base):
 
     # New Fields (2024-01-06)
     components = Column(Text)
-    department = Column(Text)
+    department = Column(Text, index=True)
 
     # Legacy / Unused fields (Kept temporarily or if needed for other logic)
     status = Column(String) 
@@ -110,15 +153,80 @@ class TCGRemovedTickets(Base):
     deleted_at = Column(BigInteger)  # Timestamp of deletion
 
 
+class TCGTicketLink(Base):
+    """Parent -> child ticket links, normalized from tcg_tickets.parent_tickets (maintained by sync)."""
+    __tablename__ = "tcg_ticket_links"
+
+    parent_ticket = Column(String, primary_key=True)  # Parent ticket key e.g. TCG-123
+    child_record_id = Column(String, primary_key=True, index=True)  # tcg_tickets.record_id of the child
+
+
+class TicketPerson(Base):
+    """One row per person of a TCG Person field (assignee / resolved_by), maintained by sync."""
+    __tablename__ = "ticket_people"
+    __table_args__ = (
+        Index("ix_ticket_people_person_role", "person", "role"),
+    )
+
+    ticket_record_id = Column(String, primary_key=True)  # tcg_tickets.record_id
+    role = Column(String, primary_key=True)  # 'assignee' | 'resolved_by'
+    person = Column(String(collation="NOCASE"), primary_key=True)  # Single name, case-insensitive match
+
+
+class TicketSearchDoc(Base):
+    """
+    TCG / TP ticket -> its row in the ticket_search FTS5 index (rowid == doc_id), maintained by sync.
+    FTS5 only finds rows by rowid or MATCH, so re-indexing a ticket goes through this table.
+    """
+    __tablename__ = "ticket_search_docs"
+    __table_args__ = (
+        Index("ix_ticket_search_docs_kind_record_id", "kind", "record_id", unique=True),
+    )
+
+    doc_id = Column(Integer, primary_key=True)
+    kind = Column(String, nullable=False)  # 'TCG' | 'TP'
+    record_id = Column(String, nullable=False)  # tcg_tickets / tp_projects record_id
+
+
+# Full-text index over TCG / TP tickets: FTS5 virtual table (not an ORM model), created with the
+# other tables by Base.metadata.create_all (see the listeners below) and maintained by sync.
+TICKET_SEARCH_TABLE = "ticket_search"
+TICKET_SEARCH_COLUMNS = ("ticket_key", "title", "description", "assignee", "components")
+# trigram: case-insensitive substring matching (SQLite >= 3.34); unicode61: word / prefix matching
+TICKET_SEARCH_TOKENIZERS = ("trigram", "unicode61 remove_diacritics 2")
+
+def create_ticket_search_table(connection):
+    """Creates the ticket_search FTS5 table if missing, with the first tokenizer SQLite supports."""
+    for tokenizer in TICKET_SEARCH_TOKENIZERS:
+        try:
+            connection.exec_driver_sql(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {TICKET_SEARCH_TABLE} "
+                f"USING fts5({', '.join(TICKET_SEARCH_COLUMNS)}, tokenize='{tokenizer}')"
+            )
+            return
+        except OperationalError:
+            if tokenizer == TICKET_SEARCH_TOKENIZERS[-1]:
+                raise
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_ticket_search(target, connection, **kw):
+    create_ticket_search_table(connection)
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_ticket_search(target, connection, **kw):
+    connection.exec_driver_sql(f"DROP TABLE IF EXISTS {TICKET_SEARCH_TABLE}")
+
+
 class LarkModelProgram(Base):
     __tablename__ = "tp_program"
     
     record_id = Column(String, primary_key=True, index=True)
     updated_at = Column(BigInteger)
+    fields_hash = Column(String) # Hash of raw Lark fields (change detection)
     
     # Specific Fields
     no = Column(String)
-    program_title = Column(Text)
+    program_title = Column(Text, index=True)
     tp = Column(Text) # List -> Comma separated or Relation ID
     tp_title = Column(Text)
     department = Column(Text)
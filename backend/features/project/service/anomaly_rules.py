@@ -0,0 +1,168 @@
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+from sqlalchemy.orm import Session
+from ..persistence.models import LarkModelTCG, LarkModelTP, TCGTicketLink
+
+
+@dataclass(frozen=True)
+class AnomalyRule:
+    """
+    Declarative anomaly rule, evaluated on parent tickets that have at least one child.
+    - parent_issue_types / parent_statuses: which parents the rule applies to (empty issue types = any)
+    - child_statuses + child_match: "any" -> at least one child in child_statuses,
+      "all" -> every child in child_statuses
+    - reason: anomaly_reason text; "{children}" is replaced by the matching children ("TCG-1(Closed), ...")
+    """
+    name: str
+    parent_statuses: Tuple[str, ...]
+    child_statuses: Tuple[str, ...]
+    child_match: str = "any"
+    parent_issue_types: Tuple[str, ...] = ()
+    reason: str = ""
+
+    def __post_init__(self):
+        if self.child_match not in ("any", "all"):
+            raise ValueError(f"Rule {self.name}: child_match must be 'any' or 'all'")
+
+
+@dataclass
+class TicketSnapshot:
+    """Everything the rules need, loaded with two queries."""
+    parents: list  # Candidate parent rows of In Progress TPs
+    children_by_parent: Dict[str, List[Tuple[str, str]]] = field(default_factory=dict)  # parent tcg_ticket_key -> [(child key, status)]
+
+
+# Target Parent Issue Types
+TARGET_ISSUE_TYPES = ("Change Request", "Improvement")
+
+RULES: List[AnomalyRule] = [
+    # Rule 1: Parent Open but Child Active
+    AnomalyRule(
+        name="parent_open_child_active",
+        parent_issue_types=TARGET_ISSUE_TYPES,
+        parent_statuses=("Open",),
+        child_statuses=(
+            "In Progress", "Development", "Testing",
+            "In Review", "Review",
+            "Resolved",
+            "Done", "Closed"
+        ),
+        child_match="any",
+        reason="Parent is Open but has active child: {children}"
+    ),
+    # Rule 2: Parent In Progress but Child InActive
+    AnomalyRule(
+        name="parent_in_progress_children_inactive",
+        parent_issue_types=TARGET_ISSUE_TYPES,
+        parent_statuses=("In Progress",),
+        child_statuses=("Resolved", "Done", "Closed"),
+        child_match="all",
+        reason="Parent is In Progress but all children are InActive (Closed/Done)."
+    ),
+]
+
+
+def register_rule(rule: AnomalyRule):
+    """Adds a rule to the registry (evaluated after the existing ones, on the same snapshot)."""
+    if any(r.name == rule.name for r in RULES):
+        raise ValueError(f"Anomaly rule '{rule.name}' is already registered")
+    RULES.append(rule)
+
+
+def load_snapshot(db: Session, rules: List[AnomalyRule] = None) -> TicketSnapshot:
+    """
+    Loads the candidate parents (of In Progress TPs) for all rules at once, plus their children
+    through tcg_ticket_links. The parent filter is the union of the rules' inputs,
+    so adding a rule never adds a pass over the database.
+    """
+    rules = RULES if rules is None else rules
+    if not rules:
+        return TicketSnapshot(parents=[])
+
+    in_progress_tps = db.query(LarkModelTP.ticket_number).filter(
+        LarkModelTP.jira_status == "In Progress"
+    ).subquery()
+
+    parent_filter = [
+        LarkModelTCG.tp_number.in_(in_progress_tps.select()),
+        LarkModelTCG.jira_status.in_(sorted({s for r in rules for s in r.parent_statuses}))
+    ]
+    if all(r.parent_issue_types for r in rules):
+        parent_filter.append(LarkModelTCG.issue_type.in_(sorted({t for r in rules for t in r.parent_issue_types})))
+
+    parents = db.query(
+        LarkModelTCG.tcg_tickets, LarkModelTCG.tcg_ticket_key, LarkModelTCG.title, LarkModelTCG.tp_number,
+        LarkModelTCG.assignee, LarkModelTCG.jira_status, LarkModelTCG.issue_type,
+        LarkModelTCG.components, LarkModelTCG.department
+    ).filter(*parent_filter).all()
+    if not parents:
+        return TicketSnapshot(parents=[])
+
+    # Links store upper-cased parent keys (ticket_key), matched on the parent's tcg_ticket_key
+    parent_keys = db.query(LarkModelTCG.tcg_ticket_key).filter(*parent_filter).subquery()
+    child_rows = db.query(
+        TCGTicketLink.parent_ticket, LarkModelTCG.tcg_tickets, LarkModelTCG.jira_status
+    ).join(
+        LarkModelTCG, LarkModelTCG.record_id == TCGTicketLink.child_record_id
+    ).filter(
+        TCGTicketLink.parent_ticket.in_(parent_keys.select())
+    ).order_by(TCGTicketLink.parent_ticket, LarkModelTCG.tcg_tickets).all()
+
+    children_by_parent = defaultdict(list)
+    for row in child_rows:
+        children_by_parent[row.parent_ticket].append((row.tcg_tickets, (row.jira_status or "").strip()))
+
+    return TicketSnapshot(parents=parents, children_by_parent=dict(children_by_parent))
+
+
+def evaluate_rules(snapshot: TicketSnapshot, rules: List[AnomalyRule] = None):
+    """
+    Evaluates every rule over the snapshot.
+    Parents are bucketed once by (issue_type, status), so each rule only visits its own candidates.
+    A parent flagged by several rules keeps the first rule's reason (registry order).
+    Returns ({(tp_number, ticket_number): (rule, parent row, reason)}, {rule name: {"duration_ms", "candidates", "hits"}}).
+    """
+    rules = RULES if rules is None else rules
+
+    buckets = defaultdict(list)
+    for p in snapshot.parents:
+        if snapshot.children_by_parent.get(p.tcg_ticket_key):
+            buckets[(p.issue_type, (p.jira_status or "").strip())].append(p)
+
+    hits = {}
+    stats = {}
+    for rule in rules:
+        started = time.perf_counter()
+        allowed = set(rule.child_statuses)
+        candidates = [
+            p for (issue_type, status), bucket in buckets.items()
+            if status in rule.parent_statuses and (not rule.parent_issue_types or issue_type in rule.parent_issue_types)
+            for p in bucket
+        ]
+
+        rule_hits = 0
+        for p in candidates:
+            children = snapshot.children_by_parent[p.tcg_ticket_key]
+            if rule.child_match == "all":
+                matched = children if all(status in allowed for _, status in children) else []
+            else:
+                matched = [c for c in children if c[1] in allowed]
+            if not matched:
+                continue
+
+            rule_hits += 1
+            key = (p.tp_number, p.tcg_tickets)
+            if key not in hits:
+                reason = rule.reason.replace(
+                    "{children}", ", ".join(f"{child}({status})" for child, status in matched)
+                )
+                hits[key] = (rule, p, reason)
+
+        stats[rule.name] = {
+            "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+            "candidates": len(candidates),
+            "hits": rule_hits
+        }
+    return hits, stats
@@ -1,7 +1,11 @@
 import time
+import logging
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from ..persistence.models import LarkModelTCG, LarkModelTP, TicketAnomaly
+from ..persistence.models import LarkModelTP, TicketAnomaly
+from .anomaly_rules import load_snapshot, evaluate_rules
+from backend.shared.response_cache import bump_generation
+
+logger = logging.getLogger(__name__)
 
 class AnomalyService:
     def __init__(self, db: Session):
@@ -10,103 +14,105 @@ class AnomalyService:
     def refresh_anomalies(self):
         """
         Scans for anomalies in 'In Progress' TPs and updates the ticket_anomalies table.
-        Rule: Parent is Open, but Child is In Progress/Done.
+        Rules come from the anomaly_rules registry (Rule 1: Parent Open but Child active,
+        Rule 2: Parent In Progress but all Children inactive, ...).
+
+        Set-based: one query for the candidate parents of every In Progress TP,
+        one query for all their children (via tcg_ticket_links), shared by all rules.
+        The result is diffed against the stored anomalies (keyed by TP + ticket):
+        only new anomalies are inserted, resolved ones deleted, changed ones updated;
+        detected_at stays stable for anomalies that persist.
+        Returns {"inserted", "updated", "resolved", "unchanged", "rules"} (None if there is no In Progress TP);
+        "rules" holds each rule's evaluation time, candidates and hits.
         """
-        # 1. Get In Progress TPs
-        active_tps = self.db.query(LarkModelTP).filter(
+        # 1. In Progress TPs
+        active_tps = self.db.query(LarkModelTP.ticket_number, LarkModelTP.title).filter(
             LarkModelTP.jira_status == "In Progress"
         ).all()
-        
-        tp_numbers = [tp.ticket_number for tp in active_tps]
+
+        tp_titles = {}
+        for tp in active_tps:
+            tp_titles.setdefault(tp.ticket_number, tp.title)
+        tp_numbers = list(tp_titles)
         if not tp_numbers:
-            return
+            return None
 
-        current_time = int(time.time() * 1000)
-        
-        # Clear existing anomalies for these TPs to avoid duplicates/stale data
-        self.db.query(TicketAnomaly).filter(
-            TicketAnomaly.tp_number.in_(tp_numbers)
-        ).delete(synchronize_session=False)
+        # 2. Evaluate the rules for the whole dataset
+        detected, rule_stats = self._detect_anomalies(tp_titles)
 
-        # 2. Iterate TPs and find anomalies
-        for tp in active_tps:
-            self._detect_anomalies_for_tp(tp, current_time)
-        
+        # 3. Diff against the stored anomalies of these TPs
+        stats = self._apply_anomalies(tp_numbers, detected, int(time.time() * 1000))
+        if stats["inserted"] or stats["updated"] or stats["resolved"]:
+            bump_generation(self.db, TicketAnomaly.__tablename__)
         self.db.commit()
+        logger.info(
+            f"Anomaly detection: {len(detected)} anomalies "
+            f"(new {stats['inserted']}, updated {stats['updated']}, "
+            f"resolved {stats['resolved']}, unchanged {stats['unchanged']})"
+        )
+        for name, rule_stat in rule_stats.items():
+            logger.info(
+                f"Anomaly rule '{name}': {rule_stat['hits']} hits / {rule_stat['candidates']} candidates "
+                f"in {rule_stat['duration_ms']} ms"
+            )
+        stats["rules"] = rule_stats
+        return stats
 
-    def _detect_anomalies_for_tp(self, tp: LarkModelTP, timestamp: int):
-        # Target Parent Issue Types
-        target_issue_types = ["Change Request", "Improvement"]
-        # Rule 1 Active Children Statuses (Open Parent)
-        active_child_statuses = [
-            "In Progress", "Development", "Testing", 
-            "In Review", "Review", 
-            "Resolved", 
-            "Done", "Closed"
-        ]
-        
-        # Rule 2 Inactive Children Statuses (In Progress Parent) -> Check if ALL are in this list
-        inactive_child_statuses = ["Resolved", "Done", "Closed"]
+    def _detect_anomalies(self, tp_titles: dict):
+        """
+        Loads one ticket snapshot and evaluates every registered rule on it (see anomaly_rules).
+        Returns ({(tp_number, ticket_number): anomaly column values}, per-rule stats).
+        """
+        snapshot = load_snapshot(self.db)
+        hits, rule_stats = evaluate_rules(snapshot)
 
-        # Query Potential Parents (Open OR In Progress)
-        target_statuses = ["Open", "In Progress"]
-        
-        parents = self.db.query(LarkModelTCG).filter(
-            LarkModelTCG.tp_number == tp.ticket_number,
-            LarkModelTCG.issue_type.in_(target_issue_types),
-            LarkModelTCG.jira_status.in_(target_statuses)
-        ).all()
+        detected = {}
+        for key, (rule, p, reason) in hits.items():
+            detected[key] = {
+                "ticket_title": p.title,
+                "tp_title": tp_titles.get(p.tp_number),
+                "assignee": p.assignee,
+                "parent_status": p.jira_status,
+                "anomaly_reason": reason,
+                "components": p.components,
+                "department": p.department
+            }
+        return detected, rule_stats
 
-        for p in parents:
-            # check children
-            children = self.db.query(LarkModelTCG).filter(
-                LarkModelTCG.parent_tickets.ilike(f"%{p.tcg_tickets}%")
-            ).all()
+    def _apply_anomalies(self, tp_numbers, detected: dict, timestamp: int) -> dict:
+        stats = {"inserted": 0, "updated": 0, "resolved": 0, "unchanged": 0}
 
-            if not children:
-                continue
+        existing = self.db.query(TicketAnomaly).filter(
+            TicketAnomaly.tp_number.in_(tp_numbers)
+        ).order_by(TicketAnomaly.id).all()
 
-            c_statuses = [(c.jira_status or "").strip() for c in children]
-            parent_status = (p.jira_status or "").strip()
+        kept = set()
+        for anomaly in existing:
+            key = (anomaly.tp_number, anomaly.ticket_number)
+            values = detected.get(key)
+            if values is None or key in kept:
+                # Resolved (or a duplicate row of the same anomaly)
+                self.db.delete(anomaly)
+                stats["resolved"] += 1
+                continue
 
-            # --- Rule 1: Parent Open but Child Active ---
-            if parent_status == "Open":
-                has_active_child = False
-                active_child_info = []
-                for c in children:
-                    c_status = (c.jira_status or "").strip()
-                    if c_status in active_child_statuses:
-                        has_active_child = True
-                        active_child_info.append(f"{c.tcg_tickets}({c_status})")
-                
-                if has_active_child:
-                    reason = f"Parent is Open but has active child: {', '.join(active_child_info)}"
-                    self._create_anomaly(p, tp, reason, timestamp)
+            kept.add(key)
+            changed = False
+            for column, value in values.items():
+                if getattr(anomaly, column) != value:
+                    setattr(anomaly, column, value)
+                    changed = True
+            stats["updated" if changed else "unchanged"] += 1
 
-            # --- Rule 2: Parent In Progress but Child InActive ---
-            elif parent_status == "In Progress":
-                # Check if ALL children are inactive
-                all_inactive = True
-                for c_status in c_statuses:
-                    if c_status not in inactive_child_statuses:
-                        all_inactive = False
-                        break
-                
-                if all_inactive:
-                    reason = "Parent is In Progress but all children are InActive (Closed/Done)."
-                    self._create_anomaly(p, tp, reason, timestamp)
+        for (tp_number, ticket_number), values in detected.items():
+            if (tp_number, ticket_number) in kept:
+                continue
+            self.db.add(TicketAnomaly(
+                ticket_number=ticket_number,
+                tp_number=tp_number,
+                detected_at=timestamp,
+                **values
+            ))
+            stats["inserted"] += 1
 
-    def _create_anomaly(self, p, tp, reason, timestamp):
-        anomaly = TicketAnomaly(
-            ticket_number=p.tcg_tickets,
-            ticket_title=p.title,
-            tp_number=p.tp_number,
-            tp_title=tp.title,
-            assignee=p.assignee,
-            parent_status=p.jira_status,
-            anomaly_reason=reason,
-            detected_at=timestamp,
-            components=p.components,
-            department=p.department
-        )
-        self.db.add(anomaly)
+        return stats
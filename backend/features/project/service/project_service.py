@@ -1,49 +1,54 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, not_, or_
+from sqlalchemy import func, and_, not_, or_, case
 from backend.features.project.persistence.models import LarkModelTP
 from datetime import datetime, timedelta
 import logging
 
 logger = logging.getLogger(__name__)
 
+def quarter_of(date_obj):
+    if not date_obj:
+        return None
+    return f"{date_obj.year} Q{(date_obj.month - 1) // 3 + 1}"
+
+def parse_release_date(val):
+    if not val:
+        return None
+    try:
+        # Try timestamp (ms)
+        if str(val).isdigit() and len(str(val)) > 10:
+            return datetime.fromtimestamp(int(val) / 1000)
+        # Try timestamp (s)
+        if str(val).isdigit():
+            return datetime.fromtimestamp(int(val))
+        # Try ISO format or similar "YYYY-MM-DD"
+        return datetime.strptime(str(val).split('T')[0], "%Y-%m-%d")
+    except Exception as e:
+        return None
+
+def release_columns(released_date) -> dict:
+    """
+    Typed columns derived from the raw released_date, computed once at sync time:
+    released_at (epoch ms) and released_quarter ("2024 Q3").
+    """
+    d_obj = parse_release_date(released_date)
+    if not d_obj:
+        return {"released_at": None, "released_quarter": None}
+    return {"released_at": int(d_obj.timestamp() * 1000), "released_quarter": quarter_of(d_obj)}
+
 class ProjectService:
     def __init__(self, db: Session):
         self.db = db
 
-    def _get_quarter(self, date_obj):
-        if not date_obj:
-            return None
-        return f"{date_obj.year} Q{(date_obj.month - 1) // 3 + 1}"
+    def _closed_tps_filter(self, department: str = None):
+        """WHERE clauses shared by the dashboard chart and its drill-down."""
+        filters = [LarkModelTP.jira_status.in_(["Closed", "Resolved"])]
 
-    def _parse_date(self, val):
-        if not val:
-            return None
-        try:
-            # Try timestamp (ms)
-            if str(val).isdigit() and len(str(val)) > 10:
-                return datetime.fromtimestamp(int(val) / 1000)
-            # Try timestamp (s)
-            if str(val).isdigit():
-                return datetime.fromtimestamp(int(val))
-            # Try ISO format or similar "YYYY-MM-DD"
-            return datetime.strptime(str(val).split('T')[0], "%Y-%m-%d")
-        except Exception as e:
-            return None
-
-    def get_dashboard_stats(self, department: str = None):
-        """
-        Calculate statistics for the dashboard.
-        Metric: Closed TP Count by Quarter (Last 4 Quarters)
-        """
-        query = self.db.query(LarkModelTP).filter(
-            LarkModelTP.jira_status.in_(["Closed", "Resolved"])
-        )
-        
         if department and department != "ALL":
-             query = query.filter(LarkModelTP.department.ilike(f"%{department}%"))
+             filters.append(LarkModelTP.department.ilike(f"%{department}%"))
         else:
              # Exclude if Department is WRD AND (Title starts with "WLB_" OR Project Type is empty)
-             query = query.filter(
+             filters.append(
                  not_(
                      and_(
                          LarkModelTP.department == "WRD",
@@ -56,9 +61,14 @@ class ProjectService:
                      )
                  )
              )
-        
-        tps = query.all()
-        
+        return filters
+
+    def get_dashboard_stats(self, department: str = None):
+        """
+        Calculate statistics for the dashboard.
+        Metric: Closed TP Count by Quarter (Last 4 Quarters)
+        One GROUP BY released_quarter query (released_quarter is derived at sync time).
+        """
         # Determine Date Range (Last 4 Quarters approx 1 year)
         now = datetime.now()
         
@@ -66,7 +76,7 @@ class ProjectService:
         target_quarters = []
         curr = now
         for _ in range(4):
-            q_str = self._get_quarter(curr)
+            q_str = quarter_of(curr)
             target_quarters.append(q_str)
             curr = curr - timedelta(days=95)
         
@@ -74,18 +84,19 @@ class ProjectService:
         stats = {q: 0 for q in target_quarters}
         icr_stats = {q: 0 for q in target_quarters}
 
-        for tp in tps:
-            d_obj = self._parse_date(tp.released_date)
-            if d_obj:
-                q_str = self._get_quarter(d_obj)
-                if q_str in stats:
-                    stats[q_str] += 1
-                    
-                    # Logic for ICR Count Chart
-                    # "display the total sum of the icr_count of TPs where TP project type is ICR"
-                    if tp.project_type == "ICR":
-                         icr_count = tp.icr_count or 0 # Handle None
-                         icr_stats[q_str] += icr_count
+        # Logic for ICR Count Chart
+        # "display the total sum of the icr_count of TPs where TP project type is ICR"
+        icr_sum = func.sum(case((LarkModelTP.project_type == "ICR", func.coalesce(LarkModelTP.icr_count, 0)), else_=0))
+        rows = self.db.query(
+            LarkModelTP.released_quarter, func.count(), icr_sum
+        ).filter(
+            *self._closed_tps_filter(department),
+            LarkModelTP.released_quarter.in_(target_quarters)
+        ).group_by(LarkModelTP.released_quarter).all()
+
+        for q_str, tp_count, icr_count in rows:
+            stats[q_str] = tp_count
+            icr_stats[q_str] = icr_count or 0
         
         return {
             "categories": list(stats.keys()),
@@ -96,46 +107,27 @@ class ProjectService:
     def get_closed_tps(self, quarter: str, department: str = None):
         """
         Get list of Closed/Resolved TPs for a specific quarter.
+        WHERE released_quarter = :quarter, selecting only the returned columns.
         """
-        query = self.db.query(LarkModelTP).filter(
-            LarkModelTP.jira_status.in_(["Closed", "Resolved"])
-        )
-
-        if department and department != "ALL":
-             query = query.filter(LarkModelTP.department.ilike(f"%{department}%"))
-        else:
-             # Exclude if Department is WRD AND (Title starts with "WLB_" OR Project Type is empty)
-             query = query.filter(
-                 not_(
-                     and_(
-                         LarkModelTP.department == "WRD",
-                         or_(
-                             LarkModelTP.title.like("WLB_%"),
-                             LarkModelTP.project_type.is_(None),
-                             LarkModelTP.project_type == "",
-                             LarkModelTP.project_type == "Others"
-                         )
-                     )
-                 )
-             )
+        tps = self.db.query(
+            LarkModelTP.record_id, LarkModelTP.ticket_number, LarkModelTP.title,
+            LarkModelTP.project_type, LarkModelTP.department, LarkModelTP.released_at,
+            LarkModelTP.project_manager
+        ).filter(
+            *self._closed_tps_filter(department),
+            LarkModelTP.released_quarter == quarter
+        ).all()
 
-        tps = query.all()
         results = []
-
         for tp in tps:
-            d_obj = self._parse_date(tp.released_date)
-            if d_obj:
-                q_str = self._get_quarter(d_obj)
-                if q_str == quarter:
-                    # Match found
-                    results.append({
-                        "id": tp.record_id,
-                        "ticket_number": tp.ticket_number,
-                        "title": tp.title,
-                        "project_type": tp.project_type,
-                        "department": tp.department,
-                        "released_date": d_obj.strftime('%Y-%m-%d'), # Normalized date
-                        "project_manager": tp.project_manager
-                    })
+            results.append({
+                "id": tp.record_id,
+                "ticket_number": tp.ticket_number,
+                "title": tp.title,
+                "project_type": tp.project_type,
+                "department": tp.department,
+                "released_date": datetime.fromtimestamp(tp.released_at / 1000).strftime('%Y-%m-%d'), # Normalized date
+                "project_manager": tp.project_manager
+            })
         
         return results
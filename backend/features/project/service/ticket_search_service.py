@@ -0,0 +1,128 @@
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from backend.features.project.persistence.models import LarkModelTP, LarkModelTCG, TicketSearchDoc, TICKET_SEARCH_TABLE
+import html
+
+# bm25 weight per ticket_search column (ticket_key, title, description, assignee, components)
+SEARCH_WEIGHTS = (10.0, 5.0, 1.0, 2.0, 2.0)
+# Tokens in the description snippet (trigram tokens are ~characters, unicode61 tokens are words; FTS5 max 64)
+SNIPPET_TOKENS = {True: 64, False: 16}
+MAX_PAGE_SIZE = 100
+# Results reachable by paging (and the cap of "total"): counting every hit of a common
+# term costs as much as the search itself
+MAX_RESULTS = 1000
+# trigram tokenizer: shorter terms cannot match the index
+MIN_TRIGRAM_TERM = 3
+
+# Highlight markers passed to FTS5: control characters never found in ticket text,
+# turned into <mark> tags after the text is HTML-escaped
+_MARK_OPEN, _MARK_CLOSE = "\x02", "\x03"
+
+_SEARCH_SQL = text(
+    f"SELECT d.kind, d.record_id, {TICKET_SEARCH_TABLE}.ticket_key, "
+    f"highlight({TICKET_SEARCH_TABLE}, 1, :mark_open, :mark_close) AS title, "
+    f"snippet({TICKET_SEARCH_TABLE}, 2, :mark_open, :mark_close, '…', :snippet_tokens) AS snippet, "
+    f"bm25({TICKET_SEARCH_TABLE}, {', '.join(str(w) for w in SEARCH_WEIGHTS)}) AS score "
+    f"FROM {TICKET_SEARCH_TABLE} JOIN {TicketSearchDoc.__tablename__} d ON d.doc_id = {TICKET_SEARCH_TABLE}.rowid "
+    f"WHERE {TICKET_SEARCH_TABLE} MATCH :query "
+    f"ORDER BY score LIMIT :limit OFFSET :offset"
+)
+_COUNT_SQL = text(
+    f"SELECT COUNT(*) FROM (SELECT 1 FROM {TICKET_SEARCH_TABLE} WHERE {TICKET_SEARCH_TABLE} MATCH :query LIMIT :cap)"
+)
+
+
+def build_match_query(q: str, trigram: bool = True):
+    """
+    User text -> FTS5 MATCH expression: every whitespace separated term must match (AND),
+    each quoted as a string so FTS5 operators / punctuation in it are literal.
+    trigram: substring match, terms shorter than 3 characters are dropped.
+    unicode61: prefix match of each term.
+    Returns None when no usable term is left.
+    """
+    terms = (q or "").split()
+    if trigram:
+        terms = [term for term in terms if len(term) >= MIN_TRIGRAM_TERM]
+    if not terms:
+        return None
+    suffix = "" if trigram else "*"
+    return " ".join('"' + term.replace('"', '""') + '"' + suffix for term in terms)
+
+
+def render_highlight(value):
+    """FTS5 highlight / snippet output -> HTML-escaped text with <mark> around the matches."""
+    if not value:
+        return value
+    return html.escape(value).replace(_MARK_OPEN, "<mark>").replace(_MARK_CLOSE, "</mark>")
+
+
+class TicketSearchService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def uses_trigram(self) -> bool:
+        sql = self.db.execute(
+            text("SELECT sql FROM sqlite_master WHERE name = :name"), {"name": TICKET_SEARCH_TABLE}
+        ).scalar()
+        return "trigram" in (sql or "")
+
+    def search(self, q: str, page: int = 1, page_size: int = 20):
+        """
+        Full-text search over TCG / TP tickets (ticket key, title, description, assignee, components).
+        Results are ranked by bm25 (key and title matches first) and paginated;
+        only the best MAX_RESULTS are reachable and "total" is capped at MAX_RESULTS.
+        """
+        page = max(page, 1)
+        page_size = min(max(page_size, 1), MAX_PAGE_SIZE)
+        result = {"query": q, "data": [], "total": 0, "page": page, "page_size": page_size}
+
+        trigram = self.uses_trigram()
+        match = build_match_query(q, trigram)
+        if not match:
+            return result
+
+        result["total"] = self.db.execute(_COUNT_SQL, {"query": match, "cap": MAX_RESULTS}).scalar()
+        offset = (page - 1) * page_size
+        if offset >= result["total"]:
+            return result
+        hits = self.db.execute(_SEARCH_SQL, {
+            "query": match,
+            "mark_open": _MARK_OPEN,
+            "mark_close": _MARK_CLOSE,
+            "snippet_tokens": SNIPPET_TOKENS[trigram],
+            "limit": min(page_size, result["total"] - offset),
+            "offset": offset,
+        }).fetchall()
+
+        # Status / people of the page's tickets (one query per ticket type)
+        details = {}
+        tcg_ids = [hit.record_id for hit in hits if hit.kind == "TCG"]
+        if tcg_ids:
+            for t in self.db.query(
+                LarkModelTCG.record_id, LarkModelTCG.jira_status, LarkModelTCG.assignee,
+                LarkModelTCG.issue_type, LarkModelTCG.tp_number
+            ).filter(LarkModelTCG.record_id.in_(tcg_ids)):
+                details[("TCG", t.record_id)] = {
+                    "status": t.jira_status, "assignee": t.assignee,
+                    "issue_type": t.issue_type, "tp_number": t.tp_number
+                }
+        tp_ids = [hit.record_id for hit in hits if hit.kind == "TP"]
+        if tp_ids:
+            for tp in self.db.query(
+                LarkModelTP.record_id, LarkModelTP.jira_status, LarkModelTP.project_manager
+            ).filter(LarkModelTP.record_id.in_(tp_ids)):
+                details[("TP", tp.record_id)] = {
+                    "status": tp.jira_status, "assignee": tp.project_manager,
+                    "issue_type": "TP", "tp_number": None
+                }
+
+        for hit in hits:
+            result["data"].append({
+                "ticket_number": hit.ticket_key,
+                "kind": hit.kind,
+                "title": render_highlight(hit.title),
+                "snippet": render_highlight(hit.snippet),
+                "score": round(-hit.score, 4),  # bm25 is lower-is-better; exposed as higher-is-better
+                **details.get((hit.kind, hit.record_id), {}),
+            })
+        return result
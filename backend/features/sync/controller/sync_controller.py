@@ -1,38 +1,23 @@
 from fastapi import APIRouter, BackgroundTasks
 import os
 from backend.features.sync.service.sync_service import sync_lark_table, sync_jira_verification
-from backend.features.project.persistence.models import LarkModelTP, LarkModelTCG
+from backend.features.sync.service.sync_orchestrator import run_sync_cycle
 from backend.features.system.persistence.models import LarkModelDept
-from backend.features.member.persistence.models import LarkModelMember
+from backend.shared.integration.rate_limiter import rate_limiter
+from backend.shared.response_cache import response_cache
 
 router = APIRouter(
     prefix="/api",
     tags=["Sync"]
 )
 
-# TP Table Info
-TP_APP_TOKEN = os.getenv("TP_APP_TOKEN")
-TP_TABLE_ID = os.getenv("TP_TABLE_ID")
-
-# TCG Table Info
-TCG_APP_TOKEN = os.getenv("TCG_APP_TOKEN")
-TCG_TABLE_ID = os.getenv("TCG_TABLE_ID")
-
 # TCG Dept Info
 DPT_APP_TOKEN = os.getenv("DPT_APP_TOKEN")
 DPT_TABLE_ID = os.getenv("DPT_TABLE_ID")
 
-# Member Info
-MEMBER_APP_TOKEN = os.getenv("MEMBER_APP_TOKEN")
-MEMBER_TABLE_ID = os.getenv("MEMBER_TABLE_ID")
-
-
 def run_sync_jobs_logic(force_full: bool = False):
-    """Helper to run sync logic"""
-    sync_lark_table(TP_APP_TOKEN, TP_TABLE_ID, LarkModelTP, force_full=force_full)
-    sync_lark_table(TCG_APP_TOKEN, TCG_TABLE_ID, LarkModelTCG, force_full=force_full)
-    if MEMBER_APP_TOKEN and MEMBER_TABLE_ID:
-        sync_lark_table(MEMBER_APP_TOKEN, MEMBER_TABLE_ID, LarkModelMember, force_full=force_full)
+    """Helper to run sync logic (all configured tables, fetched concurrently)"""
+    return run_sync_cycle(force_full=force_full)
 
 @router.post("/jobs/sync")
 def trigger_sync():
@@ -41,8 +26,8 @@ def trigger_sync():
     # so we can return status. In production, might want BackgroundTasks.
     # Given the requirements, blocking is fine for immediate feedback.
     try:
-        run_sync_jobs_logic(force_full=True)
-        return {"status": "success", "message": "Sync jobs triggered successfully (Force Full)."}
+        results = run_sync_jobs_logic(force_full=True)
+        return {"status": "success", "message": "Sync jobs triggered successfully (Force Full).", "tables": results}
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
@@ -55,6 +40,16 @@ def trigger_jira_verification():
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
+@router.get("/jobs/rate-limits")
+def get_rate_limit_stats():
+    """Outbound Lark / Jira rate limiter budgets and counters (acquired, throttled, waited seconds)."""
+    return rate_limiter.snapshot()
+
+@router.get("/jobs/cache-stats")
+def get_response_cache_stats():
+    """API response cache counters (hits, misses, evictions) and the current per-table data generations."""
+    return response_cache.snapshot()
+
 @router.post("/sync/lark/dept")
 async def sync_lark_dept(background_tasks: BackgroundTasks, force_full: bool = False):
     if not DPT_APP_TOKEN or not DPT_TABLE_ID:
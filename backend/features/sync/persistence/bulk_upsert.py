@@ -0,0 +1,62 @@
+from sqlalchemy import or_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+
+def fetch_existing(db: Session, model_class, record_ids, *columns):
+    """
+    Prefetch the rows of a page that already exist, in a single query.
+    Returns {record_id: Row}. Extra column names can be requested via *columns.
+    """
+    if not record_ids:
+        return {}
+    selected = [model_class.record_id] + [getattr(model_class, c) for c in columns]
+    rows = db.query(*selected).filter(model_class.record_id.in_(list(record_ids))).all()
+    return {row[0]: row for row in rows}
+
+
+def bulk_upsert_page(db: Session, model_class, rows, existing_ids, columns):
+    """
+    Writes one page of mapped rows with a single
+    INSERT ... ON CONFLICT(record_id) DO UPDATE (executemany).
+
+    Every row is written with the given columns (record_id included); a column missing
+    from a row is written as NULL, whatever the other rows of the page carry.
+    Columns not listed (locally maintained ones) are never touched.
+
+    Rows whose column values are all identical to the stored ones are left
+    untouched (the DO UPDATE has a WHERE clause), so they are reported as unchanged.
+
+    Returns {"inserted": n, "updated": n, "unchanged": n}.
+    """
+    stats = {"inserted": 0, "updated": 0, "unchanged": 0}
+    if not rows:
+        return stats
+
+    # De-duplicate by record_id (last one wins), executemany would count it twice otherwise
+    rows_by_id = {row["record_id"]: row for row in rows}
+
+    params = [{c: row.get(c) for c in columns} for row in rows_by_id.values()]
+    update_columns = [c for c in columns if c != "record_id"]
+
+    table = model_class.__table__
+    stmt = sqlite_insert(table)
+    if update_columns:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.record_id],
+            set_={c: stmt.excluded[c] for c in update_columns},
+            where=or_(*[table.c[c].is_distinct_from(stmt.excluded[c]) for c in update_columns])
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=[table.c.record_id])
+
+    result = db.execute(stmt, params)
+
+    # sqlite3 sums the changes of every execution for executemany.
+    # A skipped DO UPDATE (WHERE false) does not count as a change.
+    changed = result.rowcount
+    inserted = sum(1 for record_id in rows_by_id if record_id not in existing_ids)
+    stats["inserted"] = inserted
+    stats["updated"] = max(changed - inserted, 0)
+    stats["unchanged"] = len(params) - inserted - stats["updated"]
+    return stats
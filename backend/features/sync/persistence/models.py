@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, BigInteger, Text
+from backend.shared.database import Base
+
+class SyncState(Base):
+    __tablename__ = "sync_state"
+
+    table_name = Column(String, primary_key=True) # Local table, e.g. 'tcg_tickets'
+    watermark = Column(BigInteger) # Max Lark 'Updated Date' (ms) synced successfully
+    last_page_token = Column(String) # Page token of the last written page
+    last_status = Column(String) # running / success / failed
+    last_started_at = Column(BigInteger) # Timestamp ms
+    last_finished_at = Column(BigInteger) # Timestamp ms
+    last_duration_ms = Column(Integer)
+    last_fetched = Column(Integer) # Records fetched by the last run
+    last_error = Column(Text)
+    data_generation = Column(BigInteger, default=0) # Bumped by every write to the table (response cache / ETag)
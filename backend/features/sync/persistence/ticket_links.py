@@ -0,0 +1,44 @@
+import re
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from backend.features.project.persistence.models import TCGTicketLink, ticket_key
+
+# Jira issue key, e.g. TCG-123 (word-bounded so TCG-12 never matches inside TCG-123)
+TICKET_KEY_PATTERN = re.compile(r"\b[A-Za-z][A-Za-z0-9_]*-\d+\b")
+
+
+def parse_ticket_keys(value) -> list:
+    """
+    'TCG-1, tcg-2' (comma separated parent_tickets text) -> ['TCG-1', 'TCG-2'] (deduped, in order).
+    Keys are upper-cased (ticket_key) to join on tcg_tickets.tcg_ticket_key.
+    """
+    if not value:
+        return []
+    return list(dict.fromkeys(ticket_key(key) for key in TICKET_KEY_PATTERN.findall(str(value))))
+
+
+def delete_ticket_links(db: Session, child_record_ids):
+    """Removes the parent links of the given children (caller commits)."""
+    child_record_ids = list(child_record_ids)
+    if child_record_ids:
+        db.query(TCGTicketLink).filter(
+            TCGTicketLink.child_record_id.in_(child_record_ids)
+        ).delete(synchronize_session=False)
+
+
+def replace_ticket_links(db: Session, parent_tickets_by_child: dict):
+    """
+    Rewrites the links of the given children from their parent_tickets text
+    ({child_record_id: parent_tickets}); caller commits.
+    """
+    if not parent_tickets_by_child:
+        return 0
+    delete_ticket_links(db, parent_tickets_by_child.keys())
+    links = [
+        {"parent_ticket": parent, "child_record_id": child_id}
+        for child_id, parent_tickets in parent_tickets_by_child.items()
+        for parent in parse_ticket_keys(parent_tickets)
+    ]
+    if links:
+        db.execute(sqlite_insert(TCGTicketLink).on_conflict_do_nothing(), links)
+    return len(links)
@@ -0,0 +1,43 @@
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from backend.features.project.persistence.models import TicketPerson
+
+# tcg_tickets Person columns indexed into ticket_people (column name == role)
+PERSON_ROLES = ("assignee", "resolved_by")
+
+
+def split_people(value) -> list:
+    """'Alice, Bob' (comma separated Person field) -> ['Alice', 'Bob'] (deduped, in order)."""
+    if not value:
+        return []
+    return list(dict.fromkeys(p.strip() for p in str(value).split(",") if p.strip()))
+
+
+def delete_ticket_people(db: Session, ticket_record_ids, roles=PERSON_ROLES):
+    """Removes the people rows of the given tickets (caller commits)."""
+    ticket_record_ids = list(ticket_record_ids)
+    if ticket_record_ids:
+        db.query(TicketPerson).filter(
+            TicketPerson.ticket_record_id.in_(ticket_record_ids),
+            TicketPerson.role.in_(list(roles))
+        ).delete(synchronize_session=False)
+
+
+def replace_ticket_people(db: Session, rows):
+    """
+    Rewrites ticket_people for written TCG rows (mapped dicts with record_id); caller commits.
+    A role is only rewritten when the rows carry its column (sync rows carry every mapped column).
+    """
+    roles = [role for role in PERSON_ROLES if any(role in row for row in rows)]
+    if not roles:
+        return 0
+    delete_ticket_people(db, [row["record_id"] for row in rows], roles)
+    people = [
+        {"ticket_record_id": row["record_id"], "role": role, "person": person}
+        for row in rows
+        for role in roles
+        for person in split_people(row.get(role))
+    ]
+    if people:
+        db.execute(sqlite_insert(TicketPerson).on_conflict_do_nothing(), people)
+    return len(people)
@@ -0,0 +1,76 @@
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from backend.features.project.persistence.models import (
+    LarkModelTP, LarkModelTCG, TicketSearchDoc, TICKET_SEARCH_TABLE, TICKET_SEARCH_COLUMNS
+)
+
+# Indexed ticket tables: table -> (kind, source column of each ticket_search column)
+SEARCH_SOURCES = {
+    LarkModelTCG.__tablename__: ("TCG", ("tcg_tickets", "title", "description", "assignee", "components")),
+    LarkModelTP.__tablename__: ("TP", ("ticket_number", "title", "description", "project_manager", "components")),
+}
+
+DOCS_TABLE = TicketSearchDoc.__tablename__
+
+_DELETE_INDEXED = text(
+    f"DELETE FROM {TICKET_SEARCH_TABLE} WHERE rowid IN "
+    f"(SELECT doc_id FROM {DOCS_TABLE} WHERE kind = :kind AND record_id IN :record_ids)"
+).bindparams(bindparam("record_ids", expanding=True))
+
+
+def _index_statement(table: str, where: str = ""):
+    """INSERT ... SELECT of the ticket_search rows of a ticket table (rowid = doc_id)."""
+    _, sources = SEARCH_SOURCES[table]
+    return text(
+        f"INSERT INTO {TICKET_SEARCH_TABLE} (rowid, {', '.join(TICKET_SEARCH_COLUMNS)}) "
+        f"SELECT d.doc_id, {', '.join(f't.{column}' for column in sources)} "
+        f"FROM {table} t JOIN {DOCS_TABLE} d ON d.kind = :kind AND d.record_id = t.record_id {where}"
+    )
+
+
+def delete_ticket_search(db: Session, model_class, record_ids):
+    """Removes the given tickets from the search index (caller commits)."""
+    record_ids = list(record_ids)
+    if record_ids:
+        kind, _ = SEARCH_SOURCES[model_class.__tablename__]
+        db.execute(_DELETE_INDEXED, {"kind": kind, "record_ids": record_ids})
+        db.query(TicketSearchDoc).filter(
+            TicketSearchDoc.kind == kind,
+            TicketSearchDoc.record_id.in_(record_ids)
+        ).delete(synchronize_session=False)
+
+
+def replace_ticket_search(db: Session, model_class, record_ids):
+    """
+    Re-indexes written tickets from their stored rows (call after the page upsert, so the index
+    holds what the table holds whatever columns the page carried); caller commits.
+    """
+    record_ids = list(record_ids)
+    if not record_ids:
+        return 0
+    table = model_class.__tablename__
+    kind, _ = SEARCH_SOURCES[table]
+    db.execute(
+        sqlite_insert(TicketSearchDoc).on_conflict_do_nothing(index_elements=["kind", "record_id"]),
+        [{"kind": kind, "record_id": record_id} for record_id in record_ids]
+    )
+    db.execute(_DELETE_INDEXED, {"kind": kind, "record_ids": record_ids})
+    statement = _index_statement(table, "WHERE t.record_id IN :record_ids").bindparams(
+        bindparam("record_ids", expanding=True)
+    )
+    return db.execute(statement, {"kind": kind, "record_ids": record_ids}).rowcount
+
+
+def rebuild_ticket_search(connection):
+    """Re-indexes every TCG / TP ticket from scratch (backfill); caller commits."""
+    connection.execute(text(f"DELETE FROM {TICKET_SEARCH_TABLE}"))
+    connection.execute(text(f"DELETE FROM {DOCS_TABLE}"))
+    indexed = 0
+    for table, (kind, _) in SEARCH_SOURCES.items():
+        connection.execute(
+            text(f"INSERT INTO {DOCS_TABLE} (kind, record_id) SELECT :kind, record_id FROM {table}"),
+            {"kind": kind}
+        )
+        indexed += connection.execute(_index_statement(table), {"kind": kind}).rowcount
+    return indexed
@@ -0,0 +1,149 @@
+import json
+import hashlib
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+def normalize_lark_key(key: str) -> str:
+    """
+    Converts 'Ticket Number' to 'ticket_number'
+    Converts 'Due Day (Quarter)' to 'due_day_quarter' (removing parens)
+    """
+    key = key.lower().replace(" ", "_").replace("(", "").replace(")", "").replace("-", "_")
+    return key
+
+def extract_lark_value(value):
+    """
+    Smart extraction for Lark fields.
+    - List of objects (Person/Select) -> Comma separated 'name' or 'text'
+    - List of strings -> Comma separated
+    - Complex dict -> json dump (fallback)
+    """
+    if isinstance(value, list):
+        if not value:
+            return None
+        # Check first item type
+        first = value[0]
+        if isinstance(first, dict):
+            # Try to grab readable name
+            # Common keys: name (Person, Option), text (Text), id (sometimes)
+            extracted = []
+            for item in value:
+                val = item.get("name") or item.get("text") or item.get("email")
+                if val:
+                    extracted.append(str(val))
+                else:
+                    # Fallback to json dump of item if no simple name
+                    extracted.append(json.dumps(item, ensure_ascii=False))
+            return ", ".join(extracted)
+        else:
+            return ", ".join([str(v) for v in value])
+    
+    if isinstance(value, dict):
+         # Single object, try to get name/text
+         return value.get("name") or value.get("text") or json.dumps(value, ensure_ascii=False)
+
+    return value
+
+
+def _lark_date_to_str(value):
+    return str(value)
+
+# Written by the sync itself for every record, never from a Lark field
+SYNC_COLUMNS = ("record_id", "updated_at", "fields_hash")
+# Bump when an extractor or a derived column (release_columns, ticket_key) changes what it
+# writes: the version is part of every plan signature, so stored fields hashes stop matching
+FIELD_MAPPING_VERSION = 2
+
+
+class FieldMappingPlan:
+    """
+    Lark field name -> [(column, extractor)] plan, compiled once per model class.
+
+    Replaces the per-record work of map_fields_to_model (column reflection,
+    normalize_lark_key, lark_mapping lookup). The plan only changes when a
+    Lark field name it has never seen appears; that name is then compiled and
+    the plan is swapped (copy-on-write, safe for concurrent readers).
+
+    lark_columns are the columns a Lark field can fill: every model column except
+    SYNC_COLUMNS, the model's derived_columns / key_columns (computed by the sync from
+    mapped values) and its local_columns (e.g. sort_order, never touched by the sync).
+    write_columns are the columns each synced row is written with.
+    signature identifies the mapping (lark_mapping, column sets, FIELD_MAPPING_VERSION) and is
+    part of fields_hash, so a changed mapping or schema re-maps records whose payload did not change.
+    """
+
+    def __init__(self, model_class):
+        self.model_class = model_class
+        self.valid_columns = {c.name for c in model_class.__table__.columns}
+        self.lark_mapping = getattr(model_class, 'lark_mapping', {})
+        self.derived_columns = tuple(sorted(
+            set(getattr(model_class, 'derived_columns', ()))
+            | set(getattr(model_class, 'key_columns', {}).values())
+        ))
+        self.local_columns = tuple(sorted(getattr(model_class, 'local_columns', ())))
+        self.lark_columns = tuple(sorted(
+            self.valid_columns - set(SYNC_COLUMNS) - set(self.derived_columns) - set(self.local_columns)
+        ))
+        self.write_columns = SYNC_COLUMNS + self.lark_columns + self.derived_columns
+        self.signature = hashlib.sha1(json.dumps({
+            "version": FIELD_MAPPING_VERSION,
+            "lark_mapping": self.lark_mapping,
+            "lark_columns": self.lark_columns,
+            "derived_columns": self.derived_columns,
+        }, sort_keys=True).encode("utf-8")).hexdigest()
+        self.version = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _compile_field(self, key):
+        targets = []
+        col_name = self.lark_mapping.get(key) or normalize_lark_key(key)
+        if col_name in self.lark_columns:
+            targets.append((col_name, extract_lark_value))
+
+        # Special case: raw 'Updated Date' also kept as text when the model has the column
+        if key == "Updated Date" and "lark_updated_date" in self.lark_columns:
+            targets.append(("lark_updated_date", _lark_date_to_str))
+        return tuple(targets)
+
+    def _learn(self, key):
+        with self._lock:
+            if key not in self._entries:
+                entries = dict(self._entries)
+                entries[key] = self._compile_field(key)
+                self._entries = entries
+                self.version += 1
+                logger.debug(
+                    f"Mapping plan for {self.model_class.__tablename__} recompiled "
+                    f"(v{self.version}): '{key}' -> {[c for c, _ in entries[key]] or 'ignored'}"
+                )
+            return self._entries[key]
+
+    def map_row(self, lark_fields):
+        """
+        Converts one record's Lark fields into a plain {column: value} dict
+        (only the columns of the fields present; Lark omits empty fields).
+        """
+        entries = self._entries
+        row = {}
+        for key, value in lark_fields.items():
+            targets = entries.get(key)
+            if targets is None:
+                targets = self._learn(key)
+            for column, extractor in targets:
+                row[column] = extractor(value)
+        return row
+
+
+_plans = {}
+_plans_lock = threading.Lock()
+
+def get_mapping_plan(model_class) -> FieldMappingPlan:
+    """Returns the cached mapping plan of a model class (created on first use)."""
+    plan = _plans.get(model_class)
+    if plan is None:
+        with _plans_lock:
+            plan = _plans.setdefault(model_class, FieldMappingPlan(model_class))
+    return plan
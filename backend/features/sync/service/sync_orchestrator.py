@@ -0,0 +1,80 @@
+import os
+import time
+import logging
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from backend.features.sync.service.sync_service import sync_lark_table, run_anomaly_detection
+from backend.features.project.persistence.models import LarkModelTP, LarkModelTCG, LarkModelProgram
+from backend.features.member.persistence.models import LarkModelMember
+from backend.shared.integration.rate_limiter import rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# Max number of Lark tables fetched at the same time
+SYNC_MAX_PARALLEL = int(os.getenv("SYNC_MAX_PARALLEL", "3"))
+
+SyncJob = namedtuple("SyncJob", ["app_token", "table_id", "model_class"])
+
+def build_default_jobs():
+    """Tables synced by the scheduler / manual sync, read from env (unconfigured tables are skipped)."""
+    jobs = [
+        SyncJob(os.getenv("TP_APP_TOKEN"), os.getenv("TP_TABLE_ID"), LarkModelTP),
+        SyncJob(os.getenv("TCG_APP_TOKEN"), os.getenv("TCG_TABLE_ID"), LarkModelTCG),
+        SyncJob(os.getenv("PROGRAM_APP_TOKEN"), os.getenv("PROGRAM_TABLE_ID"), LarkModelProgram),
+        SyncJob(os.getenv("MEMBER_APP_TOKEN"), os.getenv("MEMBER_TABLE_ID"), LarkModelMember),
+    ]
+    return [job for job in jobs if job.app_token and job.table_id]
+
+def _run_job(job: SyncJob, force_full: bool):
+    table_name = job.model_class.__tablename__
+    started = time.time()
+    try:
+        stats = sync_lark_table(
+            job.app_token, job.table_id, job.model_class,
+            force_full=force_full, detect_anomalies=False
+        )
+        status = "success" if stats is not None else "failed"
+    except Exception as e:
+        # Isolation: one failing table must not stop the others
+        logger.error(f"Sync job for {table_name} crashed: {e}", exc_info=True)
+        stats = None
+        status = "failed"
+    return {
+        "table": table_name,
+        "status": status,
+        "duration_ms": int((time.time() - started) * 1000),
+        "stats": stats
+    }
+
+def run_sync_cycle(jobs=None, force_full: bool = False, max_workers: int = None):
+    """
+    Runs one sync cycle: every table is fetched concurrently (bounded by SYNC_MAX_PARALLEL),
+    DB writes stay serialized by the sync writer lock inside sync_lark_table.
+    Anomaly detection runs once at the end if TP or TCG synced successfully.
+    Returns {table_name: {"status", "duration_ms", "stats"}}.
+    """
+    jobs = build_default_jobs() if jobs is None else jobs
+    if not jobs:
+        logger.warning("No sync jobs configured. Skipping sync cycle.")
+        return {}
+
+    workers = max(1, min(max_workers or SYNC_MAX_PARALLEL, len(jobs)))
+    logger.info(f"Starting sync cycle: {len(jobs)} tables, parallelism {workers} (Force Full: {force_full})")
+    started = time.time()
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lark-sync") as pool:
+        futures = [pool.submit(_run_job, job, force_full) for job in jobs]
+        for future in as_completed(futures):
+            result = future.result()
+            results[result.pop("table")] = result
+
+    anomaly_tables = {LarkModelTP.__tablename__, LarkModelTCG.__tablename__}
+    if any(results.get(t, {}).get("status") == "success" for t in anomaly_tables):
+        run_anomaly_detection()
+
+    elapsed_ms = int((time.time() - started) * 1000)
+    summary = ", ".join(f"{t}={r['status']} ({r['duration_ms']} ms)" for t, r in results.items())
+    logger.info(f"Sync cycle finished in {elapsed_ms} ms: {summary}")
+    logger.info(f"Rate limiter: {rate_limiter.snapshot()}")
+    return results
@@ -1,16 +1,51 @@
-from datetime import datetime, timedelta
+from datetime import datetime
 import time
 import json
+import hashlib
 import logging
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from sqlalchemy import bindparam, select, update, case, func, and_, or_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
-from backend.shared.database import SessionLocal
-from backend.features.project.persistence.models import LarkModelTP, LarkModelTCG, TCGRemovedTickets
+from backend.shared.database import SessionLocal, db_write_lock
+from backend.shared.response_cache import bump_generation
+from backend.features.project.persistence.models import LarkModelTP, LarkModelTCG, TCGRemovedTickets, ticket_key
 from backend.shared.integration.lark_client import list_records
+from backend.features.sync.persistence.bulk_upsert import fetch_existing, bulk_upsert_page
+from backend.features.sync.persistence.ticket_links import replace_ticket_links, delete_ticket_links
+from backend.features.sync.persistence.ticket_people import replace_ticket_people, delete_ticket_people
+from backend.features.sync.persistence.ticket_search import replace_ticket_search, delete_ticket_search
+from backend.features.sync.persistence.models import SyncState
+from backend.features.sync.service.field_mapping import normalize_lark_key, extract_lark_value, get_mapping_plan
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Incremental sync re-reads records updated this long before the watermark (clock skew / late writes)
+SYNC_WATERMARK_OVERLAP_MINUTES = int(os.getenv("SYNC_WATERMARK_OVERLAP_MINUTES", "10"))
+
+# Records per Lark search page (Lark max is 500)
+LARK_PAGE_SIZE = int(os.getenv("LARK_PAGE_SIZE", "500"))
+# Pages the fetcher may read ahead of the writer (back-pressure bound)
+SYNC_PAGE_QUEUE_SIZE = int(os.getenv("SYNC_PAGE_QUEUE_SIZE", "4"))
+# How often the writer re-checks that the fetcher thread is alive while waiting for a page
+SYNC_PAGE_POLL_SECONDS = 1.0
+
+# Jira verification: keys per JQL query and concurrent queries
+JIRA_VERIFY_CHUNK_SIZE = int(os.getenv("JIRA_VERIFY_CHUNK_SIZE", "200"))
+JIRA_VERIFY_WORKERS = int(os.getenv("JIRA_VERIFY_WORKERS", "4"))
+# TP numbers per event-driven completion UPDATE
+TP_COMPLETION_CHUNK_SIZE = 500
+
+# Single SQLite writer: tables may be fetched concurrently, but only one sync writes at a time
+# (process-wide lock, shared with the API write endpoints)
+sync_write_lock = db_write_lock
+
 from ...project.service.anomaly_service import AnomalyService
+from ...project.service.project_service import release_columns
 
 def get_latest_update_time(db: Session, model_class):
     # Each model is now dedicated to a single table, so no need to filter by table_id
@@ -19,50 +54,40 @@ def get_latest_update_time(db: Session, model_class):
         return record.updated_at
     return None
 
-def normalize_lark_key(key: str) -> str:
-    """
-    Converts 'Ticket Number' to 'ticket_number'
-    Converts 'Due Day (Quarter)' to 'due_day_quarter' (removing parens)
-    """
-    key = key.lower().replace(" ", "_").replace("(", "").replace(")", "").replace("-", "_")
-    return key
+def get_sync_state(db: Session, table_name: str) -> SyncState:
+    state = db.query(SyncState).filter(SyncState.table_name == table_name).first()
+    if not state:
+        state = SyncState(table_name=table_name)
+        db.add(state)
+    return state
 
-def extract_lark_value(value):
+def build_incremental_filter(since_ms: int):
+    """Lark Search API filter: Updated Date > since_ms ("ExactDate" + timestamp ms for DateTime fields)."""
+    return {
+        "conjunction": "and",
+        "conditions": [
+            {
+                "field_name": "Updated Date",
+                "operator": "isGreater",
+                "value": ["ExactDate", since_ms]
+            }
+        ]
+    }
+
+def compute_fields_hash(lark_fields, mapping_signature: str = "") -> str:
     """
-    Smart extraction for Lark fields.
-    - List of objects (Person/Select) -> Comma separated 'name' or 'text'
-    - List of strings -> Comma separated
-    - Complex dict -> json dump (fallback)
+    Stable hash of a raw Lark 'fields' payload and the mapping it is written with
+    (FieldMappingPlan.signature): a mapping / schema change invalidates every stored hash.
+    Keys are sorted so the hash does not depend on the order Lark returns them in.
     """
-    if isinstance(value, list):
-        if not value:
-            return None
-        # Check first item type
-        first = value[0]
-        if isinstance(first, dict):
-            # Try to grab readable name
-            # Common keys: name (Person, Option), text (Text), id (sometimes)
-            extracted = []
-            for item in value:
-                val = item.get("name") or item.get("text") or item.get("email")
-                if val:
-                    extracted.append(str(val))
-                else:
-                    # Fallback to json dump of item if no simple name
-                    extracted.append(json.dumps(item, ensure_ascii=False))
-            return ", ".join(extracted)
-        else:
-            return ", ".join([str(v) for v in value])
-    
-    if isinstance(value, dict):
-         # Single object, try to get name/text
-         return value.get("name") or value.get("text") or json.dumps(value, ensure_ascii=False)
-
-    return value
+    payload = json.dumps(lark_fields, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha1((mapping_signature + payload).encode("utf-8")).hexdigest()
 
 def map_fields_to_model(model_instance, lark_fields):
     """
     Iterates over lark_fields, maps to model columns if they exist.
+    Legacy per-instance mapping (re-inspects the model for every record).
+    The sync uses FieldMappingPlan instead; kept for scripts and as benchmark baseline.
     """
     # Get all valid column names from the model
     # SQLAlchemy inspection or dir()
@@ -105,36 +130,199 @@ def map_fields_to_model(model_instance, lark_fields):
         logger.debug(f"  '{key}' -> '{col_name}' [{'✓' if in_model else '✗'}]")
 
 
-def sync_lark_table(app_token: str, table_id: str, model_class, force_full: bool = False):
+def run_anomaly_detection(db: Session = None):
+    """Refreshes ticket anomalies (after TP / TCG sync)."""
+    close_session = False
+    if db is None:
+        db = SessionLocal()
+        close_session = True
+
+    logger.info("Triggering Anomaly Detection...")
+    try:
+        with sync_write_lock:
+            anomaly_service = AnomalyService(db)
+            anomaly_service.refresh_anomalies()
+        logger.info("Anomaly Detection Finished.")
+    except Exception as ae:
+        db.rollback()
+        logger.error(f"Anomaly Detection Failed: {ae}")
+    finally:
+        if close_session:
+            db.close()
+
+_END_OF_PAGES = object()
+
+def _put_page(pages: queue.Queue, item, stop_event: threading.Event) -> bool:
+    """Blocks while the queue is full (back-pressure). Returns False if the sync was cancelled."""
+    while not stop_event.is_set():
+        try:
+            pages.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+def _fetch_pages(app_token: str, table_id: str, filter_obj, pages: queue.Queue, stop_event: threading.Event):
+    """
+    Producer side of the sync pipeline: follows page_token and puts (page_token, items)
+    into the queue, then _END_OF_PAGES. Errors are put into the queue for the writer to raise.
+    """
+    page_token = None
+    try:
+        while not stop_event.is_set():
+            # Pass filter_obj (dict) or None
+            resp = list_records(app_token, table_id, filter_obj, page_token, page_size=LARK_PAGE_SIZE)
+
+            if resp and resp.get("code") not in (None, 0):
+                raise RuntimeError(f"Lark list_records failed: {resp}")
+
+            if not resp or "items" not in resp:
+                logger.warning(f"No items found or error: {resp}")
+                break
+
+            if not _put_page(pages, (page_token, resp.get("items", [])), stop_event):
+                return
+
+            # Pagination handling
+            if not resp.get("has_more", False):
+                break
+            page_token = resp.get("page_token")
+            if not page_token:
+                logger.warning("has_more=True but no page_token. Stopping pagination.")
+                break
+            logger.info("Fetching next page...")
+    except Exception as e:
+        _put_page(pages, e, stop_event)
+        return
+    _put_page(pages, _END_OF_PAGES, stop_event)
+
+def _write_page(db: Session, model_class, records, mapping_plan, removed_tickets_set, force_full: bool = False):
+    """
+    Maps and bulk-writes one page of Lark records (caller commits).
+    Records whose stored fields_hash matches are skipped, except on a forced full sync
+    (which re-maps every record, e.g. to repair rows).
+    Returns (page_stats, max 'Updated Date' seen in the page, affected TP numbers).
+    Affected TP numbers are the TPs whose completion may have changed:
+    TCG -> old and new tp_number of every written ticket, TP -> ticket_number of every written TP.
+    """
+    # One query to find which records of this page already exist (with their hash)
+    existing_columns = ["fields_hash"]
+    if model_class == LarkModelTCG:
+        existing_columns.append("tp_number")
+    existing = fetch_existing(
+        db, model_class, [item["record_id"] for item in records], *existing_columns
+    )
+
+    rows = []
+    skipped = 0
+    max_seen = None
+    affected_tps = set()
+    for item in records:
+        record_id = item["record_id"]
+        fields = item["fields"]
+
+        updated_date = fields.get("Updated Date")
+        if isinstance(updated_date, (int, float)) and (max_seen is None or updated_date > max_seen):
+            max_seen = int(updated_date)
+
+        # Check if ticket matches a removed ticket (TCG specific)
+        if model_class == LarkModelTCG:
+            # Field name usually 'TCG Tickets' or 'TCG Ticket'
+            raw_ticket_val = fields.get("TCG Tickets") or fields.get("TCG Ticket")
+            if raw_ticket_val:
+                # extract_lark_value handles the list/dict formats. Usually 1 ticket.
+                ticket_num_str = extract_lark_value(raw_ticket_val)
+                if ticket_num_str in removed_tickets_set:
+                    logger.debug(f"Skipping removed ticket: {ticket_num_str}")
+                    continue
+
+        # Unchanged payload and mapping -> nothing to map or write
+        fields_hash = compute_fields_hash(fields, mapping_plan.signature)
+        if not force_full and record_id in existing and existing[record_id].fields_hash == fields_hash:
+            skipped += 1
+            continue
+
+        # Every Lark-mapped column: Lark omits empty fields, so a field cleared in Lark
+        # is absent from the payload and has to be written as NULL
+        row = dict.fromkeys(mapping_plan.lark_columns)
+        row.update(mapping_plan.map_row(fields))
+        row["record_id"] = record_id
+        row["updated_at"] = fields.get("Updated Date", 0)
+        row["fields_hash"] = fields_hash
+        if model_class == LarkModelTP:
+            # Parsed once here so dashboard queries can GROUP BY / filter in SQL
+            row.update(release_columns(row["released_date"]))
+        for source, key_column in getattr(model_class, "key_columns", {}).items():
+            # Indexed equality lookups instead of ILIKE case folding
+            row[key_column] = ticket_key(row[source])
+        rows.append(row)
+
+        if model_class == LarkModelTCG:
+            affected_tps.add(row.get("tp_number"))
+            if record_id in existing:
+                # Ticket moved to another TP (or lost its TP): the old TP changes too
+                affected_tps.add(existing[record_id].tp_number)
+        elif model_class == LarkModelTP:
+            affected_tps.add(row.get("ticket_number"))
+
+    # One INSERT ... ON CONFLICT DO UPDATE for the whole page
+    page_stats = bulk_upsert_page(db, model_class, rows, existing, mapping_plan.write_columns)
+    page_stats["skipped"] = skipped
+
+    # Keep tcg_ticket_links in step with parent_tickets of the written tickets
+    if model_class == LarkModelTCG:
+        replace_ticket_links(db, {row["record_id"]: row.get("parent_tickets") for row in rows})
+    # ... and ticket_people with the assignee / resolved_by Person fields
+    if model_class == LarkModelTCG:
+        replace_ticket_people(db, rows)
+    # ... and the ticket_search full-text index (re-read from the upserted rows)
+    if model_class in (LarkModelTCG, LarkModelTP):
+        replace_ticket_search(db, model_class, [row["record_id"] for row in rows])
+    affected_tps.discard(None)
+    affected_tps.discard("")
+    return page_stats, max_seen, affected_tps
+
+def sync_lark_table(app_token: str, table_id: str, model_class, force_full: bool = False,
+                    detect_anomalies: bool = True):
+    """
+    Syncs one Lark Bitable table into its local model table.
+    Each fetched page is written with one bulk upsert.
+    Records whose raw payload hash matches the stored 'fields_hash' are skipped (unless force_full).
+    Pages are fetched by a background thread into a bounded queue and written here
+    (producer/consumer); page writes are serialized by sync_write_lock, so several
+    tables can be fetched concurrently.
+    detect_anomalies=False leaves anomaly detection to the caller (see sync_orchestrator).
+    Returns {"fetched", "inserted", "updated", "unchanged", "skipped"} counts, or None on error.
+    """
     table_name = model_class.__tablename__
     logger.info(f"Starting sync for table: {table_name} ({table_id}) [Force Full: {force_full}]")
     
     db = SessionLocal()
+    started = time.time()
     try:
-        latest_timestamp = None
-        if not force_full:
-                latest_timestamp = get_latest_update_time(db, model_class)
+        with sync_write_lock:
+            state = get_sync_state(db, table_name)
+            state.last_status = "running"
+            state.last_started_at = int(started * 1000)
+            state.last_error = None
+            db.commit()
+
+        # Watermark = max 'Updated Date' of the last successful run.
+        # Bootstrap from the data already in the table when there is no state yet.
+        watermark = state.watermark
+        if watermark is None and not force_full:
+            watermark = get_latest_update_time(db, model_class)
         
         # Prepare filter for incremental sync
         filter_obj = None
-        if latest_timestamp and not force_full:
-             # Sync records updated since yesterday (buffer for safety)
-             one_day_ago_ms = int((datetime.now() - timedelta(days=1)).timestamp() * 1000)
-             filter_dt = datetime.fromtimestamp(one_day_ago_ms/1000)
-             date_str = filter_dt.strftime('%Y/%m/%d %H:%M:%S')
-             # Construct JSON filter object for Lark Search API
-             # Requirement: ["ExactDate", timestamp_ms] for DateTime fields with isGreater
-             filter_obj = {
-                 "conjunction": "and",
-                 "conditions": [
-                     {
-                         "field_name": "Updated Date",
-                         "operator": "isGreater",
-                         "value": ["ExactDate", one_day_ago_ms]
-                     }
-                 ]
-             }
-             logger.info(f"Incremental sync enabled. Filter: Updated Date > {date_str} (Timestamp: {one_day_ago_ms})")
+        if watermark and not force_full:
+             since_ms = int(watermark) - SYNC_WATERMARK_OVERLAP_MINUTES * 60 * 1000
+             date_str = datetime.fromtimestamp(since_ms / 1000).strftime('%Y/%m/%d %H:%M:%S')
+             filter_obj = build_incremental_filter(since_ms)
+             logger.info(
+                 f"Incremental sync enabled. Filter: Updated Date > {date_str} "
+                 f"(Watermark: {watermark}, Overlap: {SYNC_WATERMARK_OVERLAP_MINUTES} min)"
+             )
         else:
              logger.info("Full sync: Fetching all records.")
 
@@ -146,104 +334,133 @@ def sync_lark_table(app_token: str, table_id: str, model_class, force_full: bool
             if removed_tickets_set:
                 logger.info(f"Loaded {len(removed_tickets_set)} removed tickets to ignore.")
 
-        has_more = True
-        page_token = None
+        # Compiled once per model class, reused for every record
+        mapping_plan = get_mapping_plan(model_class)
+
         total_fetched = 0
-        
-        while has_more:
-             # Pass filter_obj (dict) or None
-             resp = list_records(app_token, table_id, filter_obj, page_token)
-             
-             if not resp or "items" not in resp:
-                 logger.warning(f"No items found or error: {resp}")
-                 break
-                 
-             records = resp.get("items", [])
-             total_fetched += len(records)
-             logger.info(f"Fetched {len(records)} records (Total: {total_fetched})")
-             
-             for item in records:
-                 record_id = item["record_id"]
-                 fields = item["fields"]
-                 
-                 # Check if ticket matches a removed ticket (TCG specific)
-                 if model_class == LarkModelTCG:
-                     # Attempt to find ticket number from fields
-                     # Field name usually 'TCG Tickets' or 'TCG Ticket'
-                     # Helper to extract value regardless of exact case/naming if possible, 
-                     # but here we need to match what map_fields_to_model does or check raw field.
-                     # From models.py: tcg_tickets. Lark field likely "TCG Tickets"
-                     raw_ticket_val = fields.get("TCG Tickets") or fields.get("TCG Ticket")
-                     if raw_ticket_val:
-                         # normalize/extract string value similar to extract_lark_value logic?
-                         # Or just check simple string. extract_lark_value handles lists.
-                         # Let's use extract_lark_value to be safe on the format
-                         ticket_num_str = extract_lark_value(raw_ticket_val)
-                         # If it's a list string "TCG-123, TCG-456", might be tricky. usually 1 ticket.
-                         # Split and check?
-                         # Assuming simple case for now.
-                         if ticket_num_str in removed_tickets_set:
-                             logger.debug(f"Skipping removed ticket: {ticket_num_str}")
-                             continue
-
-                 updated_at_val = fields.get("Updated Date", 0) 
-                 
-                 existing = db.query(model_class).filter(model_class.record_id == record_id).first()
-                 
-                 if existing:
-                     # Update
-                     instance = existing
-                     instance.updated_at = updated_at_val
-                     # We might want to clear old fields if not utilizing JSON column anymore
-                     # Or just overwrite attributes
-                 else:
-                     # Insert
-                     instance = model_class(
-                         record_id=record_id,
-                         updated_at=updated_at_val
-                     )
-                     db.add(instance)
-                
-                 # Perform mapping
-                 map_fields_to_model(instance, fields)
-                 
-                 # Also save raw fields into 'fields' JSON column if it exists in model (LarkBase has it)
-                 if hasattr(instance, "fields"):
-                     instance.fields = fields
-
-             db.commit()
-             
-             # Pagination handling
-             has_more = resp.get("has_more", False)
-             if has_more:
-                 page_token = resp.get("page_token")
-                 if not page_token:
-                     logger.warning("has_more=True but no page_token. Stopping pagination.")
-                     break
-                 logger.info("Fetching next page...")
-             else:
-                 logger.info(f"✓ Sync complete. Total: {total_fetched} records")
-                 break 
+        page_count = 0
+        max_seen = None
+        totals = {"inserted": 0, "updated": 0, "unchanged": 0, "skipped": 0}
+        affected_tps = set()
+
+        # Pipeline: a fetcher thread reads pages ahead into a bounded queue
+        # while this thread writes them, so network and disk I/O overlap.
+        pages = queue.Queue(maxsize=SYNC_PAGE_QUEUE_SIZE)
+        stop_event = threading.Event()
+        fetcher = threading.Thread(
+            target=_fetch_pages,
+            args=(app_token, table_id, filter_obj, pages, stop_event),
+            name=f"lark-fetch-{table_name}",
+            daemon=True
+        )
+        fetcher.start()
+        try:
+            while True:
+                try:
+                    item = pages.get(timeout=SYNC_PAGE_POLL_SECONDS)
+                except queue.Empty:
+                    # A fetcher that died without its end marker / error would block us forever
+                    if not fetcher.is_alive() and pages.empty():
+                        raise RuntimeError(f"Lark page fetcher for {table_name} stopped before the last page")
+                    continue
+                if item is _END_OF_PAGES:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+
+                page_token, records = item
+                total_fetched += len(records)
+                logger.info(f"Fetched {len(records)} records (Total: {total_fetched})")
+
+                with sync_write_lock:
+                    page_stats, page_max, page_tps = _write_page(
+                        db, model_class, records, mapping_plan, removed_tickets_set, force_full
+                    )
+                    state.last_page_token = page_token
+                    if page_stats["inserted"] or page_stats["updated"]:
+                        # Cached API responses built from this table are stale once this commits
+                        bump_generation(db, table_name)
+                    db.commit()
+
+                if page_max is not None and (max_seen is None or page_max > max_seen):
+                    max_seen = page_max
+
+                affected_tps |= page_tps
+                page_count += 1
+                for k, v in page_stats.items():
+                    totals[k] += v
+                logger.info(
+                    f"Page {page_count}: inserted {page_stats['inserted']}, "
+                    f"updated {page_stats['updated']}, unchanged {page_stats['unchanged']}, "
+                    f"skipped (same hash) {page_stats['skipped']}"
+                )
+        finally:
+            # Cancels the fetcher if the writer stopped early (error), then waits for it
+            stop_event.set()
+            fetcher.join()
+
+        logger.info(
+            f"✓ Sync complete. Total: {total_fetched} records "
+            f"(inserted {totals['inserted']}, updated {totals['updated']}, "
+            f"unchanged {totals['unchanged']}, skipped {totals['skipped']})"
+        )
+
+        # Event-driven completion: recompute only the TPs touched by this sync
+        # (the hourly full calculate_tp_completion stays as reconciliation)
+        if affected_tps:
+            calculate_tp_completion(db, tp_numbers=affected_tps)
         
         # Trigger Anomaly Detection if syncing TCG (or post-sync generally)
-        if model_class == LarkModelTCG or model_class == LarkModelTP:
-            logger.info("Triggering Anomaly Detection...")
-            try:
-                anomaly_service = AnomalyService(db)
-                anomaly_service.refresh_anomalies()
-                logger.info("Anomaly Detection Finished.")
-            except Exception as ae:
-                logger.error(f"Anomaly Detection Failed: {ae}")
+        if detect_anomalies and model_class in (LarkModelTCG, LarkModelTP):
+            run_anomaly_detection(db)
+
+        # Advance the watermark only after a complete, successful run
+        with sync_write_lock:
+            if max_seen is not None and (state.watermark is None or max_seen > state.watermark):
+                state.watermark = max_seen
+            state.last_status = "success"
+            state.last_finished_at = int(time.time() * 1000)
+            state.last_duration_ms = int((time.time() - started) * 1000)
+            state.last_fetched = total_fetched
+            db.commit()
+
+        totals["fetched"] = total_fetched
+        return totals
 
     except Exception as e:
         logger.error(f"Error executing sync_lark_table: {e}", exc_info=True)
+        _record_sync_failure(db, table_name, started, e)
     finally:
         db.close()
 
+def _record_sync_failure(db: Session, table_name: str, started: float, error: Exception):
+    """Stores a failed run in sync_state (watermark is left untouched)."""
+    try:
+        db.rollback()
+        with sync_write_lock:
+            state = get_sync_state(db, table_name)
+            state.last_status = "failed"
+            state.last_error = str(error)[:2000]
+            state.last_finished_at = int(time.time() * 1000)
+            state.last_duration_ms = int((time.time() - started) * 1000)
+            db.commit()
+    except Exception as se:
+        logger.error(f"Failed to record sync state for {table_name}: {se}")
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
 def sync_jira_verification():
     """
     Verifies active TCG tickets (not Closed) against Jira.
-    If a ticket returns 404 Not Found from Jira, it is deleted from the local DB.
+    Tickets are checked in batches with JQL `key in (...)` (JIRA_VERIFY_CHUNK_SIZE keys per query)
+    on a bounded worker pool (JIRA_VERIFY_WORKERS). Keys are compared in canonical form (ticket_key).
+    - Keys found -> local jira_status refreshed from Jira.
+    - Keys missing from a successful batch are confirmed one by one with jira.issue():
+      404 -> deleted from the local DB and added to the Removed list;
+      found under another key (issue moved to another project) -> ticket renamed to the new key.
+    Chunks / confirmations that fail are left untouched.
     """
     logger.info("Starting Jira Verification Job...")
     from backend.shared.integration.jira_client import JiraService
@@ -257,60 +474,154 @@ def sync_jira_verification():
     try:
         # 1. Fetch active tickets (jira_status != 'Closed')
         # Note: adjust filter if 'Closed' case sensitivity varies (e.g. 'closed', 'Done')
-        active_tickets = db.query(LarkModelTCG).filter(LarkModelTCG.jira_status != 'Closed').all()
+        active_tickets = db.query(
+            LarkModelTCG.record_id, LarkModelTCG.tcg_tickets, LarkModelTCG.jira_status, LarkModelTCG.tp_number
+        ).filter(LarkModelTCG.jira_status != 'Closed').all()
         logger.info(f"Found {len(active_tickets)} active tickets to verify.")
-        
-        deleted_count = 0
-        verified_count = 0
-        
-        for ticket in active_tickets:
-            ticket_number = ticket.tcg_tickets
-            if not ticket_number:
-                continue
-
-            # Verify with Jira
-            issue = jira_service.get_ticket(ticket_number)
-            
-            if issue is None:
-                # 404 Not Found -> Delete
-                logger.warning(f"Ticket {ticket_number} not found in Jira. Deleting from DB and adding to Removed list.")
-                
-                # Add to Removed Tickets table
+
+        # Canonical key -> local tickets (' tcg-1' and 'TCG-1' are the same Jira issue)
+        tickets_by_key = {}
+        for t in active_tickets:
+            key = ticket_key(t.tcg_tickets)
+            if key:
+                tickets_by_key.setdefault(key, []).append(t)
+        ticket_numbers = sorted(tickets_by_key)
+        chunks = list(_chunks(ticket_numbers, JIRA_VERIFY_CHUNK_SIZE))
+
+        # 2. Batched JQL lookups on a bounded pool
+        found_statuses = {}
+        verified_keys = set()
+        failed_chunks = 0
+        with ThreadPoolExecutor(max_workers=JIRA_VERIFY_WORKERS, thread_name_prefix="jira-verify") as pool:
+            futures = {pool.submit(jira_service.get_ticket_statuses, chunk): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                chunk = futures[future]
                 try:
-                    removed_ticket = TCGRemovedTickets(
-                        ticket_number=ticket_number,
-                        deleted_at=int(time.time() * 1000)
-                    )
-                    db.add(removed_ticket)
-                    # Commit strictly after adding to ensure it's saved even if verification crashes later? 
-                    # Actually we commit at the end.
+                    statuses = future.result()
                 except Exception as e:
-                    logger.error(f"Failed to add {ticket_number} to removed list: {e}")
+                    failed_chunks += 1
+                    logger.error(f"Jira batch lookup failed for {len(chunk)} tickets ({chunk[0]}..): {e}")
+                    continue
+                if statuses is None:
+                    failed_chunks += 1
+                    continue
+                found_statuses.update(statuses)
+                verified_keys.update(chunk)
 
-                db.delete(ticket)
-                deleted_count += 1
-            else:
-                verified_count += 1
-            
-            # Rate limiting / Sleep to be nice
-            if verified_count % 10 == 0:
-                time.sleep(0.5)
+        # 3. Confirm the keys missing from a successful batch one by one before deleting anything:
+        # jira.issue() follows moved issues, only a 404 means the ticket is gone
+        unconfirmed = sorted(k for k in verified_keys if k not in found_statuses)
+        missing_keys = set()
+        moved_keys = {}  # old key -> new key
+        failed_confirmations = 0
+        if unconfirmed:
+            with ThreadPoolExecutor(max_workers=JIRA_VERIFY_WORKERS, thread_name_prefix="jira-confirm") as pool:
+                futures = {pool.submit(jira_service.get_ticket, key): key for key in unconfirmed}
+                for future in as_completed(futures):
+                    key = futures[future]
+                    try:
+                        issue = future.result()
+                    except Exception as e:
+                        failed_confirmations += 1
+                        logger.error(f"Jira lookup failed for {key}, keeping it: {e}")
+                        continue
+                    if issue is None:
+                        missing_keys.add(key)
+                        continue
+                    found_statuses[key] = issue.fields.status.name
+                    if ticket_key(issue.key) != key:
+                        moved_keys[key] = ticket_key(issue.key)
+
+        # 4. Apply: delete missing tickets, rename moved ones, refresh jira_status of the others
+        deleted = [t for key in missing_keys for t in tickets_by_key[key]]
+        deleted_ids = [t.record_id for t in deleted]
+        changed = [
+            t for key, tickets in tickets_by_key.items() if key in found_statuses
+            for t in tickets if found_statuses[key] != t.jira_status
+        ]
+        status_updates = [
+            {"b_record_id": t.record_id, "b_jira_status": found_statuses[ticket_key(t.tcg_tickets)]} for t in changed
+        ]
+        moved = [(t, new_key) for key, new_key in moved_keys.items() for t in tickets_by_key[key]]
+        key_updates = [
+            {"b_record_id": t.record_id, "b_tcg_tickets": new_key, "b_tcg_ticket_key": ticket_key(new_key)}
+            for t, new_key in moved
+        ]
+        affected_tps = {t.tp_number for t in deleted + changed if t.tp_number}
+
+        with sync_write_lock:
+            if missing_keys:
+                for key in sorted(missing_keys):
+                    logger.warning(f"Ticket {key} not found in Jira. Deleting from DB and adding to Removed list.")
+                now_ms = int(time.time() * 1000)
+                # Stored as written locally: sync skips Lark records by this exact value
+                db.execute(
+                    sqlite_insert(TCGRemovedTickets).on_conflict_do_nothing(index_elements=["ticket_number"]),
+                    [{"ticket_number": number, "deleted_at": now_ms} for number in sorted({t.tcg_tickets for t in deleted})]
+                )
+                db.query(LarkModelTCG).filter(LarkModelTCG.record_id.in_(deleted_ids)).delete(synchronize_session=False)
+                delete_ticket_links(db, deleted_ids)
+                delete_ticket_people(db, deleted_ids)
+                delete_ticket_search(db, LarkModelTCG, deleted_ids)
 
-        db.commit()
-        logger.info(f"Jira Verification Complete. Verified: {verified_count}, Deleted: {deleted_count}")
+            tcg_table = LarkModelTCG.__table__
+            if status_updates:
+                db.execute(
+                    tcg_table.update()
+                    .where(tcg_table.c.record_id == bindparam("b_record_id"))
+                    .values(jira_status=bindparam("b_jira_status")),
+                    status_updates
+                )
+            if key_updates:
+                for t, new_key in moved:
+                    logger.warning(f"Ticket {t.tcg_tickets} moved in Jira to {new_key}. Recording it under the new key.")
+                db.execute(
+                    tcg_table.update()
+                    .where(tcg_table.c.record_id == bindparam("b_record_id"))
+                    .values(tcg_tickets=bindparam("b_tcg_tickets"), tcg_ticket_key=bindparam("b_tcg_ticket_key")),
+                    key_updates
+                )
+                replace_ticket_search(db, LarkModelTCG, [t.record_id for t, _ in moved])
+            if deleted_ids or status_updates or key_updates:
+                bump_generation(db, LarkModelTCG.__tablename__)
+            db.commit()
+
+        logger.info(
+            f"Jira Verification Complete. Verified: {len(found_statuses)}, Deleted: {len(deleted_ids)}, "
+            f"Moved: {len(key_updates)}, Status refreshed: {len(status_updates)}, "
+            f"Failed chunks: {failed_chunks}/{len(chunks)}, Failed confirmations: {failed_confirmations}"
+        )
+
+        if affected_tps:
+            calculate_tp_completion(db, tp_numbers=affected_tps)
 
     except Exception as e:
+        db.rollback()
         logger.error(f"Error in sync_jira_verification: {e}", exc_info=True)
     finally:
         db.close()
 
-def calculate_tp_completion(db: Session = None):
+def calculate_tp_completion(db: Session = None, tp_numbers=None):
     """
-    Calculates completion percentage for 'In Progress' TP Projects.
-    Formula: Count(Closed Tickets) / Count(Total Tickets) * 100
-    Updates 'completed_percentage' column in TP_Projects.
+    Calculates completion percentages for 'In Progress' TP Projects.
+    tp_numbers limits the calculation to those TPs (event-driven recompute after a sync);
+    None recalculates every In Progress TP (hourly reconciliation).
+    Formula: Count(Closed Tickets) / Count(Total Tickets) * 100, split into
+    FE (components contain "TAD TAC UI") and BE (everything else).
+    Updates completed_percentage / fe_completed_percentage / be_completed_percentage /
+    fe_status_all_open in TP_Projects.
+
+    Runs as a single UPDATE ... FROM (GROUP BY tp_number aggregate) statement;
+    only rows whose values change are written. TPs without tickets get 0% / False.
+    Returns the number of updated TP rows.
     """
-    logger.info("Starting TP Completion Calculation Job...")
+    if tp_numbers is not None:
+        tp_numbers = sorted({t for t in tp_numbers if t})
+        if not tp_numbers:
+            return 0
+        logger.info(f"Recalculating TP Completion for {len(tp_numbers)} affected TPs...")
+    else:
+        logger.info("Starting TP Completion Calculation Job...")
     
     # If db session is not provided, create a new one (for scheduler usage)
     close_session = False
@@ -318,105 +629,92 @@ def calculate_tp_completion(db: Session = None):
         db = SessionLocal()
         close_session = True
         
+    updated = 0
     try:
-        # 1. Get all In Progress TPs
-        # Note: Checking multiple potential status fields based on models.py
-        # jira_status seems to be the main status field for TPs usually, or 'status' if it existed.
-        # models.py has 'jira_status'. Requirement says "status 'In Progress'".
-        # I will assume jira_status is the one.
-        in_progress_tps = db.query(LarkModelTP).filter(LarkModelTP.jira_status == "In Progress").all()
-        logger.info(f"Found {len(in_progress_tps)} In Progress TPs to calculate.")
-        
-        updates_count = 0
-        
-        for tp in in_progress_tps:
-            tp_number = tp.ticket_number
-            if not tp_number:
-                continue
-                
-            # 2. Find linked TCG Tickets
-            # Assuming LarkModelTCG.tp_number links to LarkModelTP.ticket_number
-            tickets = db.query(LarkModelTCG).filter(LarkModelTCG.tp_number == tp_number).all()
-            
-            total_tickets = len(tickets)
-            if total_tickets == 0:
-                # No tickets, percentage is 0 (or keep as is? Requirement implies calculation)
-                # If no tickets, technically completion is 0% or N/A. Let's set to 0.
-                new_percentage = 0
+        with sync_write_lock:
+            if tp_numbers is None:
+                updated = db.execute(build_tp_completion_update()).rowcount
             else:
-                # 3. Partition into FE and BE
-                # Rule: Component contains "TAD TAC UI" -> FE, Else -> BE
-                fe_tickets = []
-                be_tickets = []
-                
-                for t in tickets:
-                    comps = t.components or ""
-                    if "TAD TAC UI" in comps:
-                        fe_tickets.append(t)
-                    else:
-                        be_tickets.append(t)
-
-                # 4. Calculate FE Stats
-                fe_total = len(fe_tickets)
-                new_fe_percentage = 0
-                new_fe_all_open = False
-                
-                if fe_total > 0:
-                    fe_closed = len([t for t in fe_tickets if t.jira_status == "Closed"])
-                    new_fe_percentage = int((fe_closed / fe_total) * 100)
-                    
-                    # Check if all are Open
-                    # Case sensitive check for "Open"
-                    fe_open_count = len([t for t in fe_tickets if t.jira_status == "Open"])
-                    if fe_open_count == fe_total:
-                        new_fe_all_open = True
-                else:
-                    # No FE tickets -> 0% progress, and technically "all open" is false or n/a? 
-                    # If no tasks, then the condition "frontend tasks completed % is 0 and status are all Open" 
-                    # might be implicitly true or false depending on interpretation.
-                    # If no tasks, % is 0. Status is N/A. Let's set 'all open' to False to avoid blinking if no tasks exist.
-                    new_fe_percentage = 0
-                    new_fe_all_open = False
-
-                # 5. Calculate BE Stats
-                be_total = len(be_tickets)
-                new_be_percentage = 0
-                if be_total > 0:
-                    be_closed = len([t for t in be_tickets if t.jira_status == "Closed"])
-                    new_be_percentage = int((be_closed / be_total) * 100)
-
-                
-                # 6. Overall Stats (Existing logic, kept consistent but maybe re-calculated from total)
-                closed_tickets = [t for t in tickets if t.jira_status == "Closed"]
-                closed_count = len(closed_tickets)
-                new_percentage = int((closed_count / total_tickets) * 100)
-            
-            # Update fields
-            changed = False
-            if tp.completed_percentage != new_percentage:
-                tp.completed_percentage = new_percentage
-                changed = True
-            
-            if tp.fe_completed_percentage != new_fe_percentage:
-                tp.fe_completed_percentage = new_fe_percentage
-                changed = True
-                
-            if tp.be_completed_percentage != new_be_percentage:
-                tp.be_completed_percentage = new_be_percentage
-                changed = True
-                
-            if tp.fe_status_all_open != new_fe_all_open:
-                tp.fe_status_all_open = new_fe_all_open
-                changed = True
-
-            if changed:
-                updates_count += 1
-                
-        db.commit()
-        logger.info(f"TP Completion Calculation Fininshed. Updated {updates_count} records.")
+                # Chunked to stay below SQLite's bound-parameter limit
+                for chunk in _chunks(tp_numbers, TP_COMPLETION_CHUNK_SIZE):
+                    updated += db.execute(build_tp_completion_update(chunk)).rowcount
+            if updated:
+                bump_generation(db, LarkModelTP.__tablename__)
+            db.commit()
+        logger.info(f"TP Completion Calculation Fininshed. Updated {updated} records.")
         
     except Exception as e:
+        db.rollback()
         logger.error(f"Error in calculate_tp_completion: {e}", exc_info=True)
     finally:
         if close_session:
             db.close()
+    return updated
+
+def build_tp_completion_update(tp_numbers=None):
+    """
+    UPDATE tp_projects SET <percentages> FROM (
+        SELECT tp.ticket_number, conditional counts ...
+        FROM <In Progress TP numbers> LEFT JOIN tcg_tickets ON tcg.tp_number = tp.ticket_number
+        GROUP BY tp.ticket_number
+    ) WHERE tp_projects.ticket_number = agg.ticket_number AND <any value changed>
+    tp_numbers restricts the statement to those TP ticket numbers.
+    """
+    tp = LarkModelTP.__table__
+    tcg = LarkModelTCG.__table__
+
+    # Ticket numbers of In Progress TPs (distinct, so duplicate TP rows do not multiply the counts)
+    tp_filter = [tp.c.jira_status == "In Progress", tp.c.ticket_number.is_not(None), tp.c.ticket_number != ""]
+    if tp_numbers is not None:
+        tp_filter.append(tp.c.ticket_number.in_(tp_numbers))
+    tp_keys = (
+        select(tp.c.ticket_number)
+        .where(*tp_filter)
+        .distinct()
+        .subquery("tp_keys")
+    )
+
+    # FE rule: Component contains "TAD TAC UI" (case-sensitive, like the Python `in` check it replaces)
+    is_fe = func.coalesce(func.instr(tcg.c.components, "TAD TAC UI"), 0) > 0
+    is_be = ~is_fe
+    is_closed = tcg.c.jira_status == "Closed"
+
+    def count_if(*conditions):
+        return func.coalesce(func.sum(case((and_(*conditions), 1), else_=0)), 0)
+
+    agg = (
+        select(
+            tp_keys.c.ticket_number.label("tp_number"),
+            func.count(tcg.c.record_id).label("total"),
+            count_if(is_closed).label("closed"),
+            count_if(is_fe).label("fe_total"),
+            count_if(is_fe, is_closed).label("fe_closed"),
+            count_if(is_fe, tcg.c.jira_status == "Open").label("fe_open"),
+            count_if(is_be).label("be_total"),
+            count_if(is_be, is_closed).label("be_closed"),
+        )
+        .select_from(tp_keys.outerjoin(tcg, tcg.c.tp_number == tp_keys.c.ticket_number))
+        .group_by(tp_keys.c.ticket_number)
+        .subquery("agg")
+    )
+
+    def percentage(part, whole):
+        # Integer division == int(part / whole * 100) for non-negative counts
+        return case((whole > 0, (part * 100) // whole), else_=0)
+
+    new_values = {
+        "completed_percentage": percentage(agg.c.closed, agg.c.total),
+        "fe_completed_percentage": percentage(agg.c.fe_closed, agg.c.fe_total),
+        "be_completed_percentage": percentage(agg.c.be_closed, agg.c.be_total),
+        "fe_status_all_open": and_(agg.c.fe_total > 0, agg.c.fe_open == agg.c.fe_total),
+    }
+
+    return (
+        update(tp)
+        .where(
+            tp.c.ticket_number == agg.c.tp_number,
+            tp.c.jira_status == "In Progress",
+            or_(*[tp.c[column].is_distinct_from(value) for column, value in new_values.items()])
+        )
+        .values(**new_values)
+    )
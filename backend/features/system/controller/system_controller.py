@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from backend.shared.database import engine, SessionLocal
+from backend.shared.database import read_engine, ReadSessionLocal
 from backend.shared.integration.lark_client import list_records
 from pydantic import BaseModel
 from sqlalchemy import text, inspect
@@ -24,13 +24,13 @@ def get_lark_data(app_token: str, table_id: str):
 
 @router.get("/db/tables")
 def get_tables():
-    inspector = inspect(engine)
+    inspector = inspect(read_engine)
     tables = inspector.get_table_names()
     return {"tables": tables}
 
 @router.post("/db/query")
 def execute_sql_query(query: SqlQuery):
-    db = SessionLocal()
+    db = ReadSessionLocal()
     try:
         # Sanitize somewhat or just run (Admin only feature)
         # Using pagination with wrapping
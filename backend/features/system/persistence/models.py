@@ -6,6 +6,7 @@ class LarkModelDept(Base):
 
     record_id = Column(String, primary_key=True, index=True)
     updated_at = Column(BigInteger)
+    fields_hash = Column(String) # Hash of raw Lark fields (change detection)
     
     # Specific Fields
     dept_id = Column(Text)
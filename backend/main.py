@@ -19,12 +19,14 @@ from fastapi.responses import FileResponse
 
 # Import needed for sync jobs in lifespan
 # Import needed for sync jobs in lifespan
-from backend.features.sync.service.sync_service import sync_lark_table, calculate_tp_completion
+from backend.features.sync.service.sync_service import calculate_tp_completion
+from backend.features.sync.service.sync_orchestrator import run_sync_cycle
 # Ensure all models are imported for Base.metadata.create_all
-from backend.features.project.persistence.models import LarkModelTP, LarkModelTCG, LarkModelProgram, TicketAnomaly
+from backend.features.project.persistence.models import LarkModelTP, LarkModelTCG, LarkModelProgram, TicketAnomaly, TCGTicketLink, TicketPerson, TicketSearchDoc
 from backend.features.member.persistence.models import LarkModelMember
 from backend.features.auth.persistence.models import AdminUser
 from backend.features.system.persistence.models import LarkModelDept
+from backend.features.sync.persistence.models import SyncState
 
 # Logging Config
 logging.basicConfig(
@@ -39,29 +41,10 @@ Base.metadata.create_all(bind=engine)
 # Scheduler Setup
 scheduler = BackgroundScheduler()
 
-# Env Config for Scheduler
-TP_APP_TOKEN = os.getenv("TP_APP_TOKEN")
-TP_TABLE_ID = os.getenv("TP_TABLE_ID")
-TCG_APP_TOKEN = os.getenv("TCG_APP_TOKEN")
-TCG_TABLE_ID = os.getenv("TCG_TABLE_ID")
-MEMBER_APP_TOKEN = os.getenv("MEMBER_APP_TOKEN")
-MEMBER_TABLE_ID = os.getenv("MEMBER_TABLE_ID")
-PROGRAM_APP_TOKEN = os.getenv("PROGRAM_APP_TOKEN")
-PROGRAM_TABLE_ID = os.getenv("PROGRAM_TABLE_ID")
-
 def run_sync_jobs(force_full: bool = False):
     logger.info(f"Running sync jobs... (Force Full: {force_full})")
-    sync_lark_table(TP_APP_TOKEN, TP_TABLE_ID, LarkModelTP, force_full=force_full)
-    sync_lark_table(TP_APP_TOKEN, TP_TABLE_ID, LarkModelTP, force_full=force_full)
-    sync_lark_table(TCG_APP_TOKEN, TCG_TABLE_ID, LarkModelTCG, force_full=force_full)
-    
-    # Program Sync
-    if PROGRAM_APP_TOKEN and PROGRAM_TABLE_ID:
-        sync_lark_table(PROGRAM_APP_TOKEN, PROGRAM_TABLE_ID, LarkModelProgram, force_full=force_full)
-
-    # Member Info Sync (15 min interval via scheduler)
-    if MEMBER_APP_TOKEN and MEMBER_TABLE_ID:
-        sync_lark_table(MEMBER_APP_TOKEN, MEMBER_TABLE_ID, LarkModelMember, force_full=force_full)
+    # TP, TCG, Program and Member tables are fetched concurrently (see sync_orchestrator)
+    run_sync_cycle(force_full=force_full)
 
 # Import Startup Scripts
 from backend.scripts.db_migrations import run_all_migrations as run_db_migration
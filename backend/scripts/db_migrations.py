@@ -7,6 +7,12 @@ if __name__ == "__main__":
 
 from sqlalchemy import text
 from backend.shared.database import engine
+from backend.features.sync.persistence.ticket_links import parse_ticket_keys
+from backend.features.sync.persistence.ticket_people import PERSON_ROLES, split_people
+from backend.features.sync.persistence.ticket_search import rebuild_ticket_search
+from backend.features.project.persistence.models import create_ticket_search_table, ticket_key
+from backend.features.project.service.project_service import release_columns
+from backend.shared.response_cache import bump_generation
 import logging
 
 logger = logging.getLogger(__name__)
@@ -89,6 +95,239 @@ def migrate_ticket_anomalies(conn):
     except Exception as e:
         logger.error(f"Ticket Anomaly Migration failed: {e}")
 
+def migrate_sync_hash_columns(conn):
+    """Ensure 'fields_hash' (sync change detection) exists on every Lark synced table."""
+    for table in ["tp_projects", "tcg_tickets", "tp_program", "member_info", "tcg_dept"]:
+        try:
+            result = conn.execute(text(f"PRAGMA table_info({table})"))
+            columns = [row.name for row in result]
+            if not columns:
+                continue  # Table not created yet
+
+            if 'fields_hash' not in columns:
+                logger.info(f"Adding 'fields_hash' column to '{table}' table...")
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN fields_hash VARCHAR"))
+                logger.info("Column 'fields_hash' added successfully.")
+        except Exception as e:
+            logger.error(f"Sync Hash Migration failed for {table}: {e}")
+
+def migrate_sync_state_generation(conn):
+    """Ensure 'data_generation' (response cache / ETag invalidation) exists on sync_state."""
+    try:
+        result = conn.execute(text("PRAGMA table_info(sync_state)"))
+        columns = [row.name for row in result]
+        if not columns:
+            return  # Table not created yet
+
+        if 'data_generation' not in columns:
+            logger.info("Adding 'data_generation' column to 'sync_state' table...")
+            conn.execute(text("ALTER TABLE sync_state ADD COLUMN data_generation BIGINT DEFAULT 0"))
+            logger.info("Column 'data_generation' added successfully.")
+    except Exception as e:
+        logger.error(f"Sync State Generation Migration failed: {e}")
+
+def migrate_tcg_ticket_links(conn):
+    """Backfill 'tcg_ticket_links' from tcg_tickets.parent_tickets (new table, empty on first start)."""
+    try:
+        result = conn.execute(text("PRAGMA table_info(tcg_ticket_links)"))
+        if not list(result):
+            return  # Table not created yet
+
+        link_count = conn.execute(text("SELECT COUNT(*) FROM tcg_ticket_links")).scalar()
+        if link_count:
+            # Parent keys used to be stored as written: upper-case them (see parse_ticket_keys)
+            upgraded = conn.execute(text(
+                "UPDATE OR IGNORE tcg_ticket_links SET parent_ticket = UPPER(parent_ticket) "
+                "WHERE parent_ticket != UPPER(parent_ticket)"
+            )).rowcount
+            # Left over: duplicates of a link that already existed upper-cased
+            conn.execute(text("DELETE FROM tcg_ticket_links WHERE parent_ticket != UPPER(parent_ticket)"))
+            if upgraded:
+                logger.info(f"Upper-cased {upgraded} parent keys in 'tcg_ticket_links'.")
+            return  # Already populated (maintained by sync from now on)
+
+        rows = conn.execute(text(
+            "SELECT record_id, parent_tickets FROM tcg_tickets "
+            "WHERE parent_tickets IS NOT NULL AND parent_tickets != ''"
+        )).fetchall()
+        links = [
+            {"parent_ticket": parent, "child_record_id": row.record_id}
+            for row in rows
+            for parent in parse_ticket_keys(row.parent_tickets)
+        ]
+        if links:
+            logger.info(f"Backfilling {len(links)} rows into 'tcg_ticket_links'...")
+            conn.execute(
+                text("INSERT OR IGNORE INTO tcg_ticket_links (parent_ticket, child_record_id) VALUES (:parent_ticket, :child_record_id)"),
+                links
+            )
+            logger.info("Ticket links backfilled successfully.")
+    except Exception as e:
+        logger.error(f"Ticket Links Migration failed: {e}")
+
+def migrate_ticket_people(conn):
+    """Backfill 'ticket_people' from tcg_tickets.assignee / resolved_by (new table, empty on first start)."""
+    try:
+        result = conn.execute(text("PRAGMA table_info(ticket_people)"))
+        if not list(result):
+            return  # Table not created yet
+
+        people_count = conn.execute(text("SELECT COUNT(*) FROM ticket_people")).scalar()
+        if people_count:
+            return  # Already populated (maintained by sync from now on)
+
+        rows = conn.execute(text(
+            "SELECT record_id, assignee, resolved_by FROM tcg_tickets "
+            "WHERE assignee IS NOT NULL OR resolved_by IS NOT NULL"
+        )).fetchall()
+        people = [
+            {"ticket_record_id": row.record_id, "role": role, "person": person}
+            for row in rows
+            for role in PERSON_ROLES
+            for person in split_people(getattr(row, role))
+        ]
+        if people:
+            logger.info(f"Backfilling {len(people)} rows into 'ticket_people'...")
+            conn.execute(
+                text("INSERT OR IGNORE INTO ticket_people (ticket_record_id, role, person) VALUES (:ticket_record_id, :role, :person)"),
+                people
+            )
+            logger.info("Ticket people backfilled successfully.")
+    except Exception as e:
+        logger.error(f"Ticket People Migration failed: {e}")
+
+def migrate_tp_release_columns(conn):
+    """Add 'released_at' / 'released_quarter' (parsed released_date) to tp_projects and backfill them."""
+    try:
+        result = conn.execute(text("PRAGMA table_info(tp_projects)"))
+        columns = [row.name for row in result]
+        if not columns:
+            return  # Table not created yet
+
+        if 'released_at' not in columns:
+            logger.info("Adding 'released_at' column to 'tp_projects' table...")
+            conn.execute(text("ALTER TABLE tp_projects ADD COLUMN released_at BIGINT"))
+        if 'released_quarter' not in columns:
+            logger.info("Adding 'released_quarter' column to 'tp_projects' table...")
+            conn.execute(text("ALTER TABLE tp_projects ADD COLUMN released_quarter VARCHAR"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_tp_projects_released_at ON tp_projects (released_at)"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_tp_projects_released_quarter ON tp_projects (released_quarter)"))
+
+        rows = conn.execute(text(
+            "SELECT record_id, released_date FROM tp_projects "
+            "WHERE released_date IS NOT NULL AND released_date != '' AND released_at IS NULL"
+        )).fetchall()
+        updates = []
+        for row in rows:
+            values = release_columns(row.released_date)
+            if values["released_at"] is not None:
+                updates.append({"record_id": row.record_id, **values})
+        if updates:
+            logger.info(f"Backfilling released_at / released_quarter for {len(updates)} TPs...")
+            conn.execute(
+                text("UPDATE tp_projects SET released_at = :released_at, released_quarter = :released_quarter WHERE record_id = :record_id"),
+                updates
+            )
+            bump_generation(conn, "tp_projects")
+            logger.info("Release columns backfilled successfully.")
+    except Exception as e:
+        logger.error(f"TP Release Columns Migration failed: {e}")
+
+# Indexes for the columns the hot queries filter / join on (same names as the models' index=True / __table_args__)
+HOT_QUERY_INDEXES = [
+    ("ix_tcg_tickets_tcg_tickets", "tcg_tickets", ["tcg_tickets"]),
+    ("ix_tcg_tickets_tp_number_jira_status", "tcg_tickets", ["tp_number", "jira_status"]),
+    ("ix_tcg_tickets_jira_status_sort_order", "tcg_tickets", ["jira_status", "sort_order"]),
+    ("ix_tp_projects_ticket_number", "tp_projects", ["ticket_number"]),
+    ("ix_tp_projects_jira_status_sort_order", "tp_projects", ["jira_status", "sort_order"]),
+    ("ix_tp_program_program_title", "tp_program", ["program_title"]),
+    ("ix_member_info_department", "member_info", ["department"]),
+    ("ix_member_info_name", "member_info", ["name"]),
+    ("ix_ticket_anomalies_department", "ticket_anomalies", ["department"]),
+]
+
+def migrate_hot_query_indexes(conn):
+    """Create the hot query indexes on existing databases (create_all only adds them to new tables)."""
+    for name, table, columns in HOT_QUERY_INDEXES:
+        try:
+            result = conn.execute(text(f"PRAGMA table_info({table})"))
+            if not list(result):
+                continue  # Table not created yet
+
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = :name"), {"name": name}
+            ).first()
+            if not exists:
+                logger.info(f"Creating index '{name}' on '{table}' ({', '.join(columns)})...")
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"))
+        except Exception as e:
+            logger.error(f"Index Migration failed for {name}: {e}")
+
+# table -> [(key column, source column)] (canonical lookup keys, see models.ticket_key)
+TICKET_KEY_COLUMNS = {
+    "tp_projects": [("ticket_number_key", "ticket_number")],
+    "tcg_tickets": [("tp_number_key", "tp_number"), ("tcg_ticket_key", "tcg_tickets")],
+}
+
+def migrate_ticket_key_columns(conn):
+    """
+    Add the NOCASE ticket key columns and their indexes, and (re)fill every key that differs
+    from ticket_key(source) (missing keys, keys stored before padding was stripped).
+    """
+    for table, key_columns in TICKET_KEY_COLUMNS.items():
+        try:
+            result = conn.execute(text(f"PRAGMA table_info({table})"))
+            columns = [row.name for row in result]
+            if not columns:
+                continue  # Table not created yet
+
+            for key_column, source in key_columns:
+                if key_column not in columns:
+                    logger.info(f"Adding '{key_column}' column to '{table}' table...")
+                    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {key_column} VARCHAR COLLATE NOCASE"))
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{table}_{key_column} ON {table} ({key_column})"))
+                # SQL pre-filter (BINARY: the NOCASE key column would hide case differences),
+                # ticket_key decides what is stored
+                candidates = conn.execute(text(
+                    f"SELECT record_id, {source} AS source, {key_column} AS stored FROM {table} "
+                    f"WHERE {key_column} IS NOT NULLIF(UPPER(TRIM({source}, :blank)), '') COLLATE BINARY"
+                ), {"blank": " \t\r\n\f\v\u00a0\u3000"}).fetchall()
+                updates = [
+                    {"b_record_id": row.record_id, "b_key": ticket_key(row.source)}
+                    for row in candidates if ticket_key(row.source) != row.stored
+                ]
+                if updates:
+                    conn.execute(
+                        text(f"UPDATE {table} SET {key_column} = :b_key WHERE record_id = :b_record_id"),
+                        updates
+                    )
+                backfilled = len(updates)
+                if backfilled:
+                    bump_generation(conn, table)
+                    logger.info(f"Backfilled '{key_column}' for {backfilled} rows in '{table}'.")
+        except Exception as e:
+            logger.error(f"Ticket Key Migration failed for {table}: {e}")
+
+def migrate_ticket_search(conn):
+    """Create the 'ticket_search' FTS5 index and backfill it from TCG / TP (empty on first start)."""
+    try:
+        result = conn.execute(text("PRAGMA table_info(ticket_search_docs)"))
+        if not list(result):
+            return  # Table not created yet
+
+        create_ticket_search_table(conn)
+        doc_count = conn.execute(text("SELECT COUNT(*) FROM ticket_search_docs")).scalar()
+        if doc_count:
+            return  # Already populated (maintained by sync from now on)
+
+        logger.info("Backfilling 'ticket_search' full-text index...")
+        indexed = rebuild_ticket_search(conn)
+        # ETags of the search endpoint depend on the ticket tables
+        bump_generation(conn, "tcg_tickets", "tp_projects")
+        logger.info(f"Ticket search index backfilled with {indexed} tickets.")
+    except Exception as e:
+        logger.error(f"Ticket Search Migration failed: {e}")
+
 def run_all_migrations():
     """Run all database migrations."""
     logger.info("--- Starting Database Migrations ---")
@@ -96,6 +335,14 @@ def run_all_migrations():
         migrate_rbac(conn)
         migrate_tp_projects(conn)
         migrate_ticket_anomalies(conn)
+        migrate_sync_hash_columns(conn)
+        migrate_sync_state_generation(conn)
+        migrate_tcg_ticket_links(conn)
+        migrate_ticket_people(conn)
+        migrate_tp_release_columns(conn)
+        migrate_hot_query_indexes(conn)
+        migrate_ticket_key_columns(conn)
+        migrate_ticket_search(conn)
         conn.commit()
     logger.info("--- Database Migrations Completed ---")
 
@@ -0,0 +1,101 @@
+import time
+import uuid
+import hashlib
+from fastapi import Depends, HTTPException, Request, Response
+from fastapi.routing import APIRoute
+from backend.shared.response_cache import data_generations
+
+# Per process: ETags of a previous run (possibly older code, another response format) never match
+BOOT_NONCE = uuid.uuid4().hex
+
+
+def compute_etag(request: Request, tables, ttl: float = None):
+    """
+    Weak ETag of a GET response: data generations of the tables it reads, path + query
+    parameters, a hash of the Authorization header and the boot nonce.
+    ttl adds a time bucket for responses that depend on the current time.
+    None when the generations cannot be read (no ETag, no 304).
+    """
+    generations = data_generations.get(tables)
+    if generations is None:
+        return None
+    auth_hash = hashlib.sha256(request.headers.get("authorization", "").encode()).hexdigest()
+    parts = [
+        BOOT_NONCE,
+        repr(generations),
+        str(int(time.time() // ttl)) if ttl else "",
+        request.url.path,
+        repr(sorted(request.query_params.multi_items())),
+        auth_hash
+    ]
+    return 'W/"' + hashlib.sha1("|".join(parts).encode()).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    # "*" is not honoured: it would answer 304 without comparing anything
+    if not if_none_match:
+        return False
+    # Weak comparison (RFC 9110): ignore the W/ prefix
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def etag_precondition(tables, ttl: float = None):
+    """
+    Dependency answering a conditional GET: stores the current ETag on request.state and
+    raises a 304 (empty body) when If-None-Match matches it. ETagRoute declares it after every
+    router dependency, so authentication (get_current_user) has run first.
+    """
+    def check_etag(request: Request):
+        etag = compute_etag(request, tables, ttl)
+        request.state.etag = etag
+        if etag and etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=304, headers=etag_headers(etag))
+
+    check_etag.etag_precondition = True
+    return check_etag
+
+
+def etag_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": "private, no-cache", "Vary": "Authorization"}
+
+
+class ETagRoute(APIRoute):
+    """
+    Route class for routers whose GET endpoints declare their tables
+    (@cached_endpoint / @depends_on_tables).
+    If-None-Match matching the current ETag -> 304 Not Modified once the router dependencies
+    (authentication) have run, before the endpoint's queries or serialization.
+    Other responses get ETag + Cache-Control: no-cache, so browsers revalidate on every poll.
+    The ETag includes the Authorization hash, so a 304 is only produced for a request
+    carrying the same token that received the original (authenticated) response.
+    """
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        tables = getattr(endpoint, "data_tables", None)
+        methods = {m.upper() for m in (kwargs.get("methods") or ["GET"])}
+        # include_router puts the router dependencies (get_current_user) before these, so the
+        # precondition runs after authentication. FastAPI versions that re-create the route on
+        # include pass our precondition back in: drop it and append it again, last.
+        dependencies = [
+            d for d in (kwargs.get("dependencies") or [])
+            if not getattr(d.dependency, "etag_precondition", False)
+        ]
+        if tables is not None and "GET" in methods:
+            dependencies.append(Depends(etag_precondition(tables, getattr(endpoint, "data_ttl", None))))
+        kwargs["dependencies"] = dependencies
+        super().__init__(path, endpoint, **kwargs)
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        if getattr(self.endpoint, "data_tables", None) is None or "GET" not in self.methods:
+            return handler
+
+        async def etag_route_handler(request: Request) -> Response:
+            response = await handler(request)
+            etag = getattr(request.state, "etag", None)
+            if response.status_code == 200 and etag:
+                response.headers.update(etag_headers(etag))
+            return response
+
+        return etag_route_handler
@@ -1,17 +1,77 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 import os
+import threading
 
 # Default to current directory, but allow override (e.g., /app/data for Railway Volume)
 DB_DIR = os.getenv("DB_DIR", ".")
 SQLALCHEMY_DATABASE_URL = f"sqlite:///{os.path.join(DB_DIR, 'sql_app.db')}"
+# Same file opened read-only (API reads); uri=true lets sqlite3 parse the file: URI
+SQLALCHEMY_READ_DATABASE_URL = f"sqlite:///file:{os.path.join(DB_DIR, 'sql_app.db')}?mode=ro&uri=true"
+
+# SQLite connection settings (applied to every new pooled connection)
+# WAL: readers never block the writer and the writer never blocks readers
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+# NORMAL is durable in WAL mode except for the last transactions on power loss
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+# Page cache per connection in KiB (negative PRAGMA cache_size = KiB)
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_TEMP_STORE = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
+# How long a connection waits for a lock before "database is locked"
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+# Read-only pool size (API request threads)
+SQLITE_READ_POOL_SIZE = int(os.getenv("SQLITE_READ_POOL_SIZE", "10"))
 
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000}
+)
+
+# Reads (GET endpoints) use their own pool on a read-only connection: with WAL they read
+# the last committed snapshot and never wait on the sync writer.
+# The file must exist before the first read (create_all runs on the writer engine at startup).
+read_engine = create_engine(
+    SQLALCHEMY_READ_DATABASE_URL,
+    connect_args={"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000},
+    pool_size=SQLITE_READ_POOL_SIZE
 )
+
+def _set_common_pragmas(cursor):
+    cursor.execute(f"PRAGMA cache_size={-SQLITE_CACHE_SIZE_KB}")
+    cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+    cursor.execute(f"PRAGMA temp_store={SQLITE_TEMP_STORE}")
+    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+        _set_common_pragmas(cursor)
+    finally:
+        cursor.close()
+
+@event.listens_for(read_engine, "connect")
+def _set_sqlite_read_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        # journal_mode is stored in the file (set by the writer); query_only rejects any write
+        cursor.execute("PRAGMA query_only=1")
+        _set_common_pragmas(cursor)
+    finally:
+        cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+# SQLite has a single writer: background jobs (sync pages, completion, anomalies, Jira verification)
+# and API writes take this lock around their write transaction instead of racing for the file lock.
+# Not reentrant: never call a function that takes it while holding it.
+db_write_lock = threading.Lock()
 
 Base = declarative_base()
 
@@ -22,3 +82,11 @@ def get_db():
         yield db
     finally:
         db.close()
+
+# Dependency (GET endpoints)
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
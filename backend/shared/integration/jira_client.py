@@ -1,6 +1,8 @@
 import os
 from jira import JIRA
 import logging
+from backend.shared.integration.rate_limiter import rate_limiter
+from backend.features.project.persistence.models import ticket_key
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +33,7 @@ class JiraService:
             return None
         
         try:
+            rate_limiter.acquire("jira.default")
             issue = self.jira.issue(ticket_number)
             return issue
         except Exception as e:
@@ -39,3 +42,30 @@ class JiraService:
                 return None # Not found
             logger.error(f"Error fetching ticket {ticket_number}: {e}")
             raise e
+
+    def get_ticket_statuses(self, ticket_numbers):
+        """
+        Batch lookup via JQL `key in (...)`, fetching only the key and status fields.
+        Returns {key: status_name} keyed by the canonical (ticket_key()) key Jira returned.
+        A requested key missing from the result is not necessarily deleted: an issue moved to
+        another project comes back under its new key (confirm with get_ticket).
+        """
+        if not self.jira:
+            logger.warning("Jira client not initialized.")
+            return None
+
+        keys = sorted({ticket_key(k) for k in ticket_numbers if ticket_key(k)})
+        if not keys:
+            return {}
+
+        quoted = ", ".join('"' + k.replace('"', '') + '"' for k in keys)
+        rate_limiter.acquire("jira.search")
+        # validate_query=False: unknown keys become warnings instead of failing the whole query
+        issues = self.jira.search_issues(
+            f"key in ({quoted})",
+            maxResults=False,  # page through results when the server caps the page size
+            validate_query=False,
+            fields="status",
+            use_post=True
+        )
+        return {ticket_key(issue.key): issue.fields.status.name for issue in issues}
@@ -1,11 +1,13 @@
 import lark_oapi as lark
-from lark_oapi.api.bitable.v1 import *
 import os
-import json
+import logging
 from dotenv import load_dotenv
+from backend.shared.integration.lark_transport import lark_transport, LarkTransportError
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 APP_ID = os.getenv("LARK_APP_ID")
 APP_SECRET = os.getenv("LARK_APP_SECRET")
 
@@ -13,61 +15,46 @@ APP_SECRET = os.getenv("LARK_APP_SECRET")
 # Using FEISHU (CN) domain by default. Use lark.Lark.open_platform('https://open.larksuite.com') for global.
 LARK_DOMAIN = os.getenv("LARK_DOMAIN", "https://open.larksuite.com")
 
+# SDK client, kept for ad-hoc inspection scripts (inspect_lark_fields.py).
+# DEBUG logs every request/response body, so it is opt-in via LARK_SDK_LOG_LEVEL.
 client = lark.Client.builder() \
     .app_id(APP_ID) \
     .app_secret(APP_SECRET) \
     .domain(LARK_DOMAIN) \
-    .log_level(lark.LogLevel.DEBUG) \
+    .log_level(getattr(lark.LogLevel, os.getenv("LARK_SDK_LOG_LEVEL", "WARNING").upper(), lark.LogLevel.WARNING)) \
     .build()
 
-def list_records(app_token: str, table_id: str, filter_info: str = None, page_token: str = None):
+def list_records(app_token: str, table_id: str, filter_info=None, page_token: str = None, page_size: int = None):
+    """
+    Bitable search (one page). filter_info is the Search API filter object (dict).
+    Returns the response data dict (items / has_more / page_token / total),
+    or {"code", "msg", "error"} on failure.
+    """
     # Mock response if no credentials (for safety during dev if env vars missing)
     if not APP_ID or not APP_SECRET:
         return {"code": -1, "msg": "LARK_APP_ID or LARK_APP_SECRET not set in .env"}
 
-    req_body_builder = SearchAppTableRecordRequestBody.builder()
-    if filter_info:
-        if isinstance(filter_info, dict):
-            # If it's a dict, use filter_object (for advanced filtering like date)
-            # Note: The SDK might expect 'filter' to be the object structure directly
-            # Checking SDK docs: request_body builder likely has .filter(str) but we need .filter_object(dict)?
-            # SDK source check: SearchAppTableRecordRequestBody has `filter` property which takes string.
-            # But the bitable API allows JSON object for filter. 
-            # We likely need to pass it as part of the body construction manually or find SDK method.
-            # Assuming SDK method .filter() accepts both or there's .filter_object().
-            # Let's try to set it directly if possible or serialize it if SDK expects string legacy filter.
-            # Actually, the newer Search API (v1) `filter` field in body can be object.
-            # Use `set_filter` method if available or assign. 
-            # Let's stick to standard builder pattern:
-            # Revisiting Lark SDK Bitable V1... likely expects proper object structure.
-            # We will assume request_body_builder has a method for this or we pass it via a workaround if needed.
-            # Wait, SearchAppTableRecordRequestBody builder usually has `.filter(FilterInfo)`
-            # Let's assume for now we pass it as a dict and the SDK handles serialization or we serialize if needed.
-            # However, simpler: The SDK `filter` param usually takes a raw JSON string for advanced filters? 
-            # Or the API spec says `filter` is an object.
-            # Let's pass the dict directly to builder.filter() and hope SDK handles it, OR better:
-            # If SDK expects string (legacy formula), we pass string. If object (new filter), we might need to verify method.
-            # Safest approach: Pass it as is. If SDK complains type error, we might need to fix.
-            req_body_builder.filter(filter_info) 
-        else:
-             req_body_builder.filter(filter_info)
-
-
-    request_builder = SearchAppTableRecordRequest.builder() \
-        .app_token(app_token) \
-        .table_id(table_id) \
-        .request_body(req_body_builder.build())
-    
-    if page_token:
-        request_builder.page_token(page_token)
+    try:
+        result = lark_transport.search_records(app_token, table_id, filter_info, page_token, page_size)
+    except LarkTransportError as e:
+        logger.error(f"Error fetching records: {e}")
+        return {"code": -1, "msg": str(e), "error": None}
 
-    request = request_builder.build()
+    if "code" in result:
+        logger.error(f"Error fetching records: code={result['code']}, msg={result['msg']}, error={result.get('error')}")
+    return result
 
-    response = client.bitable.v1.app_table_record.search(request)
+async def alist_records(app_token: str, table_id: str, filter_info=None, page_token: str = None, page_size: int = None):
+    """Async version of list_records (same return shape)."""
+    if not APP_ID or not APP_SECRET:
+        return {"code": -1, "msg": "LARK_APP_ID or LARK_APP_SECRET not set in .env"}
 
-    if not response.success():
-        print(f"Error fetching records: code={response.code}, msg={response.msg}, error={response.error}") # Add basic logging
-        return {"code": response.code, "msg": response.msg, "error": response.error}
+    try:
+        result = await lark_transport.asearch_records(app_token, table_id, filter_info, page_token, page_size)
+    except LarkTransportError as e:
+        logger.error(f"Error fetching records: {e}")
+        return {"code": -1, "msg": str(e), "error": None}
 
-    # Serialize SDK object to dict using built-in marshal
-    return json.loads(lark.JSON.marshal(response.data))
+    if "code" in result:
+        logger.error(f"Error fetching records: code={result['code']}, msg={result['msg']}, error={result.get('error')}")
+    return result
@@ -0,0 +1,303 @@
+import os
+import time
+import random
+import asyncio
+import logging
+import threading
+import weakref
+import httpx
+from dotenv import load_dotenv
+from backend.shared.integration.rate_limiter import rate_limiter
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+APP_ID = os.getenv("LARK_APP_ID")
+APP_SECRET = os.getenv("LARK_APP_SECRET")
+LARK_DOMAIN = os.getenv("LARK_DOMAIN", "https://open.larksuite.com")
+
+# Transport tuning
+LARK_HTTP_TIMEOUT = float(os.getenv("LARK_HTTP_TIMEOUT", "30"))
+LARK_HTTP_MAX_CONNECTIONS = int(os.getenv("LARK_HTTP_MAX_CONNECTIONS", "10"))
+LARK_MAX_RETRIES = int(os.getenv("LARK_MAX_RETRIES", "5"))
+LARK_RETRY_BACKOFF_SECONDS = float(os.getenv("LARK_RETRY_BACKOFF_SECONDS", "0.5"))
+LARK_RETRY_MAX_DELAY_SECONDS = float(os.getenv("LARK_RETRY_MAX_DELAY_SECONDS", "30"))
+# Refresh the tenant_access_token this many seconds before it expires
+LARK_TOKEN_REFRESH_MARGIN_SECONDS = int(os.getenv("LARK_TOKEN_REFRESH_MARGIN_SECONDS", "300"))
+
+TENANT_TOKEN_PATH = "/open-apis/auth/v3/tenant_access_token/internal"
+
+# Lark business codes
+LARK_CODE_RATE_LIMITED = 99991400
+LARK_CODES_INVALID_TOKEN = {99991661, 99991663, 99991668}
+
+
+class LarkTransportError(Exception):
+    """Raised when a Lark call fails after all retries (network error or HTTP error status)."""
+
+
+class TenantTokenCache:
+    """
+    Caches the tenant_access_token (valid ~2h) and refreshes it before expiry,
+    instead of requesting a new one for every call.
+    """
+
+    def __init__(self, refresh_margin: int = LARK_TOKEN_REFRESH_MARGIN_SECONDS):
+        self.refresh_margin = refresh_margin
+        self._token = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def current(self):
+        """Cached token, or None if missing / about to expire."""
+        if self._token and time.time() < self._expires_at - self.refresh_margin:
+            return self._token
+        return None
+
+    def store(self, body: dict) -> str:
+        if body.get("code") != 0 or not body.get("tenant_access_token"):
+            raise LarkTransportError(f"Failed to get Tenant Token: {body}")
+        with self._lock:
+            self._token = body["tenant_access_token"]
+            self._expires_at = time.time() + int(body.get("expire", 7200))
+        return self._token
+
+    def invalidate(self):
+        with self._lock:
+            self._token = None
+            self._expires_at = 0.0
+
+
+def _retry_delay(attempt: int, response: httpx.Response = None) -> float:
+    """
+    Delay before the next attempt. Honors Lark rate-limit headers
+    (x-ogw-ratelimit-reset / Retry-After, in seconds) when present,
+    otherwise exponential backoff with jitter.
+    """
+    if response is not None:
+        for header in ("x-ogw-ratelimit-reset", "Retry-After"):
+            value = response.headers.get(header)
+            if value:
+                try:
+                    return min(float(value), LARK_RETRY_MAX_DELAY_SECONDS)
+                except ValueError:
+                    pass
+    delay = LARK_RETRY_BACKOFF_SECONDS * (2 ** attempt)
+    delay += random.uniform(0, LARK_RETRY_BACKOFF_SECONDS)
+    return min(delay, LARK_RETRY_MAX_DELAY_SECONDS)
+
+
+def _should_retry(response: httpx.Response, body) -> bool:
+    if response.status_code == 429 or response.status_code >= 500:
+        return True
+    return isinstance(body, dict) and body.get("code") == LARK_CODE_RATE_LIMITED
+
+
+def _rate_limit_endpoint(path: str) -> str:
+    """Rate limiter budget name of a Lark API path."""
+    if path == TENANT_TOKEN_PATH:
+        return "lark.auth"
+    if path.endswith("/records/search"):
+        return "lark.bitable.search"
+    return "lark.default"
+
+
+def _decode(response: httpx.Response):
+    try:
+        return response.json()
+    except ValueError:
+        return None
+
+
+class LarkTransport:
+    """
+    Shared HTTP transport for the Lark Open API.
+    - keep-alive connection pool (httpx), sync and async API
+    - cached tenant_access_token, refreshed before expiry
+    - every attempt goes through the shared client-side rate limiter
+    - retry with exponential backoff + jitter on 429 / 5xx / Lark rate-limit code
+    - responses decoded straight to dict (no SDK marshal / json.loads round-trip)
+    """
+
+    def __init__(self, domain: str = LARK_DOMAIN, app_id: str = APP_ID, app_secret: str = APP_SECRET):
+        self.domain = domain.rstrip("/")
+        self.app_id = app_id
+        self.app_secret = app_secret
+        self.token_cache = TenantTokenCache()
+        self._limits = httpx.Limits(
+            max_connections=LARK_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=LARK_HTTP_MAX_CONNECTIONS
+        )
+        self._client = None
+        self._client_lock = threading.Lock()
+        # httpx.AsyncClient is bound to the event loop it was used on
+        self._async_clients = weakref.WeakKeyDictionary()
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.app_id and self.app_secret)
+
+    # --- Clients ---
+
+    def _get_client(self) -> httpx.Client:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=self.domain, timeout=LARK_HTTP_TIMEOUT, limits=self._limits
+                    )
+        return self._client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(base_url=self.domain, timeout=LARK_HTTP_TIMEOUT, limits=self._limits)
+            self._async_clients[loop] = client
+        return client
+
+    def close(self):
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self):
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    # --- Tenant token ---
+
+    def _token_request_body(self) -> dict:
+        return {"app_id": self.app_id, "app_secret": self.app_secret}
+
+    def get_tenant_access_token(self) -> str:
+        token = self.token_cache.current()
+        if token:
+            return token
+        body = self.request("POST", TENANT_TOKEN_PATH, json=self._token_request_body(), auth=False)
+        return self.token_cache.store(body)
+
+    async def aget_tenant_access_token(self) -> str:
+        token = self.token_cache.current()
+        if token:
+            return token
+        body = await self.arequest("POST", TENANT_TOKEN_PATH, json=self._token_request_body(), auth=False)
+        return self.token_cache.store(body)
+
+    # --- Requests ---
+
+    def request(self, method: str, path: str, params: dict = None, json: dict = None, auth: bool = True) -> dict:
+        """Sends one Lark API call with retries. Returns the decoded JSON body."""
+        client = self._get_client()
+        endpoint = _rate_limit_endpoint(path)
+        token_refreshed = False
+        attempt = 0
+        while True:
+            headers = {"Content-Type": "application/json; charset=utf-8"}
+            if auth:
+                headers["Authorization"] = f"Bearer {self.get_tenant_access_token()}"
+            rate_limiter.acquire(endpoint)
+            try:
+                response = client.request(method, path, params=params, json=json, headers=headers)
+            except httpx.TransportError as e:
+                if attempt >= LARK_MAX_RETRIES:
+                    raise LarkTransportError(f"{method} {path} failed: {e}") from e
+                delay = _retry_delay(attempt)
+                logger.warning(f"Lark {method} {path} network error ({e}), retry in {delay:.2f}s")
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            body = _decode(response)
+            if auth and not token_refreshed and isinstance(body, dict) and body.get("code") in LARK_CODES_INVALID_TOKEN:
+                self.token_cache.invalidate()
+                token_refreshed = True
+                continue
+            if _should_retry(response, body) and attempt < LARK_MAX_RETRIES:
+                delay = _retry_delay(attempt, response)
+                logger.warning(f"Lark {method} {path} -> HTTP {response.status_code}, retry in {delay:.2f}s")
+                time.sleep(delay)
+                attempt += 1
+                continue
+            return self._finish(method, path, response, body)
+
+    async def arequest(self, method: str, path: str, params: dict = None, json: dict = None, auth: bool = True) -> dict:
+        """Async version of request()."""
+        client = self._get_async_client()
+        endpoint = _rate_limit_endpoint(path)
+        token_refreshed = False
+        attempt = 0
+        while True:
+            headers = {"Content-Type": "application/json; charset=utf-8"}
+            if auth:
+                headers["Authorization"] = f"Bearer {await self.aget_tenant_access_token()}"
+            await rate_limiter.acquire_async(endpoint)
+            try:
+                response = await client.request(method, path, params=params, json=json, headers=headers)
+            except httpx.TransportError as e:
+                if attempt >= LARK_MAX_RETRIES:
+                    raise LarkTransportError(f"{method} {path} failed: {e}") from e
+                delay = _retry_delay(attempt)
+                logger.warning(f"Lark {method} {path} network error ({e}), retry in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            body = _decode(response)
+            if auth and not token_refreshed and isinstance(body, dict) and body.get("code") in LARK_CODES_INVALID_TOKEN:
+                self.token_cache.invalidate()
+                token_refreshed = True
+                continue
+            if _should_retry(response, body) and attempt < LARK_MAX_RETRIES:
+                delay = _retry_delay(attempt, response)
+                logger.warning(f"Lark {method} {path} -> HTTP {response.status_code}, retry in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            return self._finish(method, path, response, body)
+
+    def _finish(self, method: str, path: str, response: httpx.Response, body):
+        if body is None:
+            raise LarkTransportError(f"{method} {path} -> HTTP {response.status_code}: {response.text[:500]}")
+        if response.status_code >= 400 and "code" not in body:
+            raise LarkTransportError(f"{method} {path} -> HTTP {response.status_code}: {body}")
+        return body
+
+    # --- Bitable ---
+
+    @staticmethod
+    def _search_args(app_token: str, table_id: str, filter_info=None, page_token: str = None, page_size: int = None):
+        path = f"/open-apis/bitable/v1/apps/{app_token}/tables/{table_id}/records/search"
+        params = {}
+        if page_token:
+            params["page_token"] = page_token
+        if page_size:
+            params["page_size"] = page_size
+        body = {}
+        if filter_info:
+            body["filter"] = filter_info
+        return path, params, body
+
+    @staticmethod
+    def _search_result(body: dict) -> dict:
+        if body.get("code") != 0:
+            return {"code": body.get("code"), "msg": body.get("msg"), "error": body.get("error")}
+        return body.get("data") or {}
+
+    def search_records(self, app_token: str, table_id: str, filter_info=None, page_token: str = None, page_size: int = None) -> dict:
+        """
+        Bitable app_table_record/search. Returns the response 'data' dict
+        (items / has_more / page_token / total) or {"code", "msg", "error"} on a Lark error.
+        """
+        path, params, body = self._search_args(app_token, table_id, filter_info, page_token, page_size)
+        return self._search_result(self.request("POST", path, params=params, json=body))
+
+    async def asearch_records(self, app_token: str, table_id: str, filter_info=None, page_token: str = None, page_size: int = None) -> dict:
+        path, params, body = self._search_args(app_token, table_id, filter_info, page_token, page_size)
+        return self._search_result(await self.arequest("POST", path, params=params, json=body))
+
+
+# Process-wide transport (one connection pool + one token cache)
+lark_transport = LarkTransport()
@@ -0,0 +1,136 @@
+import os
+import time
+import asyncio
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Per-endpoint budgets: "<endpoint>=<requests per second>[:<burst>]", comma separated.
+# e.g. RATE_LIMITS="lark.bitable.search=15:15,jira.default=5"
+DEFAULT_RATE_LIMITS = {
+    "lark.bitable.search": (10.0, 10),
+    "lark.auth": (5.0, 5),
+    "lark.default": (10.0, 10),
+    "jira.search": (5.0, 5),
+    "jira.default": (10.0, 10),
+}
+
+def parse_rate_limits(value: str) -> dict:
+    budgets = {}
+    for part in (value or "").split(","):
+        part = part.strip()
+        if not part or "=" not in part:
+            continue
+        name, spec = part.split("=", 1)
+        try:
+            if ":" in spec:
+                rate, burst = spec.split(":", 1)
+                rate, burst = float(rate), int(burst)
+            else:
+                rate = float(spec)
+                burst = max(1, int(rate))
+        except ValueError:
+            logger.warning(f"Ignoring invalid RATE_LIMITS entry: {part}")
+            continue
+        # The bucket refills at rate/s and must hold at least one token
+        if not rate > 0 or burst < 1:
+            logger.warning(f"Ignoring invalid RATE_LIMITS entry (rate must be > 0, burst >= 1): {part}")
+            continue
+        budgets[name.strip()] = (rate, burst)
+    return budgets
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. acquire() reserves a token and sleeps (outside the lock)
+    until it is available, so callers are served in arrival order.
+    """
+
+    def __init__(self, name: str, rate: float, burst: int):
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        # Counters
+        self.acquired = 0
+        self.throttled = 0
+        self.waited_seconds = 0.0
+
+    def _reserve(self, tokens: int) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            self.acquired += tokens
+            if wait > 0:
+                self.throttled += 1
+                self.waited_seconds += wait
+            return wait
+
+    def acquire(self, tokens: int = 1) -> float:
+        """Blocks until the call fits in the budget. Returns the seconds waited."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: int = 1) -> float:
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def snapshot(self) -> dict:
+        return {
+            "rate_per_sec": self.rate,
+            "burst": self.burst,
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "waited_seconds": round(self.waited_seconds, 3)
+        }
+
+
+class RateLimiterRegistry:
+    """One bucket per endpoint, shared by every outbound Lark / Jira call in the process."""
+
+    def __init__(self, budgets: dict):
+        self.budgets = budgets
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _budget_for(self, endpoint: str):
+        if endpoint in self.budgets:
+            return endpoint, self.budgets[endpoint]
+        # Unknown endpoint -> the service's default budget ("lark.xxx" -> "lark.default")
+        fallback = f"{endpoint.split('.', 1)[0]}.default"
+        return fallback, self.budgets.get(fallback, (10.0, 10))
+
+    def get(self, endpoint: str) -> TokenBucket:
+        bucket = self._buckets.get(endpoint)
+        if bucket is None:
+            with self._lock:
+                name, (rate, burst) = self._budget_for(endpoint)
+                bucket = self._buckets.get(name)
+                if bucket is None:
+                    bucket = TokenBucket(name, rate, burst)
+                    self._buckets[name] = bucket
+                self._buckets[endpoint] = bucket
+        return bucket
+
+    def acquire(self, endpoint: str, tokens: int = 1) -> float:
+        return self.get(endpoint).acquire(tokens)
+
+    async def acquire_async(self, endpoint: str, tokens: int = 1) -> float:
+        return await self.get(endpoint).acquire_async(tokens)
+
+    def snapshot(self) -> dict:
+        buckets = {bucket.name: bucket for bucket in list(self._buckets.values())}
+        return {name: bucket.snapshot() for name, bucket in sorted(buckets.items())}
+
+
+rate_limiter = RateLimiterRegistry({**DEFAULT_RATE_LIMITS, **parse_rate_limits(os.getenv("RATE_LIMITS", ""))})
@@ -0,0 +1,191 @@
+import os
+import time
+import logging
+import threading
+from collections import OrderedDict
+from functools import wraps
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import bindparam, text
+from sqlalchemy.exc import SQLAlchemyError
+from backend.shared.database import read_engine
+
+logger = logging.getLogger(__name__)
+
+# Max cached responses (LRU); 0 disables the cache
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "256"))
+
+# Generations are stored per table in sync_state.data_generation (see SyncState)
+GENERATIONS_TABLE = "sync_state"
+
+_BUMP_SQL = text(
+    f"INSERT INTO {GENERATIONS_TABLE} (table_name, data_generation) VALUES (:table_name, 1) "
+    f"ON CONFLICT(table_name) DO UPDATE SET data_generation = COALESCE(data_generation, 0) + 1"
+)
+_GET_SQL = text(
+    f"SELECT table_name, data_generation FROM {GENERATIONS_TABLE} WHERE table_name IN :tables"
+).bindparams(bindparam("tables", expanding=True))
+_SNAPSHOT_SQL = text(
+    f"SELECT table_name, data_generation FROM {GENERATIONS_TABLE} "
+    f"WHERE data_generation IS NOT NULL ORDER BY table_name"
+)
+
+
+class DataGenerations:
+    """
+    Per-table data generation counters, kept in the database so that every process sharing
+    the file sees them (API workers, trigger_manual_sync.py, migration scripts).
+    Writers (sync pages, reorder, completion, anomaly refresh, Jira verification, backfill
+    migrations) call bump() inside their write transaction, before the commit: the new
+    generation becomes visible together with the data.
+    A response computed at generation N is stale once the generation moves.
+    """
+
+    def __init__(self, bind):
+        self.bind = bind  # Engine the generations are read from
+
+    def bump(self, db, *tables: str):
+        """db: Session / Connection of the write transaction (the caller commits)."""
+        if tables:
+            db.execute(_BUMP_SQL, [{"table_name": table} for table in tables])
+
+    def get(self, tables) -> tuple:
+        """Current generations of the tables (0 if never written); None if they cannot be read."""
+        try:
+            with self.bind.connect() as conn:
+                generations = dict(conn.execute(_GET_SQL, {"tables": list(tables)}).fetchall())
+        except SQLAlchemyError as e:
+            logger.warning(f"Data generations unavailable: {e}")
+            return None
+        return tuple(generations.get(table) or 0 for table in tables)
+
+    def snapshot(self) -> dict:
+        try:
+            with self.bind.connect() as conn:
+                return dict(conn.execute(_SNAPSHOT_SQL).fetchall())
+        except SQLAlchemyError:
+            return {}
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU of encoded endpoint responses.
+    Key: endpoint + query parameters. Each entry remembers the generations of the tables
+    it was built from; an entry whose generations moved (or whose ttl expired) is a miss
+    and gets replaced.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, generation):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == generation and (entry[1] is None or entry[1] > time.monotonic()):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[2]
+            self.misses += 1
+            return False, None
+
+    def put(self, key, generation, value, ttl: float = None):
+        if self.max_entries <= 0:
+            return
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (generation, expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "generations": data_generations.snapshot()
+        }
+
+
+data_generations = DataGenerations(read_engine)
+response_cache = ResponseCache(RESPONSE_CACHE_MAX_ENTRIES)
+
+
+def bump_generation(db, *tables: str):
+    """Marks the tables as changed, in the write transaction of db (call before the commit)."""
+    data_generations.bump(db, *tables)
+
+
+def _cache_key(endpoint: str, kwargs: dict) -> tuple:
+    # Query / path parameters only; injected dependencies (Session, current user) are not part of the key
+    params = tuple(sorted(
+        (name, value) for name, value in kwargs.items()
+        if value is None or isinstance(value, (str, int, float, bool))
+    ))
+    return (endpoint, params)
+
+
+def cached_endpoint(tables, ttl: float = None):
+    """
+    Caches a (sync) GET endpoint's encoded response until one of `tables` changes.
+    The generation is read (from the database, one primary key lookup) before the handler
+    runs, so a write that commits while the response is being built invalidates it on the
+    next request, whichever process made it. If the generations cannot be read the
+    response is computed without the cache.
+    ttl (seconds) additionally bounds the age of responses that depend on the current time.
+    """
+    tables = tuple(tables)
+
+    def decorator(func):
+        endpoint = f"{func.__module__}.{func.__qualname__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if response_cache.max_entries <= 0:
+                return func(*args, **kwargs)
+
+            generation = data_generations.get(tables)
+            if generation is None:
+                return func(*args, **kwargs)
+
+            key = _cache_key(endpoint, kwargs)
+            found, value = response_cache.get(key, generation)
+            if found:
+                return value
+
+            value = jsonable_encoder(func(*args, **kwargs))
+            response_cache.put(key, generation, value, ttl)
+            return value
+
+        wrapper.data_tables = tables
+        wrapper.data_ttl = ttl
+        return wrapper
+
+    return decorator
+
+
+def depends_on_tables(tables, ttl: float = None):
+    """
+    Declares the tables an endpoint reads without caching its response
+    (used by ETagRoute to validate conditional requests).
+    """
+    def decorator(func):
+        func.data_tables = tuple(tables)
+        func.data_ttl = ttl
+        return func
+
+    return decorator
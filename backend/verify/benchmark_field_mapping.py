@@ -0,0 +1,82 @@
+import sys
+import os
+import time
+import random
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from backend.features.project.persistence.models import LarkModelTCG
+from backend.features.sync.service.sync_service import map_fields_to_model
+from backend.features.sync.service.field_mapping import FieldMappingPlan
+
+RECORD_COUNT = int(os.getenv("BENCH_RECORDS", "50000"))
+
+def build_payload(count):
+    """Synthetic TCG payload shaped like the Lark Search API response."""
+    random.seed(42)
+    statuses = ["Open", "In Progress", "In Review", "Resolved", "Closed"]
+    people = ["Alice", "Bob", "Carol", "Dave", "Eve"]
+    payload = []
+    for i in range(count):
+        payload.append({
+            "TCG Tickets": [{"text": f"TCG-{i}", "type": "text"}],
+            "Title": [{"text": f"Ticket title {i}", "type": "text"}],
+            "Description": [{"text": "Lorem ipsum " * 10, "type": "text"}],
+            "Jira Status": random.choice(statuses),
+            "Issue Type": "Sub-task",
+            "Assignee": [{"name": random.choice(people), "email": "x@example.com"}],
+            "Reporter": [{"name": random.choice(people)}],
+            "Resolved By": [{"name": random.choice(people)}],
+            "Components": ["TAD TAC UI", "Backend"],
+            "Department": ["WRD"],
+            "TP Number": [{"text": f"TP-{i % 300}", "type": "text"}],
+            "Parent Tickets": [{"text": f"TCG-{max(i - 1, 0)}", "type": "text"}],
+            "Fix Versions": ["1.0.0"],
+            "Created": 1700000000000 + i,
+            "Resolved": 1700000500000 + i,
+            "Created Quarter": "2024 Q1",
+            "Resolved Week Num": 12,
+            "Updated Date": 1700000900000 + i,
+            "Unmapped Formula": {"type": 1, "value": [1, 2, 3]},
+            "Another Unmapped (Field)": "ignored",
+        })
+    return payload
+
+def bench_legacy(payload):
+    start = time.perf_counter()
+    for fields in payload:
+        instance = LarkModelTCG()
+        map_fields_to_model(instance, fields)
+    return time.perf_counter() - start
+
+def bench_plan(payload):
+    plan = FieldMappingPlan(LarkModelTCG)
+    start = time.perf_counter()
+    for fields in payload:
+        plan.map_row(fields)
+    return time.perf_counter() - start
+
+def check_equivalence(payload):
+    plan = FieldMappingPlan(LarkModelTCG)
+    valid_columns = [c.name for c in LarkModelTCG.__table__.columns]
+    for fields in payload[:1000]:
+        instance = LarkModelTCG()
+        map_fields_to_model(instance, fields)
+        row = plan.map_row(fields)
+        legacy = {c: getattr(instance, c) for c in valid_columns if getattr(instance, c) is not None}
+        assert legacy == row, f"Mismatch:\n{legacy}\n{row}"
+
+if __name__ == "__main__":
+    print(f"Building synthetic payload ({RECORD_COUNT} records)...")
+    payload = build_payload(RECORD_COUNT)
+
+    check_equivalence(payload)
+    print("Equivalence check passed (legacy vs plan on 1000 records).")
+
+    legacy_time = bench_legacy(payload)
+    plan_time = bench_plan(payload)
+
+    print(f"Legacy map_fields_to_model : {legacy_time:.3f}s ({RECORD_COUNT / legacy_time:,.0f} rec/s)")
+    print(f"FieldMappingPlan.map_row   : {plan_time:.3f}s ({RECORD_COUNT / plan_time:,.0f} rec/s)")
+    print(f"Speedup: {legacy_time / plan_time:.1f}x")
@@ -0,0 +1,149 @@
+import sys
+import os
+import time
+import random
+import statistics
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, or_, and_
+from sqlalchemy.orm import sessionmaker
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from backend.shared.database import Base
+from backend.features.member.persistence.models import LarkModelMember
+from backend.features.project.persistence.models import LarkModelTCG, LarkModelTP
+from backend.features.member.service.member_status_service import MemberStatusService
+from backend.features.sync.persistence.ticket_people import replace_ticket_people
+
+MEMBER_COUNT = int(os.getenv("BENCH_MEMBERS", "50"))
+TICKET_COUNT = int(os.getenv("BENCH_TICKETS", "30000"))
+TP_COUNT = int(os.getenv("BENCH_TPS", "500"))
+RUNS = int(os.getenv("BENCH_RUNS", "5"))
+DEPARTMENT = "WRD"
+
+def build_db():
+    """Temp SQLite DB with one department of MEMBER_COUNT people and TICKET_COUNT TCG tickets."""
+    engine = create_engine(f"sqlite:///{os.path.join(os.getenv('TMPDIR', '/tmp'), 'bench_member_status.db')}")
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+
+    random.seed(42)
+    # Distinct names (no name is a substring of another) so both versions return the same rows
+    names = [f"Member {i:03d}" for i in range(MEMBER_COUNT)]
+    others = [f"Other {i:03d}" for i in range(MEMBER_COUNT * 4)]
+    for i, name in enumerate(names):
+        db.add(LarkModelMember(record_id=f"mem{i}", name=name, department=DEPARTMENT, team="Team A", position="Engineer"))
+    for i in range(TP_COUNT):
+        db.add(LarkModelTP(record_id=f"tp{i}", ticket_number=f"TP-{i}", title=f"Project {i}",
+                           department=random.choice(["WRD", "PRD", "QA"]), jira_status="In Progress"))
+
+    now_ms = int(time.time() * 1000)
+    statuses = ["Open", "In Progress", "Resolved", "Closed"]
+    rows = []
+    for i in range(TICKET_COUNT):
+        people = names + others
+        row = {
+            "record_id": f"rec{i}",
+            "tcg_tickets": f"TCG-{i}",
+            "title": f"Ticket {i}",
+            "assignee": ", ".join(random.sample(people, random.choice([1, 1, 2]))),
+            "resolved_by": random.choice(people),
+            "jira_status": random.choice(statuses),
+            "tp_number": f"TP-{random.randrange(TP_COUNT)}",
+            "updated_at": now_ms - random.randrange(30 * 86400000),
+            "resolved": now_ms - random.randrange(30 * 86400000),
+        }
+        rows.append(row)
+        db.add(LarkModelTCG(**row))
+    replace_ticket_people(db, rows)
+    db.commit()
+    return db
+
+def legacy_member_status(db, department):
+    """Baseline: the per-member loop (2 ILIKE ticket queries + 1 TP query per member)."""
+    members = db.query(LarkModelMember).filter(LarkModelMember.department == department).all()
+    now = datetime.now()
+    today_midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    yesterday_ts = int((today_midnight - timedelta(days=1)).timestamp() * 1000)
+    results = []
+    for m in members:
+        member_name = m.name
+        if not member_name:
+            continue
+        tickets = db.query(LarkModelTCG).filter(
+            or_(
+                and_(LarkModelTCG.assignee.ilike(f"%{member_name}%"), LarkModelTCG.jira_status == 'In Progress'),
+                and_(LarkModelTCG.resolved_by.ilike(f"%{member_name}%"), LarkModelTCG.updated_at > yesterday_ts)
+            )
+        ).all()
+        current_tps_map = {}
+        ticket_summaries = []
+        for t in tickets:
+            if t.jira_status == 'In Progress':
+                ticket_summaries.append({"number": t.tcg_tickets, "full": f"{t.tcg_tickets} {t.title}"})
+            if t.tp_number and t.tp_number not in current_tps_map:
+                current_tps_map[t.tp_number] = {"tp_number": t.tp_number}
+        tps = []
+        if current_tps_map:
+            tps = db.query(LarkModelTP).filter(LarkModelTP.ticket_number.in_(list(current_tps_map.keys()))).all()
+            for tp in tps:
+                current_tps_map[tp.ticket_number]["department"] = tp.department
+                current_tps_map[tp.ticket_number]["title"] = tp.title
+        tp_display_list = [
+            {"number": d['tp_number'], "full": f"{d['tp_number']} {d.get('title', '')}", "department": d.get('department', '')}
+            for d in current_tps_map.values()
+        ]
+        seven_days_ago_ts = int((datetime.now() - timedelta(days=7)).timestamp() * 1000)
+        completed_tickets = db.query(LarkModelTCG).filter(
+            and_(LarkModelTCG.resolved_by.ilike(f"%{member_name}%"), LarkModelTCG.resolved > seven_days_ago_ts)
+        ).order_by(LarkModelTCG.resolved.desc()).all()
+        results.append({
+            "department": m.department,
+            "team": m.team,
+            "member_name": member_name,
+            "member_no": m.member_no,
+            "position": m.position,
+            "current_tps": tp_display_list,
+            "in_progress_tickets": ticket_summaries,
+            "completed_last_7d": [{"number": ct.tcg_tickets} for ct in completed_tickets],
+            "project_dept": ", ".join(set(tp.department for tp in tps if tp.department))
+        })
+    return results
+
+def normalize(results):
+    """Order-insensitive view (ticket order within a member is not part of the contract)."""
+    normalized = []
+    for r in results:
+        r = dict(r)
+        r["current_tps"] = sorted(r["current_tps"], key=lambda x: x["number"])
+        r["in_progress_tickets"] = sorted(r["in_progress_tickets"], key=lambda x: x["number"])
+        r["project_dept"] = sorted(r["project_dept"].split(", "))
+        normalized.append(r)
+    return sorted(normalized, key=lambda r: r["member_name"])
+
+def measure(fn):
+    timings = []
+    result = None
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return result, statistics.median(timings)
+
+if __name__ == "__main__":
+    print(f"Building DB: {MEMBER_COUNT} members, {TICKET_COUNT} tickets, {TP_COUNT} TPs...")
+    db = build_db()
+
+    legacy, legacy_ms = measure(lambda: legacy_member_status(db, DEPARTMENT))
+    batched, batched_ms = measure(lambda: MemberStatusService(db).get_department_status(DEPARTMENT))
+
+    if normalize(legacy) != normalize(batched):
+        print("FAIL: batched result differs from the legacy per-member loop")
+        sys.exit(1)
+    print("Equivalence check passed (legacy vs batched).")
+
+    print(f"Legacy per-member loop : {legacy_ms:8.1f} ms (median of {RUNS})")
+    print(f"MemberStatusService    : {batched_ms:8.1f} ms (median of {RUNS})")
+    print(f"Speedup: {legacy_ms / batched_ms:.1f}x")
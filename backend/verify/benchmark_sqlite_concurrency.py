@@ -0,0 +1,174 @@
+"""
+Read latency during a full TCG sync: tuned SQLite settings vs. the previous defaults.
+
+Each mode runs in its own process (the SQLite settings are read when backend.shared.database
+is imported):
+- baseline: rollback journal, synchronous=FULL, default cache, no mmap (the old engine setup)
+- tuned:    the defaults of backend/shared/database.py (WAL, synchronous=NORMAL, ...)
+
+In each process the fake Lark server (fake_lark_server.py) serves BENCH_RECORDS TCG records.
+After an initial sync every record is edited, then a second full sync rewrites all of them
+while BENCH_READERS threads keep running the Kanban query (tickets of one TP).
+Reports sync time and read latency p50 / p99 / max, plus "database is locked" errors.
+
+Env:
+    BENCH_RECORDS=50000   BENCH_READERS=4   BENCH_LATENCY_MS=0 (fake Lark, per call)
+"""
+import sys
+import os
+import json
+import time
+import random
+import tempfile
+import threading
+import statistics
+import subprocess
+import logging
+import urllib.request
+
+VERIFY_DIR = os.path.dirname(os.path.abspath(__file__))
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(VERIFY_DIR, '../../')))
+
+RECORDS = int(os.getenv("BENCH_RECORDS", "50000"))
+READERS = int(os.getenv("BENCH_READERS", "4"))
+LATENCY_MS = float(os.getenv("BENCH_LATENCY_MS", "0"))
+
+APP_TOKEN = "appBench"
+TABLE_ID = "tblBenchTCG"
+
+MODES = {
+    "baseline": {
+        "SQLITE_JOURNAL_MODE": "DELETE",
+        "SQLITE_SYNCHRONOUS": "FULL",
+        "SQLITE_CACHE_SIZE_KB": "2000",
+        "SQLITE_MMAP_SIZE": "0",
+        "SQLITE_TEMP_STORE": "DEFAULT",
+        "SQLITE_BUSY_TIMEOUT_MS": "5000",  # pysqlite's default timeout
+    },
+    "tuned": {},
+}
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def start_fake_lark():
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(VERIFY_DIR, "fake_lark_server.py"), "--port", "0",
+         "--latency-ms", str(LATENCY_MS)],
+        stdout=subprocess.PIPE, text=True
+    )
+    line = proc.stdout.readline().strip()
+    if not line.startswith("READY "):
+        proc.kill()
+        raise RuntimeError(f"Fake Lark server failed to start: {line!r}")
+    return proc, line.split(" ", 1)[1]
+
+
+def control(base_url, path, payload):
+    req = urllib.request.Request(
+        f"{base_url}{path}", data=json.dumps(payload).encode(), method="POST",
+        headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(req) as resp:
+        return json.loads(resp.read())
+
+
+def run_mode():
+    """Child process: one sync + concurrent readers with the SQLite settings from the env."""
+    # The fake server must be up before the backend is imported (Lark transport reads its env at import)
+    fake_proc, fake_url = start_fake_lark()
+    os.environ["LARK_DOMAIN"] = fake_url
+    os.environ["LARK_APP_ID"] = "cli_bench"
+    os.environ["LARK_APP_SECRET"] = "bench"
+    os.environ["DB_DIR"] = tempfile.mkdtemp(prefix="bench_concurrency_")
+    os.environ["RATE_LIMITS"] = "lark.bitable.search=100000:100000,lark.auth=1000:1000"
+
+    from backend.shared.database import Base, engine, SessionLocal
+    import backend.main  # noqa: F401  (registers every model on Base)
+    from backend.features.project.persistence.models import LarkModelTCG
+    from backend.features.sync.service.sync_service import sync_lark_table
+
+    logging.getLogger().setLevel(logging.WARNING)
+    try:
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        control(fake_url, f"/_fake/tables/{TABLE_ID}/generate", {"kind": "tcg", "count": RECORDS})
+        sync_lark_table(APP_TOKEN, TABLE_ID, LarkModelTCG, force_full=True, detect_anomalies=False)
+        control(fake_url, f"/_fake/tables/{TABLE_ID}/touch", {"count": RECORDS})
+
+        tp_count = max(1, RECORDS // 30)
+        latencies = []
+        errors = []
+        stop = threading.Event()
+
+        def reader(seed):
+            rnd = random.Random(seed)
+            while not stop.is_set():
+                db = SessionLocal()
+                started = time.perf_counter()
+                try:
+                    db.query(LarkModelTCG).filter(
+                        LarkModelTCG.tp_number == f"TP-{rnd.randrange(tp_count)}"
+                    ).order_by(LarkModelTCG.sort_order.asc()).all()
+                    latencies.append((time.perf_counter() - started) * 1000)
+                except Exception as e:
+                    errors.append(str(e))
+                finally:
+                    db.close()
+
+        threads = [threading.Thread(target=reader, args=(i,), daemon=True) for i in range(READERS)]
+        for t in threads:
+            t.start()
+        started = time.perf_counter()
+        stats = sync_lark_table(APP_TOKEN, TABLE_ID, LarkModelTCG, force_full=True, detect_anomalies=False)
+        sync_seconds = time.perf_counter() - started
+        stop.set()
+        for t in threads:
+            t.join()
+
+        with engine.connect() as conn:
+            journal_mode = conn.exec_driver_sql("PRAGMA journal_mode").scalar()
+        print(json.dumps({
+            "journal_mode": journal_mode,
+            "sync_seconds": round(sync_seconds, 2),
+            "updated": (stats or {}).get("updated"),
+            "reads": len(latencies),
+            "p50_ms": round(statistics.median(latencies), 2) if latencies else 0.0,
+            "p99_ms": round(percentile(latencies, 99), 2),
+            "max_ms": round(max(latencies), 2) if latencies else 0.0,
+            "errors": len(errors),
+            "locked_errors": sum("database is locked" in e for e in errors),
+        }))
+    finally:
+        fake_proc.terminate()
+        fake_proc.wait()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        run_mode()
+        sys.exit(0)
+
+    print(f"{RECORDS:,} TCG records, {READERS} reader threads during a full re-sync")
+    print(f"  {'mode':<9} {'journal':<8} {'sync':>8} {'reads':>7} {'p50':>9} {'p99':>9} {'max':>9} {'locked':>7}")
+    for mode, overrides in MODES.items():
+        env = {**os.environ, **overrides}
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child"],
+            env=env, capture_output=True, text=True
+        )
+        lines = [line for line in out.stdout.splitlines() if line.startswith("{")]
+        if out.returncode != 0 or not lines:
+            print(f"FAIL: {mode} run failed\n{out.stderr[-2000:]}")
+            sys.exit(1)
+        r = json.loads(lines[-1])
+        print(
+            f"  {mode:<9} {r['journal_mode']:<8} {r['sync_seconds']:>7.2f}s {r['reads']:>7} "
+            f"{r['p50_ms']:>7.2f}ms {r['p99_ms']:>7.2f}ms {r['max_ms']:>7.2f}ms {r['locked_errors']:>7}"
+        )
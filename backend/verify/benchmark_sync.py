@@ -0,0 +1,157 @@
+"""
+End-to-end sync benchmark against local stand-ins (no live Lark / Jira needed).
+
+- Lark: fake_lark_server.py runs in a separate process (its CPU / memory are not measured)
+  and serves synthetic TCG records, or a recorded fixture (BENCH_FIXTURE).
+- Jira: fake_jira.FakeJiraService.
+
+For each size it measures:
+- full sync           (sync_lark_table force_full=True into an empty DB)
+- incremental sync    (after BENCH_TOUCH_PCT % of the records were edited in the fake)
+- jira verification   (sync_jira_verification over the non-Closed tickets)
+and reports records/sec and peak Python memory (tracemalloc).
+
+Env:
+    BENCH_SIZES=1000,10000,100000   BENCH_LATENCY_MS=0 (fake Lark, per call)
+    BENCH_JIRA_LATENCY_MS=50        BENCH_TOUCH_PCT=1
+    BENCH_TRACE_MEMORY=1            (0 = throughput without tracemalloc overhead)
+    BENCH_FIXTURE=path.json         (replay a recorded table instead of synthetic data)
+"""
+import sys
+import os
+import json
+import time
+import tempfile
+import tracemalloc
+import subprocess
+import logging
+import urllib.request
+
+VERIFY_DIR = os.path.dirname(os.path.abspath(__file__))
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(VERIFY_DIR, '../../')))
+
+SIZES = [int(s) for s in os.getenv("BENCH_SIZES", "1000,10000,100000").split(",") if s.strip()]
+LATENCY_MS = float(os.getenv("BENCH_LATENCY_MS", "0"))
+JIRA_LATENCY_MS = float(os.getenv("BENCH_JIRA_LATENCY_MS", "50"))
+TOUCH_PCT = float(os.getenv("BENCH_TOUCH_PCT", "1"))
+TRACE_MEMORY = os.getenv("BENCH_TRACE_MEMORY", "1") == "1"
+FIXTURE = os.getenv("BENCH_FIXTURE")
+
+APP_TOKEN = "appBench"
+TABLE_ID = "tblBenchTCG"
+
+
+def start_fake_lark():
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(VERIFY_DIR, "fake_lark_server.py"), "--port", "0",
+         "--latency-ms", str(LATENCY_MS)],
+        stdout=subprocess.PIPE, text=True
+    )
+    line = proc.stdout.readline().strip()
+    if not line.startswith("READY "):
+        proc.kill()
+        raise RuntimeError(f"Fake Lark server failed to start: {line!r}")
+    return proc, line.split(" ", 1)[1]
+
+
+def control(base_url, path, payload):
+    req = urllib.request.Request(
+        f"{base_url}{path}", data=json.dumps(payload).encode(), method="POST",
+        headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(req) as resp:
+        return json.loads(resp.read())
+
+
+# The fake server must be up before the backend is imported: the Lark transport reads its env at import time.
+fake_proc, FAKE_URL = start_fake_lark()
+os.environ["LARK_DOMAIN"] = FAKE_URL
+os.environ["LARK_APP_ID"] = "cli_bench"
+os.environ["LARK_APP_SECRET"] = "bench"
+os.environ["DB_DIR"] = tempfile.mkdtemp(prefix="bench_sync_")
+# Benchmark the sync itself, not the client-side rate limiter
+os.environ["RATE_LIMITS"] = "lark.bitable.search=100000:100000,lark.auth=1000:1000,jira.search=100000:100000"
+
+from backend.shared.database import Base, engine, SessionLocal
+import backend.main  # noqa: F401  (registers every model on Base)
+from backend.features.project.persistence.models import LarkModelTCG
+from backend.features.sync.service.sync_service import sync_lark_table, sync_jira_verification
+from backend.verify.fake_jira import install_fake_jira
+
+logging.getLogger().setLevel(logging.WARNING)
+# Per-ticket "not found in Jira" warnings would flood the report
+logging.getLogger("backend.features.sync.service.sync_service").setLevel(logging.ERROR)
+
+
+def measure(fn):
+    if TRACE_MEMORY:
+        tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    peak = 0
+    if TRACE_MEMORY:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def report(name, records, elapsed, peak):
+    rate = records / elapsed if elapsed else 0
+    mem = f"{peak / 1024 / 1024:8.1f} MB" if TRACE_MEMORY else "       n/a"
+    print(f"  {name:<22} {records:>8} rec  {elapsed:8.2f}s  {rate:>10,.0f} rec/s  peak {mem}")
+
+
+def bench_size(size):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    if FIXTURE:
+        size = control(FAKE_URL, f"/_fake/tables/{TABLE_ID}/load", {"path": os.path.abspath(FIXTURE)})["count"]
+    else:
+        control(FAKE_URL, f"/_fake/tables/{TABLE_ID}/generate", {"kind": "tcg", "count": size})
+
+    stats, elapsed, peak = measure(
+        lambda: sync_lark_table(APP_TOKEN, TABLE_ID, LarkModelTCG, force_full=True, detect_anomalies=False)
+    )
+    if stats is None:
+        raise RuntimeError("Full sync failed (see log)")
+    report("full sync", stats["fetched"], elapsed, peak)
+
+    touched = control(FAKE_URL, f"/_fake/tables/{TABLE_ID}/touch", {"count": max(1, int(size * TOUCH_PCT / 100))})["touched"]
+    stats, elapsed, peak = measure(
+        lambda: sync_lark_table(APP_TOKEN, TABLE_ID, LarkModelTCG, detect_anomalies=False)
+    )
+    if stats is None:
+        raise RuntimeError("Incremental sync failed (see log)")
+    report("incremental sync", stats["fetched"], elapsed, peak)
+    print(f"    touched {touched}, updated {stats['updated']}, skipped (same hash) {stats['skipped']}")
+
+    # Jira: every active ticket exists except ~1%, which the verifier must delete
+    db = SessionLocal()
+    try:
+        active = [t for (t,) in db.query(LarkModelTCG.tcg_tickets).filter(LarkModelTCG.jira_status != 'Closed')]
+    finally:
+        db.close()
+    statuses = {key: "Open" for i, key in enumerate(active) if i % 100 != 0}
+    fake_jira = install_fake_jira(statuses, latency_ms=JIRA_LATENCY_MS)
+    _, elapsed, peak = measure(sync_jira_verification)
+    report("jira verification", len(active), elapsed, peak)
+    print(
+        f"    jira search calls {fake_jira.stats['search_calls']}, issue calls (confirm missing) "
+        f"{fake_jira.stats['issue_calls']}, missing (deleted) {len(active) - len(statuses)}"
+    )
+
+
+if __name__ == "__main__":
+    print(f"Fake Lark at {FAKE_URL} (latency {LATENCY_MS} ms/call), DB at {os.environ['DB_DIR']}")
+    if TRACE_MEMORY:
+        print("tracemalloc on: rec/s includes tracing overhead (BENCH_TRACE_MEMORY=0 for raw throughput)")
+    try:
+        for size in ([0] if FIXTURE else SIZES):
+            print(f"\n== {'fixture ' + FIXTURE if FIXTURE else f'{size:,} records'} ==")
+            bench_size(size)
+    finally:
+        fake_proc.terminate()
+        fake_proc.wait()
@@ -0,0 +1,132 @@
+"""
+Full-text ticket search (ticket_search FTS5 index) vs. ILIKE '%x%' scans over BENCH_RECORDS tickets.
+
+Seeds TCG tickets (90%) and TP projects (10%) with titles / descriptions drawn from a
+Zipf-distributed vocabulary, builds the index, then times TicketSearchService.search
+and the equivalent ILIKE filter for the same queries.
+
+Env:
+    BENCH_RECORDS=100000   BENCH_REPEAT=20
+"""
+import sys
+import os
+import time
+import random
+import tempfile
+import statistics
+import logging
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+RECORDS = int(os.getenv("BENCH_RECORDS", "100000"))
+REPEAT = int(os.getenv("BENCH_REPEAT", "20"))
+
+# Isolated database file (the engines read DB_DIR at import)
+os.environ["DB_DIR"] = tempfile.mkdtemp(prefix="bench_ticket_search_")
+
+from sqlalchemy import or_
+from backend.shared.database import Base, engine, SessionLocal, ReadSessionLocal
+import backend.main  # noqa: F401  (registers every model on Base)
+from backend.features.project.persistence.models import LarkModelTP, LarkModelTCG
+from backend.features.project.service.ticket_search_service import TicketSearchService
+from backend.features.sync.persistence.ticket_search import rebuild_ticket_search
+
+# Zipf-distributed vocabulary (word at rank r has weight 1/r): synthetic tail words with
+# the queried words placed at frequency ranks typical for ticket text
+RANKED_WORDS = {"the": 1, "user": 5, "error": 12, "login": 40, "payment": 90, "timeout": 150, "kerberos": 3000}
+VOCABULARY = [f"tok{n}x" for n in range(20000)]
+for word, rank in RANKED_WORDS.items():
+    VOCABULARY[rank - 1] = word
+CUM_WEIGHTS = []
+for rank in range(1, len(VOCABULARY) + 1):
+    CUM_WEIGHTS.append((CUM_WEIGHTS[-1] if CUM_WEIGHTS else 0) + 1 / rank)
+PEOPLE = ["Alice", "Bob", "Carol", "Dave", "Eve", "Frank", "Grace"]
+
+QUERIES = [
+    ("ticket key", "TCG-4242"),
+    ("rare word", "kerberos"),
+    ("common word", "login"),
+    ("two terms", "payment timeout"),
+    ("stop word", "the"),
+    ("no match", "zzzqqq"),
+]
+
+
+def sentence(rnd, words):
+    return " ".join(rnd.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=words))
+
+
+def seed():
+    rnd = random.Random(42)
+    tp_count = RECORDS // 10
+    tcg_rows = [{
+        "record_id": f"rectcg{i:08d}",
+        "tcg_tickets": f"TCG-{i}",
+        "title": sentence(rnd, 6),
+        "description": sentence(rnd, 60),
+        "assignee": rnd.choice(PEOPLE),
+        "components": rnd.choice(["TAD TAC UI", "Backend", "Mobile"]),
+        "jira_status": rnd.choice(["Open", "In Progress", "Closed"]),
+        "tp_number": f"TP-{i % tp_count}",
+    } for i in range(RECORDS - tp_count)]
+    tp_rows = [{
+        "record_id": f"rectp{i:08d}",
+        "ticket_number": f"TP-{i}",
+        "title": sentence(rnd, 5),
+        "description": sentence(rnd, 40),
+        "project_manager": rnd.choice(PEOPLE),
+        "components": "Backend",
+        "jira_status": "In Progress",
+    } for i in range(tp_count)]
+
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(LarkModelTCG.__table__.insert(), tcg_rows)
+        conn.execute(LarkModelTP.__table__.insert(), tp_rows)
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        indexed = rebuild_ticket_search(conn)
+    return indexed, time.perf_counter() - started
+
+
+def ilike(db, q):
+    """
+    The pre-FTS substring filter (every term ILIKE '%term%' on any searchable column),
+    paginated the same way: total count + first page.
+    """
+    total = 0
+    for model, columns in ((LarkModelTCG, ["tcg_tickets", "title", "description", "assignee", "components"]),
+                           (LarkModelTP, ["ticket_number", "title", "description", "project_manager", "components"])):
+        query = db.query(model.record_id)
+        for term in q.split():
+            query = query.filter(or_(*[getattr(model, c).ilike(f"%{term}%") for c in columns]))
+        total += query.count()
+        query.limit(20).all()
+    return total
+
+
+def timed(fn):
+    samples = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    indexed, build_seconds = seed()
+    print(f"{indexed:,} tickets indexed in {build_seconds:.1f}s, median of {REPEAT} runs")
+    print(f"  {'query':<13} {'q':<17} {'matches':>8} {'fts':>10} {'ilike':>10}")
+    db = ReadSessionLocal()
+    try:
+        service = TicketSearchService(db)
+        for name, q in QUERIES:
+            total = ilike(db, q)
+            fts_ms = timed(lambda: service.search(q))
+            ilike_ms = timed(lambda: ilike(db, q))
+            print(f"  {name:<13} {q!r:<17} {total:>8} {fts_ms:>8.2f}ms {ilike_ms:>8.2f}ms")
+    finally:
+        db.close()
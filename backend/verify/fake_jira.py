@@ -0,0 +1,87 @@
+"""
+In-process stand-in for backend.shared.integration.jira_client.JiraService.
+
+Usage:
+    from backend.verify.fake_jira import FakeJiraService, install_fake_jira
+    fake = install_fake_jira(statuses={"TCG-1": "Open"}, latency_ms=80)
+    sync_jira_verification()   # uses the fake
+    print(fake.stats)
+"""
+import time
+import threading
+
+import backend.shared.integration.jira_client as jira_client
+from backend.features.project.persistence.models import ticket_key
+
+
+class _Status:
+    def __init__(self, name):
+        self.name = name
+
+
+class _Fields:
+    def __init__(self, status):
+        self.status = _Status(status)
+
+
+class FakeIssue:
+    """Minimal jira.Issue shape (key + fields.status.name)."""
+
+    def __init__(self, key, status):
+        self.key = key
+        self.fields = _Fields(status)
+
+
+class FakeJiraService:
+    """
+    Same public API as JiraService (get_ticket / get_ticket_statuses).
+    statuses: {ticket_number: status}; keys not in it behave as deleted (404 / missing from search).
+    Keys are case-insensitive as in Jira. moved: {old_key: new_key}, the issue exists under new_key
+    (get_ticket follows the move; search returns it under new_key like JQL `key in (old)`).
+    latency_ms is added per call to mimic a round-trip.
+    """
+
+    def __init__(self, statuses=None, latency_ms: float = 0, fail_keys=None, moved=None):
+        self.statuses = {ticket_key(k): v for k, v in (statuses or {}).items()}
+        self.moved = {ticket_key(k): ticket_key(v) for k, v in (moved or {}).items()}
+        self.latency_ms = latency_ms
+        # Any batch containing one of these keys raises (simulates a failed request)
+        self.fail_keys = set(fail_keys or [])
+        self.jira = True  # "configured"
+        self.stats = {"issue_calls": 0, "search_calls": 0, "keys_requested": 0}
+        self._lock = threading.Lock()
+
+    def _call(self, counter: str, keys: int):
+        with self._lock:
+            self.stats[counter] += 1
+            self.stats["keys_requested"] += keys
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+    def _resolve(self, ticket_number):
+        """Requested key -> current key of the issue (follows moves)."""
+        key = ticket_key(ticket_number)
+        return self.moved.get(key, key)
+
+    def get_ticket(self, ticket_number):
+        self._call("issue_calls", 1)
+        if ticket_number in self.fail_keys:
+            raise RuntimeError(f"Simulated Jira failure for {ticket_number}")
+        key = self._resolve(ticket_number)
+        status = self.statuses.get(key)
+        return FakeIssue(key, status) if status is not None else None
+
+    def get_ticket_statuses(self, ticket_numbers):
+        keys = sorted({ticket_key(k) for k in ticket_numbers if ticket_key(k)})
+        self._call("search_calls", len(keys))
+        if self.fail_keys.intersection(keys):
+            raise RuntimeError("Simulated Jira search failure")
+        current = {self._resolve(k) for k in keys}
+        return {k: self.statuses[k] for k in current if k in self.statuses}
+
+
+def install_fake_jira(statuses=None, latency_ms: float = 0, fail_keys=None, moved=None) -> FakeJiraService:
+    """Makes JiraService() return one shared FakeJiraService (sync_service imports it at call time)."""
+    fake = FakeJiraService(statuses, latency_ms, fail_keys, moved)
+    jira_client.JiraService = lambda: fake
+    return fake
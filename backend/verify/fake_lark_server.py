@@ -0,0 +1,334 @@
+"""
+Local stand-in for the Lark Open API endpoints used by the sync:
+- POST /open-apis/auth/v3/tenant_access_token/internal
+- POST /open-apis/bitable/v1/apps/{app_token}/tables/{table_id}/records/search
+
+Records come from either
+- synthetic data (generate_records: TP / TCG payloads shaped like the real tables), or
+- a recorded fixture (record_fixture: real items captured once from Lark, replayed offline).
+
+Control endpoints (used by benchmark_sync.py when the server runs in its own process):
+- POST /_fake/tables/{table_id}/generate  {"kind": "tcg" | "tp", "count": N, "seed": 42}
+- POST /_fake/tables/{table_id}/touch     {"count": N}   -> bumps 'Updated Date' of N records
+- POST /_fake/tables/{table_id}/load      {"path": "fixture.json"}
+- GET  /_fake/stats
+
+Usage:
+    python backend/verify/fake_lark_server.py --port 8765 --generate tcg:tblTCG:10000 --latency-ms 50
+    python backend/verify/fake_lark_server.py --port 8765 --fixture tcg.json
+    python backend/verify/fake_lark_server.py --record <app_token>:<table_id> --out tcg.json   (live Lark, needs .env)
+"""
+import sys
+import os
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+# Add project root to sys.path (only needed for --record)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+TENANT_TOKEN_PATH = "/open-apis/auth/v3/tenant_access_token/internal"
+SEARCH_PREFIX = "/open-apis/bitable/v1/apps/"
+MAX_PAGE_SIZE = 500
+DEFAULT_PAGE_SIZE = 20
+BASE_UPDATED_MS = 1700000000000
+
+
+def generate_records(kind: str, count: int, seed: int = 42, base_updated_ms: int = BASE_UPDATED_MS):
+    """Synthetic Search API items for the TP or TCG table."""
+    rnd = random.Random(seed)
+    statuses = ["Open", "In Progress", "In Review", "Resolved", "Closed"]
+    people = ["Alice", "Bob", "Carol", "Dave", "Eve", "Frank", "Grace"]
+    tp_count = max(1, count // 30)
+    items = []
+    for i in range(count):
+        updated = base_updated_ms + i * 1000
+        if kind == "tp":
+            fields = {
+                "Ticket Number": [{"text": f"TP-{i}", "type": "text"}],
+                "Title": [{"text": f"Project {i}", "type": "text"}],
+                "Jira Status": rnd.choice(["In Progress", "Open", "Closed"]),
+                "Project Manager": [{"name": rnd.choice(people), "email": "pm@example.com"}],
+                "Project Type": rnd.choice(["Feature", "Improvement"]),
+                "Department": ["WRD"],
+                "Components": ["TAD TAC UI", "Backend"],
+                "Released Date": base_updated_ms + i * 86400000,
+                "Updated Date": updated,
+            }
+        else:
+            fields = {
+                "TCG Tickets": [{"text": f"TCG-{i}", "type": "text"}],
+                "Title": [{"text": f"Ticket title {i}", "type": "text"}],
+                "Description": [{"text": "Lorem ipsum " * 10, "type": "text"}],
+                "Jira Status": rnd.choice(statuses),
+                "Issue Type": rnd.choice(["Sub-task", "Story", "Bug"]),
+                "Assignee": [{"name": rnd.choice(people), "email": "x@example.com"}],
+                "Reporter": [{"name": rnd.choice(people)}],
+                "Components": rnd.choice([["TAD TAC UI"], ["Backend"], ["TAD TAC UI", "Backend"]]),
+                "Department": ["WRD"],
+                "TP Number": [{"text": f"TP-{i % tp_count}", "type": "text"}],
+                "Parent Tickets": [{"text": f"TCG-{max(i - 1, 0)}", "type": "text"}],
+                "Fix Versions": ["1.0.0"],
+                "Created": base_updated_ms - 86400000 + i,
+                "Created Quarter": "2024 Q1",
+                "Updated Date": updated,
+            }
+        items.append({"record_id": f"rec{kind}{i:08d}", "fields": fields})
+    return items
+
+
+def _as_number(value):
+    if isinstance(value, list):
+        # ["ExactDate", ms] for DateTime fields
+        value = value[-1]
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _field_text(value):
+    if isinstance(value, list):
+        return ",".join(str(v.get("text", v.get("name", ""))) if isinstance(v, dict) else str(v) for v in value)
+    return "" if value is None else str(value)
+
+
+def _match_condition(fields: dict, condition: dict) -> bool:
+    operator = condition.get("operator")
+    actual = fields.get(condition.get("field_name"))
+    expected = condition.get("value") or []
+    if operator in ("isGreater", "isLess"):
+        left, right = _as_number(actual), _as_number(expected)
+        if left is None or right is None:
+            return False
+        return left > right if operator == "isGreater" else left < right
+    if operator == "is":
+        return _field_text(actual) == _field_text(expected)
+    if operator == "isNotEmpty":
+        return actual not in (None, "", [])
+    if operator == "isEmpty":
+        return actual in (None, "", [])
+    if operator == "contains":
+        return all(str(v) in _field_text(actual) for v in expected)
+    # Unsupported operators do not filter
+    return True
+
+
+def apply_filter(items, filter_info):
+    if not filter_info or not filter_info.get("conditions"):
+        return items
+    conditions = filter_info["conditions"]
+    if filter_info.get("conjunction", "and") == "or":
+        return [it for it in items if any(_match_condition(it["fields"], c) for c in conditions)]
+    return [it for it in items if all(_match_condition(it["fields"], c) for c in conditions)]
+
+
+class FakeBitable:
+    """In-memory tables served by the fake search endpoint."""
+
+    def __init__(self):
+        self.tables = {}
+        self.stats = {"token_requests": 0, "search_requests": 0, "records_served": 0}
+        self._lock = threading.Lock()
+
+    def set_items(self, table_id: str, items):
+        with self._lock:
+            self.tables[table_id] = list(items)
+
+    def generate(self, table_id: str, kind: str, count: int, seed: int = 42):
+        self.set_items(table_id, generate_records(kind, count, seed))
+
+    def load_fixture(self, path: str, table_id: str = None):
+        with open(path, encoding="utf-8") as f:
+            fixture = json.load(f)
+        self.set_items(table_id or fixture["table_id"], fixture["items"])
+        return table_id or fixture["table_id"]
+
+    def touch(self, table_id: str, count: int, now_ms: int = None):
+        """Simulates edits: bumps 'Updated Date' (and one field) of the first `count` records."""
+        now_ms = now_ms or int(time.time() * 1000)
+        with self._lock:
+            items = self.tables.get(table_id, [])
+            for item in items[:count]:
+                fields = dict(item["fields"])
+                fields["Updated Date"] = now_ms
+                fields["Jira Status"] = "In Progress" if fields.get("Jira Status") != "In Progress" else "In Review"
+                item["fields"] = fields
+        return min(count, len(items))
+
+    def search(self, table_id: str, body: dict, page_token: str = None, page_size: int = None):
+        with self._lock:
+            items = self.tables.get(table_id)
+            self.stats["search_requests"] += 1
+        if items is None:
+            return {"code": 91402, "msg": "NOTEXIST", "error": {"message": f"table {table_id} not found"}}
+
+        matched = apply_filter(items, (body or {}).get("filter"))
+        size = min(int(page_size or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE)
+        offset = int(page_token or 0)
+        page = matched[offset:offset + size]
+        has_more = offset + size < len(matched)
+        with self._lock:
+            self.stats["records_served"] += len(page)
+        data = {"has_more": has_more, "items": page, "total": len(matched)}
+        if has_more:
+            data["page_token"] = str(offset + size)
+        return {"code": 0, "msg": "success", "data": data}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, payload: dict):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_GET(self):
+        if self.path == "/_fake/stats":
+            return self._send(200, self.server.bitable.stats)
+        self._send(404, {"code": 404, "msg": "not found"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        body = self._body()
+        bitable = self.server.bitable
+
+        if url.path.startswith("/_fake/tables/"):
+            _, _, _, table_id, action = url.path.split("/")
+            if action == "generate":
+                bitable.generate(table_id, body.get("kind", "tcg"), int(body["count"]), int(body.get("seed", 42)))
+                return self._send(200, {"table_id": table_id, "count": len(bitable.tables[table_id])})
+            if action == "touch":
+                return self._send(200, {"touched": bitable.touch(table_id, int(body["count"]))})
+            if action == "load":
+                loaded = bitable.load_fixture(body["path"], table_id)
+                return self._send(200, {"table_id": loaded, "count": len(bitable.tables[loaded])})
+            return self._send(404, {"code": 404, "msg": f"unknown action {action}"})
+
+        if self.server.latency_ms:
+            time.sleep(self.server.latency_ms / 1000)
+
+        if url.path == TENANT_TOKEN_PATH:
+            bitable.stats["token_requests"] += 1
+            return self._send(200, {"code": 0, "msg": "ok", "tenant_access_token": "t-fake-token", "expire": 7200})
+
+        if url.path.startswith(SEARCH_PREFIX) and url.path.endswith("/records/search"):
+            if not self.headers.get("Authorization", "").startswith("Bearer "):
+                return self._send(200, {"code": 99991661, "msg": "Missing access token"})
+            table_id = url.path.split("/tables/", 1)[1].split("/", 1)[0]
+            query = parse_qs(url.query)
+            result = bitable.search(
+                table_id, body,
+                page_token=(query.get("page_token") or [None])[0],
+                page_size=(query.get("page_size") or [None])[0]
+            )
+            return self._send(200, result)
+
+        self._send(404, {"code": 404, "msg": "not found"})
+
+
+class FakeLarkServer:
+    """Threaded HTTP server around a FakeBitable. port=0 picks a free port."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0, bitable: FakeBitable = None):
+        self.bitable = bitable or FakeBitable()
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.bitable = self.bitable
+        self.httpd.latency_ms = latency_ms
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="fake-lark", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def record_fixture(app_token: str, table_id: str, out_path: str, page_size: int = MAX_PAGE_SIZE):
+    """Captures every record of a live Lark table into a replayable fixture file."""
+    from backend.shared.integration.lark_client import list_records
+
+    items = []
+    page_token = None
+    while True:
+        data = list_records(app_token, table_id, page_token=page_token, page_size=page_size)
+        if "code" in data:
+            raise RuntimeError(f"Lark error while recording: {data}")
+        items.extend(data.get("items") or [])
+        if not data.get("has_more"):
+            break
+        page_token = data.get("page_token")
+
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "app_token": app_token,
+            "table_id": table_id,
+            "recorded_at": int(time.time() * 1000),
+            "items": items
+        }, f, ensure_ascii=False)
+    return len(items)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Lark Bitable server for sync benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Added latency per API call")
+    parser.add_argument("--generate", action="append", default=[], metavar="KIND:TABLE_ID:COUNT")
+    parser.add_argument("--fixture", action="append", default=[], metavar="PATH[:TABLE_ID]")
+    parser.add_argument("--record", metavar="APP_TOKEN:TABLE_ID", help="Record a live table and exit")
+    parser.add_argument("--out", help="Fixture path for --record")
+    args = parser.parse_args()
+
+    if args.record:
+        app_token, table_id = args.record.split(":", 1)
+        out = args.out or f"lark_fixture_{table_id}.json"
+        print(f"Recorded {record_fixture(app_token, table_id, out)} records to {out}")
+        return
+
+    server = FakeLarkServer(args.host, args.port, args.latency_ms)
+    for spec in args.generate:
+        kind, table_id, count = spec.split(":")
+        server.bitable.generate(table_id, kind, int(count))
+    for spec in args.fixture:
+        path, _, table_id = spec.partition(":")
+        server.bitable.load_fixture(path, table_id or None)
+
+    # Handshake line for parent processes (benchmark_sync.py)
+    print(f"READY {server.url}", flush=True)
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
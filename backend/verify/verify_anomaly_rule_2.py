@@ -10,6 +10,8 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'
 
 from backend.features.project.service.anomaly_service import AnomalyService
 from backend.features.project.persistence.models import Base, LarkModelTP, LarkModelTCG, TicketAnomaly
+from backend.features.sync.persistence.models import SyncState  # noqa: F401  (data generations)
+from backend.features.sync.persistence.ticket_links import replace_ticket_links
 
 # Setup In-Memory DB for testing
 engine = create_engine('sqlite:///:memory:')
@@ -34,6 +36,7 @@ def test_rule_2():
     parent = LarkModelTCG(
         record_id="rec_001",
         tcg_tickets="TCG-100",
+        tcg_ticket_key="TCG-100",  # Filled by sync (ticket_key)
         tp_number="TP-001",
         title="Parent Ticket",
         jira_status="In Progress",
@@ -46,11 +49,14 @@ def test_rule_2():
     child_a = LarkModelTCG(
         record_id="rec_002",
         tcg_tickets="TCG-101",
-        parent_tickets="TCG-100",
+        tcg_ticket_key="TCG-101",
+        parent_tickets="tcg-100",  # Parent written in lower case still links to TCG-100
         jira_status="In Review",
         issue_type="Sub-task"
     )
     db.add(child_a)
+    # Parent/child links are maintained by the sync from parent_tickets
+    replace_ticket_links(db, {child_a.record_id: child_a.parent_tickets})
     db.commit()
 
     print("--- Scenario A: Parent In Progress, Child In Review ---")
@@ -81,6 +87,29 @@ def test_rule_2():
         print("FAIL: Expected 1 anomaly for 'Closed' child.")
         sys.exit(1)
 
+    # Scenario C: Nothing changed -> anomaly kept as is (detected_at stable)
+    detected_at = anomalies[0].detected_at
+    time.sleep(0.01)
+    print("\n--- Scenario C: Re-run without changes ---")
+    stats = service.refresh_anomalies()
+    anomalies = db.query(TicketAnomaly).all()
+    if len(anomalies) == 1 and anomalies[0].detected_at == detected_at and stats["unchanged"] == 1:
+        print(f"PASS: Anomaly kept, detected_at unchanged ({stats})")
+    else:
+        print(f"FAIL: Expected the existing anomaly to be kept unchanged ({stats})")
+        sys.exit(1)
+
+    # Scenario D: Child re-opened -> anomaly resolved
+    child_a.jira_status = "In Progress"
+    db.commit()
+    print("\n--- Scenario D: Child back to In Progress ---")
+    stats = service.refresh_anomalies()
+    if db.query(TicketAnomaly).count() == 0 and stats["resolved"] == 1:
+        print(f"PASS: Anomaly resolved ({stats})")
+    else:
+        print(f"FAIL: Expected the anomaly to be resolved ({stats})")
+        sys.exit(1)
+
 if __name__ == "__main__":
     try:
         test_rule_2()
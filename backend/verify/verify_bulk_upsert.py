@@ -0,0 +1,137 @@
+import sys
+import os
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from backend.shared.database import Base
+from backend.features.project.persistence.models import LarkModelTCG, TCGTicketLink
+from backend.features.sync.persistence.bulk_upsert import fetch_existing, bulk_upsert_page
+from backend.features.sync.service import field_mapping
+from backend.features.sync.service.field_mapping import get_mapping_plan, FieldMappingPlan
+from backend.features.sync.service.sync_service import _write_page
+
+# Setup In-Memory DB for testing
+engine = create_engine('sqlite:///:memory:')
+SessionLocal = sessionmaker(bind=engine)
+Base.metadata.create_all(engine)
+
+def write_page(db, rows):
+    existing = fetch_existing(db, LarkModelTCG, [r["record_id"] for r in rows])
+    stats = bulk_upsert_page(db, LarkModelTCG, rows, existing, get_mapping_plan(LarkModelTCG).write_columns)
+    db.commit()
+    return stats
+
+def test_bulk_upsert():
+    db = SessionLocal()
+
+    page = [
+        {"record_id": "rec_001", "updated_at": 1, "tcg_tickets": "TCG-1", "jira_status": "Open"},
+        {"record_id": "rec_002", "updated_at": 1, "tcg_tickets": "TCG-2", "jira_status": "Open"},
+        {"record_id": "rec_003", "updated_at": 1, "tcg_tickets": "TCG-3", "jira_status": "Open"},
+    ]
+
+    print("--- Scenario A: First write inserts every row ---")
+    stats = write_page(db, page)
+    print(stats)
+    assert stats == {"inserted": 3, "updated": 0, "unchanged": 0}, stats
+
+    print("--- Scenario B: One changed, one new, two untouched ---")
+    page[1] = {"record_id": "rec_002", "updated_at": 2, "tcg_tickets": "TCG-2", "jira_status": "Closed"}
+    page.append({"record_id": "rec_004", "updated_at": 2, "tcg_tickets": "TCG-4", "jira_status": "Open"})
+    stats = write_page(db, page)
+    print(stats)
+    assert stats == {"inserted": 1, "updated": 1, "unchanged": 2}, stats
+
+    closed = db.query(LarkModelTCG).filter(LarkModelTCG.record_id == "rec_002").first()
+    assert closed.jira_status == "Closed"
+    assert db.query(LarkModelTCG).count() == 4
+
+    # Sort order is managed locally and must survive an upsert
+    closed.sort_order = 7
+    db.commit()
+    write_page(db, [{"record_id": "rec_002", "updated_at": 3, "tcg_tickets": "TCG-2", "jira_status": "Closed"}])
+    db.expire_all()
+    assert db.query(LarkModelTCG).filter(LarkModelTCG.record_id == "rec_002").first().sort_order == 7
+    db.close()
+
+def test_cleared_field_is_nulled():
+    db = SessionLocal()
+    plan = get_mapping_plan(LarkModelTCG)
+
+    def record(record_id, updated, **fields):
+        return {"record_id": record_id, "fields": {"TCG Tickets": f"TCG-{record_id}", "Updated Date": updated, **fields}}
+
+    print("--- Scenario C: Field cleared in Lark, absent from every record of the page ---")
+    _write_page(db, LarkModelTCG, [
+        record("rec_101", 1, **{"Jira Status": "Open", "Parent Tickets": "TCG-1"}),
+        record("rec_102", 1, **{"Jira Status": "Open"}),
+    ], plan, set())
+    db.commit()
+    sort_order_row = db.query(LarkModelTCG).filter(LarkModelTCG.record_id == "rec_101").first()
+    sort_order_row.sort_order = 3
+    db.commit()
+
+    # Lark omits the cleared fields: no record of this page carries Jira Status / Parent Tickets
+    _write_page(db, LarkModelTCG, [record("rec_101", 2), record("rec_102", 2)], plan, set())
+    db.commit()
+    db.expire_all()
+    rows = {t.record_id: t for t in db.query(LarkModelTCG).filter(LarkModelTCG.record_id.in_(["rec_101", "rec_102"]))}
+    assert rows["rec_101"].jira_status is None and rows["rec_102"].jira_status is None, "cleared status kept"
+    assert rows["rec_101"].parent_tickets is None, "cleared parent_tickets kept"
+    assert db.query(TCGTicketLink).filter(TCGTicketLink.child_record_id == "rec_101").count() == 0
+    assert rows["rec_101"].tcg_ticket_key == "TCG-REC_101"
+    assert rows["rec_101"].sort_order == 3, "local sort_order overwritten"
+    db.close()
+
+def test_hash_skip_respects_force_full_and_mapping():
+    db = SessionLocal()
+    plan = get_mapping_plan(LarkModelTCG)
+    page = [{"record_id": "rec_201", "fields": {"TCG Tickets": "tcg-201", "Jira Status": "Open", "Updated Date": 1}}]
+
+    def write(mapping_plan, force_full=False):
+        stats, _, _ = _write_page(db, LarkModelTCG, page, mapping_plan, set(), force_full)
+        db.commit()
+        return stats
+
+    def corrupt():
+        # A row written by an older / broken mapping
+        db.query(LarkModelTCG).filter(LarkModelTCG.record_id == "rec_201").update({"tcg_ticket_key": None})
+        db.commit()
+
+    def stored_key():
+        db.expire_all()
+        return db.query(LarkModelTCG.tcg_ticket_key).filter(LarkModelTCG.record_id == "rec_201").scalar()
+
+    print("--- Scenario D: Same payload is skipped, force_full re-maps it ---")
+    write(plan)
+    corrupt()
+    assert write(plan)["skipped"] == 1 and stored_key() is None
+    stats = write(plan, force_full=True)
+    assert stats["skipped"] == 0 and stats["updated"] == 1, stats
+    assert stored_key() == "TCG-201", "force_full did not repair the row"
+
+    print("--- Scenario E: A mapping change invalidates the stored hash ---")
+    corrupt()
+    original_version = field_mapping.FIELD_MAPPING_VERSION
+    field_mapping.FIELD_MAPPING_VERSION = original_version + 1
+    try:
+        changed_plan = FieldMappingPlan(LarkModelTCG)
+    finally:
+        field_mapping.FIELD_MAPPING_VERSION = original_version
+    assert changed_plan.signature != plan.signature
+    assert write(changed_plan)["skipped"] == 0 and stored_key() == "TCG-201"
+    assert write(changed_plan)["skipped"] == 1
+    db.close()
+
+if __name__ == "__main__":
+    try:
+        test_bulk_upsert()
+        test_cleared_field_is_nulled()
+        test_hash_skip_respects_force_full_and_mapping()
+        print("\nAll tests passed!")
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        sys.exit(1)
@@ -0,0 +1,153 @@
+import sys
+import os
+import tempfile
+from typing import Optional
+from fastapi import FastAPI, APIRouter, Depends, Header, HTTPException
+from fastapi.testclient import TestClient
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Isolated database file (the engines read DB_DIR at import)
+os.environ["DB_DIR"] = tempfile.mkdtemp(prefix="verify_etag_")
+
+from backend.shared.database import Base, engine, SessionLocal
+import backend.main  # noqa: F401  (registers every model on Base)
+from backend.shared.response_cache import depends_on_tables, bump_generation
+from backend.shared.controller.etag_route import ETagRoute
+
+Base.metadata.create_all(bind=engine)
+
+calls = {"tickets": 0}
+
+def bump(*tables):
+    db = SessionLocal()
+    try:
+        bump_generation(db, *tables)
+        db.commit()
+    finally:
+        db.close()
+
+router = APIRouter(prefix="/api/project", route_class=ETagRoute)
+
+@router.get("/{tp_number}/tcg_tickets")
+@depends_on_tables(["tcg_tickets"])
+def tcg_tickets(tp_number: str, status: Optional[str] = None):
+    calls["tickets"] += 1
+    return [{"tp_number": tp_number, "status": status}]
+
+@router.get("/untracked")
+def untracked():
+    return {"ok": True}
+
+app = FastAPI()
+app.include_router(router)
+client = TestClient(app)
+AUTH = {"Authorization": "Bearer token-a"}
+
+# Same router behind an auth dependency, as register_routes does with get_current_user
+ACTIVE_USERS = {"Bearer token-a": True, "Bearer token-off": False}
+
+def current_user(authorization: Optional[str] = Header(None)):
+    if authorization not in ACTIVE_USERS:
+        raise HTTPException(status_code=401, detail="Could not validate credentials")
+    if not ACTIVE_USERS[authorization]:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return authorization
+
+secured_app = FastAPI()
+secured_app.include_router(router, dependencies=[Depends(current_user)])
+secured = TestClient(secured_app)
+
+def compute_etag_for(authorization, url):
+    from starlette.requests import Request
+    from backend.shared.controller.etag_route import compute_etag
+    path, _, query = url.partition("?")
+    scope = {"type": "http", "method": "GET", "path": path, "query_string": query.encode(),
+             "headers": [(b"authorization", authorization.encode())]}
+    return compute_etag(Request(scope), ["tcg_tickets"])
+
+def test_not_modified():
+    print("Testing If-None-Match -> 304 without running the handler...")
+    first = client.get("/api/project/TP-1/tcg_tickets", headers=AUTH)
+    etag = first.headers.get("etag")
+    if first.status_code != 200 or not etag:
+        print(f"FAIL: expected 200 with ETag, got {first.status_code} {first.headers}")
+        sys.exit(1)
+    before = calls["tickets"]
+    second = client.get("/api/project/TP-1/tcg_tickets", headers={**AUTH, "If-None-Match": etag})
+    if second.status_code != 304 or second.content or calls["tickets"] != before:
+        print(f"FAIL: expected empty 304 without a handler call, got {second.status_code}")
+        sys.exit(1)
+    print("PASS")
+
+def test_etag_inputs():
+    print("Testing ETag changes with path, query, token and data generation...")
+    def etag(url, headers=AUTH):
+        return client.get(url, headers=headers).headers["etag"]
+    base = etag("/api/project/TP-1/tcg_tickets")
+    if etag("/api/project/TP-2/tcg_tickets") == base:
+        print("FAIL: different path shares the ETag")
+        sys.exit(1)
+    if etag("/api/project/TP-1/tcg_tickets?status=Open") == base:
+        print("FAIL: different query shares the ETag")
+        sys.exit(1)
+    if etag("/api/project/TP-1/tcg_tickets", {"Authorization": "Bearer token-b"}) == base:
+        print("FAIL: different token shares the ETag")
+        sys.exit(1)
+    bump("tp_projects")  # Unrelated table
+    if etag("/api/project/TP-1/tcg_tickets") != base:
+        print("FAIL: unrelated table changed the ETag")
+        sys.exit(1)
+    bump("tcg_tickets")
+    stale = client.get("/api/project/TP-1/tcg_tickets", headers={**AUTH, "If-None-Match": base})
+    if stale.status_code != 200 or stale.headers["etag"] == base:
+        print("FAIL: ETag not refreshed after the table changed")
+        sys.exit(1)
+    print("PASS")
+
+def test_untracked_route():
+    print("Testing routes without declared tables...")
+    response = client.get("/api/project/untracked", headers=AUTH)
+    if response.status_code != 200 or "etag" in response.headers:
+        print("FAIL: undeclared route should not get an ETag")
+        sys.exit(1)
+    print("PASS")
+
+def test_auth_runs_before_not_modified():
+    print("Testing 304 is only answered after authentication...")
+    url = "/api/project/TP-1/tcg_tickets"
+    etag = secured.get(url, headers=AUTH).headers["etag"]
+    if secured.get(url, headers={**AUTH, "If-None-Match": etag}).status_code != 304:
+        print("FAIL: authenticated revalidation should be 304")
+        sys.exit(1)
+    cases = [
+        ("no Authorization", {"If-None-Match": "*"}, 401),
+        ("garbage token", {"Authorization": "Bearer junk", "If-None-Match": "*"}, 401),
+        ("inactive user", {"Authorization": "Bearer token-off", "If-None-Match": etag}, 400),
+    ]
+    # The inactive user's own ETag too (the token hash is part of it)
+    off_etag = compute_etag_for("Bearer token-off", url)
+    cases.append(("inactive user, own ETag", {"Authorization": "Bearer token-off", "If-None-Match": off_etag}, 400))
+    for name, headers, expected in cases:
+        status = secured.get(url, headers=headers).status_code
+        if status != expected:
+            print(f"FAIL: {name}: expected {expected}, got {status}")
+            sys.exit(1)
+    print("PASS")
+
+def test_wildcard_is_not_a_match():
+    print("Testing If-None-Match: * does not short-circuit a GET...")
+    response = client.get("/api/project/TP-1/tcg_tickets", headers={**AUTH, "If-None-Match": "*"})
+    if response.status_code != 200:
+        print(f"FAIL: expected 200 for '*', got {response.status_code}")
+        sys.exit(1)
+    print("PASS")
+
+if __name__ == "__main__":
+    test_not_modified()
+    test_etag_inputs()
+    test_untracked_route()
+    test_auth_runs_before_not_modified()
+    test_wildcard_is_not_a_match()
+    print("All tests passed!")
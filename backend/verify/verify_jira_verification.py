@@ -0,0 +1,89 @@
+import sys
+import os
+import tempfile
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Isolated database file (the engines read DB_DIR at import)
+os.environ["DB_DIR"] = tempfile.mkdtemp(prefix="verify_jira_verification_")
+
+from backend.shared.database import Base, engine, SessionLocal
+import backend.main  # noqa: F401  (registers every model on Base)
+from backend.features.project.persistence.models import LarkModelTCG, TCGRemovedTickets, ticket_key
+from backend.features.sync.service.sync_service import sync_jira_verification
+from backend.verify.fake_jira import install_fake_jira
+
+Base.metadata.create_all(bind=engine)
+
+LOCAL_KEYS = {
+    "rec1": "TCG-1",     # exists
+    "rec2": "tcg-2",     # lowercase local key
+    "rec3": " TCG-3 ",   # whitespace-padded local key
+    "rec4": "OLD-4",     # moved in Jira to NEW-40
+    "rec5": "TCG-5",     # deleted in Jira
+    "rec6": "TCG-6",     # exists
+}
+
+def seed():
+    db = SessionLocal()
+    for record_id, key in LOCAL_KEYS.items():
+        db.add(LarkModelTCG(record_id=record_id, tcg_tickets=key, tcg_ticket_key=ticket_key(key),
+                            jira_status="Open", tp_number="TP-1"))
+    db.commit()
+    db.close()
+
+def test_only_confirmed_deletes():
+    print("Testing verification deletes only tickets Jira confirms as missing...")
+    install_fake_jira(
+        statuses={"TCG-1": "Open", "TCG-2": "In Progress", "TCG-3": "Resolved", "NEW-40": "In Review", "TCG-6": "Open"},
+        moved={"OLD-4": "NEW-40"},
+    )
+    sync_jira_verification()
+
+    db = SessionLocal()
+    rows = {t.record_id: t for t in db.query(LarkModelTCG)}
+    removed = {r.ticket_number for r in db.query(TCGRemovedTickets)}
+    db.close()
+    if set(rows) != {"rec1", "rec2", "rec3", "rec4", "rec6"} or removed != {"TCG-5"}:
+        print(f"FAIL: expected only TCG-5 deleted, got rows {sorted(rows)} removed {removed}")
+        sys.exit(1)
+    if rows["rec2"].jira_status != "In Progress" or rows["rec3"].jira_status != "Resolved":
+        print("FAIL: lowercase / padded keys not refreshed from Jira")
+        sys.exit(1)
+    moved = rows["rec4"]
+    if (moved.tcg_tickets, moved.tcg_ticket_key, moved.jira_status) != ("NEW-40", "NEW-40", "In Review"):
+        print(f"FAIL: moved issue not recorded under its new key: {moved.tcg_tickets} {moved.jira_status}")
+        sys.exit(1)
+    print("PASS")
+
+def test_failed_confirmation_keeps_ticket():
+    print("Testing a failed confirmation lookup keeps the ticket...")
+    db = SessionLocal()
+    db.add(LarkModelTCG(record_id="rec7", tcg_tickets="TCG-7", tcg_ticket_key="TCG-7", jira_status="Open"))
+    db.commit()
+    db.close()
+    # TCG-7 missing from the search, and jira.issue() errors for it (not a 404)
+    fake = install_fake_jira(statuses={"TCG-1": "Open", "TCG-2": "Open", "TCG-3": "Open",
+                                       "NEW-40": "Open", "TCG-6": "Open"})
+    original = fake.get_ticket
+    def flaky_get_ticket(ticket_number):
+        if ticket_number == "TCG-7":
+            raise RuntimeError("Simulated Jira 503")
+        return original(ticket_number)
+    fake.get_ticket = flaky_get_ticket
+    sync_jira_verification()
+
+    db = SessionLocal()
+    kept = db.query(LarkModelTCG).filter(LarkModelTCG.record_id == "rec7").count()
+    db.close()
+    if kept != 1:
+        print("FAIL: ticket deleted although its lookup failed")
+        sys.exit(1)
+    print("PASS")
+
+if __name__ == "__main__":
+    seed()
+    test_only_confirmed_deletes()
+    test_failed_confirmation_keeps_ticket()
+    print("All tests passed!")
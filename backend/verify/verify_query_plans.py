@@ -0,0 +1,176 @@
+"""
+EXPLAIN QUERY PLAN regression test for the hot queries.
+
+Runs the real code paths (ticket lookups, TP completion, anomaly refresh, member status,
+planning by program) on a small seeded database, captures every SELECT / UPDATE / DELETE
+they execute and fails if SQLite plans a full scan of a table for any of them.
+"""
+import sys
+import os
+import re
+import tempfile
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Isolated database file (the engines read DB_DIR at import)
+os.environ["DB_DIR"] = tempfile.mkdtemp(prefix="verify_query_plans_")
+
+from sqlalchemy import event, text
+from backend.shared.database import Base, engine, read_engine, SessionLocal
+import backend.main  # noqa: F401  (registers every model on Base)
+from backend.features.project.persistence.models import LarkModelTP, LarkModelTCG, LarkModelProgram
+from backend.features.member.persistence.models import LarkModelMember
+from backend.features.project.controller import project_controller
+from backend.features.project.service.anomaly_service import AnomalyService
+from backend.features.member.service.member_status_service import MemberStatusService
+from backend.features.sync.persistence.ticket_links import replace_ticket_links
+from backend.features.sync.persistence.ticket_people import replace_ticket_people
+from backend.features.sync.service.sync_service import calculate_tp_completion
+from backend.features.sync.service.field_mapping import get_mapping_plan
+from backend.features.sync.service.sync_service import _write_page
+from backend.scripts.db_migrations import migrate_hot_query_indexes, migrate_ticket_key_columns
+
+TABLES = set(Base.metadata.tables)
+SCAN_PATTERN = re.compile(r"^SCAN (\w+)")
+
+# Full scans that are expected, keyed by (hot path, table)
+ALLOWED_SCANS = set()
+
+captured = []
+
+def _capture(conn, cursor, statement, parameters, context, executemany):
+    if not executemany and statement.lstrip().split(" ", 1)[0].upper() in ("SELECT", "UPDATE", "DELETE"):
+        captured.append((statement, parameters))
+
+def seed():
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        for i in range(3):
+            db.add(LarkModelTP(record_id=f"tp{i}", ticket_number=f"TP-{i}", ticket_number_key=f"TP-{i}",
+                               title=f"Project {i}", jira_status="In Progress", department="WRD"))
+        db.add(LarkModelProgram(record_id="prog1", program_title="Program A", tp="TP-1"))
+        db.add(LarkModelMember(record_id="mem1", name="Alice", department="WRD"))
+        rows = []
+        for i in range(6):
+            row = {"record_id": f"rec{i}", "tcg_tickets": f"TCG-{i}", "tp_number": f"TP-{i % 3}",
+                   "tcg_ticket_key": f"TCG-{i}", "tp_number_key": f"TP-{i % 3}",
+                   "jira_status": "Open" if i % 2 else "In Progress", "issue_type": "Change Request",
+                   "assignee": "Alice", "resolved_by": "Alice", "title": f"Ticket {i}"}
+            db.add(LarkModelTCG(**row))
+            rows.append(row)
+        db.flush()
+        replace_ticket_links(db, {f"rec{i}": f"TCG-{i - 1}" for i in range(1, 6)})
+        replace_ticket_people(db, rows)
+        db.commit()
+    finally:
+        db.close()
+
+def hot_paths():
+    def with_session(fn):
+        db = SessionLocal()
+        try:
+            return fn(db)
+        finally:
+            db.close()
+
+    return [
+        ("tcg tickets by tp", lambda: project_controller.get_tcg_tickets_by_tp("tp-1")),
+        ("ticket details (tcg)", lambda: project_controller.get_ticket_details("tcg-1")),
+        ("ticket details (tp)", lambda: project_controller.get_ticket_details("TP-1")),
+        ("planning by program", lambda: project_controller.get_planning_projects(program="Program A")),
+        ("tp completion (all)", lambda: calculate_tp_completion()),
+        ("tp completion (affected)", lambda: calculate_tp_completion(tp_numbers=["TP-1"])),
+        ("refresh anomalies", lambda: with_session(lambda db: AnomalyService(db).refresh_anomalies())),
+        ("member status", lambda: with_session(lambda db: MemberStatusService(db).get_department_status("WRD"))),
+    ]
+
+def full_scans(statement, parameters):
+    with engine.connect() as conn:
+        plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    scans = []
+    for row in plan:
+        match = SCAN_PATTERN.match(row[3])
+        if match and match.group(1) in TABLES:
+            scans.append((match.group(1), row[3]))
+    return scans
+
+def test_migration_matches_models():
+    print("Testing index migration against the model definitions...")
+    declared = {ix.name for table in Base.metadata.tables.values() for ix in table.indexes}
+    from backend.scripts.db_migrations import HOT_QUERY_INDEXES
+    missing = [name for name, _, _ in HOT_QUERY_INDEXES if name not in declared]
+    if missing:
+        print(f"FAIL: migration indexes not declared on the models: {missing}")
+        sys.exit(1)
+    with engine.connect() as conn:
+        migrate_hot_query_indexes(conn)  # No-op on a create_all schema
+        conn.commit()
+    print("PASS")
+
+def test_hot_queries_use_indexes():
+    print("Testing hot query plans...")
+    event.listen(engine, "before_cursor_execute", _capture)
+    event.listen(read_engine, "before_cursor_execute", _capture)
+    failures = []
+    try:
+        for name, run in hot_paths():
+            captured.clear()
+            run()
+            statements = list(captured)
+            if not statements:
+                failures.append(f"{name}: no query captured")
+            for statement, parameters in statements:
+                for table, detail in full_scans(statement, parameters):
+                    if (name, table) not in ALLOWED_SCANS:
+                        failures.append(f"{name}: {detail}\n    {' '.join(statement.split())[:200]}")
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+        event.remove(read_engine, "before_cursor_execute", _capture)
+
+    if failures:
+        print("FAIL: full table scans in hot queries:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("PASS")
+
+def test_ticket_key_normalization():
+    print("Testing padded ticket numbers get the same key as lookups and Jira...")
+    db = SessionLocal()
+    _write_page(db, LarkModelTCG, [{"record_id": "recpad", "fields": {
+        "TCG Tickets": " tcg-777 ", "TP Number": "TP-1\t", "Updated Date": 1
+    }}], get_mapping_plan(LarkModelTCG), set())
+    db.commit()
+    row = db.query(LarkModelTCG).filter(LarkModelTCG.record_id == "recpad").first()
+    if (row.tcg_ticket_key, row.tp_number_key) != ("TCG-777", "TP-1"):
+        print(f"FAIL: padded values stored as {row.tcg_ticket_key!r} / {row.tp_number_key!r}")
+        sys.exit(1)
+    if not project_controller.get_ticket_details("tcg-777 "):
+        print("FAIL: /ticket lookup does not find the padded ticket")
+        sys.exit(1)
+
+    # Keys written by the old normalizer (upper() only) are rewritten by the migration
+    db.execute(text(
+        "UPDATE tcg_tickets SET tcg_ticket_key = UPPER(tcg_tickets), tp_number_key = '' WHERE record_id = 'recpad'"
+    ))
+    db.commit()
+    db.close()
+    with engine.connect() as conn:
+        migrate_ticket_key_columns(conn)
+        conn.commit()
+        keys = conn.execute(text(
+            "SELECT tcg_ticket_key, tp_number_key FROM tcg_tickets WHERE record_id = 'recpad'"
+        )).one()
+    if tuple(keys) != ("TCG-777", "TP-1"):
+        print(f"FAIL: migration left {tuple(keys)}")
+        sys.exit(1)
+    print("PASS")
+
+if __name__ == "__main__":
+    seed()
+    test_migration_matches_models()
+    test_hot_queries_use_indexes()
+    test_ticket_key_normalization()
+    print("All tests passed!")
@@ -0,0 +1,30 @@
+import sys
+import os
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from backend.shared.integration.rate_limiter import parse_rate_limits, TokenBucket
+
+def test_parse_rate_limits():
+    print("Testing RATE_LIMITS parsing...")
+    budgets = parse_rate_limits("lark.auth=5:3, jira.search=2.5, bad, jira.default=x")
+    if budgets != {"lark.auth": (5.0, 3), "jira.search": (2.5, 2)}:
+        print(f"FAIL: unexpected budgets {budgets}")
+        sys.exit(1)
+    print("PASS")
+
+def test_rejects_non_positive_budgets():
+    print("Testing zero / negative budgets are skipped...")
+    budgets = parse_rate_limits("a=0, b=-1, c=0:5, d=5:0, e=nan, ok=1")
+    if budgets != {"ok": (1.0, 1)}:
+        print(f"FAIL: non-positive budgets accepted: {budgets}")
+        sys.exit(1)
+    for name, (rate, burst) in budgets.items():
+        TokenBucket(name, rate, burst).acquire()  # Must not divide by zero
+    print("PASS")
+
+if __name__ == "__main__":
+    test_parse_rate_limits()
+    test_rejects_non_positive_budgets()
+    print("All tests passed!")
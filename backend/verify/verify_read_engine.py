@@ -0,0 +1,76 @@
+import sys
+import os
+import time
+import tempfile
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Isolated database file (the engines read DB_DIR at import)
+os.environ["DB_DIR"] = tempfile.mkdtemp(prefix="verify_read_engine_")
+
+from sqlalchemy import text
+from backend.shared.database import Base, engine, SessionLocal, ReadSessionLocal
+import backend.main  # noqa: F401  (registers every model on Base)
+from backend.features.project.persistence.models import LarkModelTP
+
+Base.metadata.create_all(bind=engine)
+
+def test_reads_committed_data():
+    print("Testing read-only session sees committed writes...")
+    db = SessionLocal()
+    db.add(LarkModelTP(record_id="rec1", ticket_number="TP-1", title="One", jira_status="In Progress"))
+    db.commit()
+    db.close()
+
+    rdb = ReadSessionLocal()
+    try:
+        count = rdb.query(LarkModelTP).count()
+        query_only = rdb.execute(text("PRAGMA query_only")).scalar()
+    finally:
+        rdb.close()
+    if count != 1 or query_only != 1:
+        print(f"FAIL: expected 1 row with query_only=1, got {count} / {query_only}")
+        sys.exit(1)
+    print("PASS")
+
+def test_read_does_not_wait_for_writer():
+    print("Testing reads during an open write transaction...")
+    writer = SessionLocal()
+    writer.add(LarkModelTP(record_id="rec2", ticket_number="TP-2", title="Two", jira_status="Open"))
+    writer.flush()  # Write lock held, not committed
+
+    rdb = ReadSessionLocal()
+    try:
+        started = time.perf_counter()
+        count = rdb.query(LarkModelTP).count()
+        elapsed = time.perf_counter() - started
+    finally:
+        rdb.close()
+        writer.rollback()
+        writer.close()
+    if count != 1 or elapsed > 0.5:
+        print(f"FAIL: read should see the last commit without waiting (count={count}, {elapsed:.2f}s)")
+        sys.exit(1)
+    print("PASS")
+
+def test_writes_rejected():
+    print("Testing read-only session rejects writes...")
+    rdb = ReadSessionLocal()
+    try:
+        rdb.add(LarkModelTP(record_id="rec3", ticket_number="TP-3"))
+        rdb.commit()
+    except Exception as e:
+        rdb.rollback()
+        print(f"PASS ({type(e).__name__})")
+        return
+    finally:
+        rdb.close()
+    print("FAIL: write through the read-only session succeeded")
+    sys.exit(1)
+
+if __name__ == "__main__":
+    test_reads_committed_data()
+    test_read_does_not_wait_for_writer()
+    test_writes_rejected()
+    print("All tests passed!")
@@ -0,0 +1,131 @@
+import sys
+import os
+import tempfile
+import subprocess
+from typing import Optional
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add project root to sys.path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+sys.path.append(PROJECT_ROOT)
+
+# Isolated database file (the engines read DB_DIR at import)
+os.environ["DB_DIR"] = tempfile.mkdtemp(prefix="verify_response_cache_")
+
+from backend.shared.database import Base, engine, SessionLocal
+import backend.main  # noqa: F401  (registers every model on Base)
+from backend.shared.response_cache import (
+    ResponseCache, cached_endpoint, bump_generation, response_cache, data_generations
+)
+
+Base.metadata.create_all(bind=engine)
+
+calls = {"planning": 0}
+
+app = FastAPI()
+
+@app.get("/planning")
+@cached_endpoint(tables=["tp_projects", "tp_program"])
+def planning(department: Optional[str] = None):
+    calls["planning"] += 1
+    return {"department": department, "version": calls["planning"]}
+
+client = TestClient(app)
+
+def bump(*tables):
+    db = SessionLocal()
+    try:
+        bump_generation(db, *tables)
+        db.commit()
+    finally:
+        db.close()
+
+def test_hit_and_miss():
+    print("Testing hit / miss per query parameters...")
+    first = client.get("/planning", params={"department": "WRD"}).json()
+    again = client.get("/planning", params={"department": "WRD"}).json()
+    other = client.get("/planning", params={"department": "PRD"}).json()
+    if first != again or calls["planning"] != 2:
+        print(f"FAIL: second identical request should be served from cache (calls={calls['planning']})")
+        sys.exit(1)
+    if other["department"] != "PRD":
+        print("FAIL: different query parameters must not share an entry")
+        sys.exit(1)
+    print("PASS")
+
+def test_generation_invalidation():
+    print("Testing invalidation by data generation...")
+    before = client.get("/planning", params={"department": "WRD"}).json()
+    bump("tcg_tickets")  # Unrelated table
+    unrelated = client.get("/planning", params={"department": "WRD"}).json()
+    if unrelated != before:
+        print("FAIL: a write to an unrelated table invalidated the entry")
+        sys.exit(1)
+    bump("tp_program")
+    after = client.get("/planning", params={"department": "WRD"}).json()
+    if after["version"] == before["version"]:
+        print("FAIL: entry was not invalidated after its table changed")
+        sys.exit(1)
+    print("PASS")
+
+def test_uncommitted_write_keeps_entry():
+    print("Testing a rolled back write does not invalidate...")
+    before = client.get("/planning", params={"department": "WRD"}).json()
+    db = SessionLocal()
+    bump_generation(db, "tp_program")
+    db.rollback()
+    db.close()
+    if client.get("/planning", params={"department": "WRD"}).json() != before:
+        print("FAIL: generation moved without a commit")
+        sys.exit(1)
+    print("PASS")
+
+def test_other_process_invalidates():
+    print("Testing a write committed by another process invalidates the entry...")
+    before = client.get("/planning", params={"department": "WRD"}).json()
+    script = (
+        "from backend.shared.database import SessionLocal\n"
+        "from backend.shared.response_cache import bump_generation\n"
+        "db = SessionLocal()\n"
+        "bump_generation(db, 'tp_projects')\n"
+        "db.commit()\n"
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=PROJECT_ROOT, env=os.environ, check=True)
+    after = client.get("/planning", params={"department": "WRD"}).json()
+    if after["version"] == before["version"]:
+        print("FAIL: entry survived a write from another process")
+        sys.exit(1)
+    print("PASS")
+
+def test_lru_eviction():
+    print("Testing LRU eviction...")
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", (0,), 1)
+    cache.put("b", (0,), 2)
+    cache.get("a", (0,))  # a becomes most recent
+    cache.put("c", (0,), 3)
+    if cache.get("b", (0,))[0] or not cache.get("a", (0,))[0] or cache.evictions != 1:
+        print(f"FAIL: expected 'b' evicted, got {cache.snapshot()}")
+        sys.exit(1)
+    print("PASS")
+
+def test_stats():
+    print("Testing stats...")
+    stats = response_cache.snapshot()
+    if stats["hits"] < 2 or stats["misses"] < 3 or "tp_program" not in stats["generations"]:
+        print(f"FAIL: unexpected stats {stats}")
+        sys.exit(1)
+    if data_generations.get(["tp_program", "tcg_tickets", "member_info"]) != (1, 1, 0):
+        print(f"FAIL: unexpected generations {data_generations.snapshot()}")
+        sys.exit(1)
+    print("PASS")
+
+if __name__ == "__main__":
+    test_hit_and_miss()
+    test_generation_invalidation()
+    test_uncommitted_write_keeps_entry()
+    test_other_process_invalidates()
+    test_lru_eviction()
+    test_stats()
+    print("All tests passed!")
@@ -0,0 +1,56 @@
+import sys
+import os
+import time
+import tempfile
+import threading
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Isolated database file (the engines read DB_DIR at import)
+os.environ["DB_DIR"] = tempfile.mkdtemp(prefix="verify_sync_pipeline_")
+
+from backend.shared.database import Base, engine, SessionLocal
+import backend.main  # noqa: F401  (registers every model on Base)
+from backend.features.project.persistence.models import LarkModelTCG
+from backend.features.sync.persistence.models import SyncState
+import backend.features.sync.service.sync_service as sync_service
+
+Base.metadata.create_all(bind=engine)
+
+def test_dead_fetcher_fails_sync():
+    print("Testing writer does not hang when the fetcher dies without an end marker...")
+    original = sync_service._fetch_pages
+
+    def dying_fetcher(app_token, table_id, filter_obj, pages, stop_event):
+        raise SystemExit  # Not caught by _fetch_pages' error handling: nothing is queued
+
+    sync_service._fetch_pages = dying_fetcher
+    result = {}
+    try:
+        worker = threading.Thread(
+            target=lambda: result.update(stats=sync_service.sync_lark_table(
+                "app", "tbl", LarkModelTCG, force_full=True, detect_anomalies=False
+            )),
+            daemon=True
+        )
+        started = time.perf_counter()
+        worker.start()
+        worker.join(timeout=10)
+    finally:
+        sync_service._fetch_pages = original
+
+    if worker.is_alive():
+        print("FAIL: sync_lark_table still blocked on the page queue")
+        sys.exit(1)
+    db = SessionLocal()
+    state = db.query(SyncState).filter(SyncState.table_name == LarkModelTCG.__tablename__).first()
+    db.close()
+    if result.get("stats") is not None or state.last_status != "failed":
+        print(f"FAIL: expected a failed sync, got {result} / {state.last_status}")
+        sys.exit(1)
+    print(f"PASS ({time.perf_counter() - started:.1f}s)")
+
+if __name__ == "__main__":
+    test_dead_fetcher_fails_sync()
+    print("All tests passed!")
@@ -0,0 +1,177 @@
+import sys
+import os
+import tempfile
+
+# Add project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Isolated database file (the engines read DB_DIR at import)
+os.environ["DB_DIR"] = tempfile.mkdtemp(prefix="verify_ticket_search_")
+
+from sqlalchemy import text
+from fastapi.testclient import TestClient
+from backend.shared.database import Base, engine, SessionLocal, ReadSessionLocal
+import backend.main  # noqa: F401  (registers every model on Base)
+from backend.features.auth.persistence.models import AdminUser, Role
+from backend.shared.dependencies import get_current_user
+from backend.features.project.persistence.models import LarkModelTP, LarkModelTCG
+from backend.features.project.service.ticket_search_service import TicketSearchService
+from backend.features.sync.persistence.ticket_search import delete_ticket_search
+from backend.features.sync.service.field_mapping import get_mapping_plan
+from backend.features.sync.service.sync_service import _write_page
+from backend.scripts.db_migrations import migrate_ticket_search
+
+Base.metadata.create_all(bind=engine)
+
+def tcg(record_id, key, title, description=None, assignee="Alice", updated=1):
+    fields = {
+        "TCG Tickets": [{"text": key, "type": "text"}],
+        "Title": [{"text": title, "type": "text"}],
+        "Jira Status": "Open",
+        "Assignee": [{"name": assignee}],
+        "Components": ["Backend"],
+        "Updated Date": updated,
+    }
+    if description is not None:
+        fields["Description"] = [{"text": description, "type": "text"}]
+    return {"record_id": record_id, "fields": fields}
+
+def write(model_class, records):
+    db = SessionLocal()
+    try:
+        _write_page(db, model_class, records, get_mapping_plan(model_class), set())
+        db.commit()
+    finally:
+        db.close()
+
+def search(q, page=1, page_size=20):
+    db = ReadSessionLocal()
+    try:
+        return TicketSearchService(db).search(q, page, page_size)
+    finally:
+        db.close()
+
+def keys(result):
+    return [item["ticket_number"] for item in result["data"]]
+
+def test_sync_indexes_tickets():
+    print("Testing sync pages are indexed (substring, case-insensitive, highlighted)...")
+    write(LarkModelTCG, [
+        tcg("rec1", "TCG-1001", "Login <button> times out", "Users see a timeout after 30s on the login page"),
+        tcg("rec2", "TCG-1002", "Export report", "The login timeout setting is ignored by export"),
+        tcg("rec3", "TCG-1003", "Dark mode colors", "Contrast issue", assignee="Timothy"),
+    ])
+    write(LarkModelTP, [{"record_id": "tp1", "fields": {
+        "Ticket Number": [{"text": "TP-77", "type": "text"}],
+        "Title": [{"text": "Login revamp", "type": "text"}],
+        "Project Manager": [{"name": "Bob"}],
+        "Jira Status": "In Progress",
+        "Updated Date": 1,
+    }}])
+
+    result = search("LOGIN")
+    if sorted(keys(result)) != ["TCG-1001", "TCG-1002", "TP-77"] or result["total"] != 3:
+        print(f"FAIL: unexpected results for 'LOGIN': {keys(result)}")
+        sys.exit(1)
+    if keys(search("tcg-100")) == [] or keys(search("imoth")) != ["TCG-1003"]:
+        print("FAIL: key / assignee substring search")
+        sys.exit(1)
+    first = next(item for item in result["data"] if item["ticket_number"] == "TCG-1001")
+    if first["title"] != "<mark>Login</mark> &lt;button&gt; times out" or "<mark>login</mark>" not in first["snippet"]:
+        print(f"FAIL: highlight not escaped / marked: {first}")
+        sys.exit(1)
+    if first["status"] != "Open" or first["assignee"] != "Alice" or first["kind"] != "TCG":
+        print(f"FAIL: ticket details missing: {first}")
+        sys.exit(1)
+    print("PASS")
+
+def test_ranking_and_pagination():
+    print("Testing ranking (title over description) and pagination...")
+    # Both match 'login timeout'; TCG-1001 has it in the title, TCG-1002 only in the description
+    if keys(search("login timeout")) != ["TCG-1001", "TCG-1002"]:
+        print(f"FAIL: expected title match first, got {keys(search('login timeout'))}")
+        sys.exit(1)
+    pages = [keys(search("login", page, 1)) for page in (1, 2, 3, 4)]
+    if [len(p) for p in pages] != [1, 1, 1, 0] or len({k for p in pages for k in p}) != 3:
+        print(f"FAIL: pages overlap or miss results: {pages}")
+        sys.exit(1)
+    print("PASS")
+
+def test_updates_and_deletes():
+    print("Testing re-synced and deleted tickets...")
+    # Changed title; Description cleared in Lark (the field is absent from the payload)
+    write(LarkModelTCG, [tcg("rec3", "TCG-1003", "High contrast theme", assignee="Timothy", updated=2)])
+    if keys(search("dark mode")) or keys(search("contrast theme")) != ["TCG-1003"]:
+        print("FAIL: index not refreshed from the new title")
+        sys.exit(1)
+    if keys(search("Contrast issue")):
+        print("FAIL: cleared description still indexed")
+        sys.exit(1)
+
+    db = SessionLocal()
+    db.query(LarkModelTCG).filter(LarkModelTCG.record_id == "rec2").delete(synchronize_session=False)
+    delete_ticket_search(db, LarkModelTCG, ["rec2"])
+    db.commit()
+    db.close()
+    if "TCG-1002" in keys(search("timeout")):
+        print("FAIL: deleted ticket still searchable")
+        sys.exit(1)
+    print("PASS")
+
+def test_query_syntax_is_literal():
+    print("Testing FTS5 syntax in user input...")
+    for q in ['"login', 'login OR', 'NEAR(login', 'log* -x', "a'b; DROP", "  "]:
+        search(q)  # Must not raise
+    if search("ab")["total"] != 0 or keys(search("login ab")) != keys(search("login")):
+        print("FAIL: terms under 3 characters should be ignored")
+        sys.exit(1)
+    print("PASS")
+
+def test_migration_backfill():
+    print("Testing backfill migration on an unindexed database...")
+    before = keys(search("login"))
+    with engine.connect() as conn:
+        conn.execute(text("DROP TABLE ticket_search"))
+        conn.execute(text("DELETE FROM ticket_search_docs"))
+        migrate_ticket_search(conn)
+        conn.commit()
+    if keys(search("login")) != before:
+        print(f"FAIL: backfilled index differs: {keys(search('login'))} != {before}")
+        sys.exit(1)
+    print("PASS")
+
+def test_search_requires_permission():
+    print("Testing /api/project/search is guarded by TICKET_SEARCH (before the ETag check)...")
+    client = TestClient(backend.main.app)
+    headers = {"Authorization": "Bearer token"}
+    users = {
+        "admin": AdminUser(username="admin", role_obj=Role(name="SUPER_ADMIN")),
+        "user": AdminUser(username="user", role_obj=Role(name="USER")),  # no page permissions
+    }
+    current = {}
+    backend.main.app.dependency_overrides[get_current_user] = lambda: users[current["name"]]
+    try:
+        current["name"] = "admin"
+        allowed = client.get("/api/project/search", params={"q": "login"}, headers=headers)
+        current["name"] = "user"
+        denied = client.get("/api/project/search", params={"q": "login"}, headers=headers)
+        revalidated = client.get("/api/project/search", params={"q": "login"},
+                                 headers={**headers, "If-None-Match": allowed.headers.get("etag", "")})
+    finally:
+        backend.main.app.dependency_overrides.pop(get_current_user)
+    if allowed.status_code != 200 or not allowed.json()["data"]:
+        print(f"FAIL: SUPER_ADMIN expected results, got {allowed.status_code}")
+        sys.exit(1)
+    if denied.status_code != 403 or revalidated.status_code != 403:
+        print(f"FAIL: expected 403 without TICKET_SEARCH, got {denied.status_code} / {revalidated.status_code}")
+        sys.exit(1)
+    print("PASS")
+
+if __name__ == "__main__":
+    test_sync_indexes_tickets()
+    test_ranking_and_pagination()
+    test_updates_and_deletes()
+    test_query_syntax_is_literal()
+    test_migration_backfill()
+    test_search_requires_permission()
+    print("All tests passed!")